@@ -0,0 +1,71 @@
+"""Compare session.add_all() with bulk_insert() and bulk_upsert() for DataclassBase models.
+
+Each strategy loads the same rows into a fresh SQLite database file.
+
+Usage:
+    python benchmarks/bulk_insert.py --rows 1000000
+"""
+
+import argparse
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Mapped, Session, mapped_column
+
+from brussels.base import DataclassBase
+from brussels.bulk import bulk_insert, bulk_upsert
+from brussels.mixins import PrimaryKeyMixin, TimestampMixin
+
+COLUMNS = ("source", "sequence")
+
+
+class IngestedEvent(DataclassBase, PrimaryKeyMixin, TimestampMixin):
+    __tablename__ = "ingested_events"
+
+    source: Mapped[str] = mapped_column()
+    sequence: Mapped[int] = mapped_column(unique=True)
+
+
+def _add_all(session: Session, rows: int) -> None:
+    session.add_all(IngestedEvent(source=f"source-{index % 16}", sequence=index) for index in range(rows))
+
+
+def _bulk_insert(session: Session, rows: int) -> None:
+    bulk_insert(session, IngestedEvent, ((f"source-{index % 16}", index) for index in range(rows)), columns=COLUMNS)
+
+
+def _bulk_upsert(session: Session, rows: int) -> None:
+    values = ((f"source-{index % 16}", index) for index in range(rows))
+    bulk_upsert(session, IngestedEvent, values, columns=COLUMNS, conflict=("sequence",))
+
+
+def _measure(load: Callable[[Session, int], None], rows: int, directory: Path) -> float:
+    engine = create_engine(f"sqlite:///{directory / f'{load.__name__}.db'}")
+    DataclassBase.metadata.create_all(engine)
+    with Session(engine) as session:
+        started = time.perf_counter()
+        load(session, rows)
+        session.commit()
+        elapsed = time.perf_counter() - started
+        assert session.scalar(select(func.count()).select_from(IngestedEvent)) == rows  # noqa: S101
+    engine.dispose()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"{args.rows} rows")
+    with tempfile.TemporaryDirectory() as directory:
+        for name, load in (("session.add_all", _add_all), ("bulk_insert", _bulk_insert), ("bulk_upsert", _bulk_upsert)):
+            elapsed = _measure(load, args.rows, Path(directory))
+            print(f"  {name:16s} {elapsed:7.2f} s  {args.rows / elapsed:9.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
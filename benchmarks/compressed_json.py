@@ -0,0 +1,76 @@
+"""Compare stored size and throughput of Json and CompressedJson for large documents.
+
+Usage:
+    python benchmarks/compressed_json.py --rows 200 --size-kb 50 500
+"""
+
+import argparse
+import time
+from typing import Any
+
+from sqlalchemy.dialects.sqlite import dialect as sqlite_dialect
+from sqlalchemy.types import TypeEngine
+
+from brussels.types import CompressedJson, Json
+
+
+def _document(size_kb: int) -> dict[str, Any]:
+    record_count = size_kb * 1024 // 64
+    kinds = ("click", "view", "purchase")
+    return {
+        "events": [
+            {"id": index, "kind": kinds[index % 3], "user": f"user-{index % 97}", "value": index}
+            for index in range(record_count)
+        ],
+    }
+
+
+def _measure(column_type: TypeEngine[Any], document: dict[str, Any], rows: int) -> tuple[float, float, float]:
+    dialect = sqlite_dialect()
+    impl = column_type.dialect_impl(dialect)
+    bind = impl.bind_processor(dialect)
+    result = impl.result_processor(dialect, None)
+    assert bind is not None  # noqa: S101
+    assert result is not None  # noqa: S101
+
+    started = time.perf_counter()
+    stored = [bind(document) for _ in range(rows)]
+    bind_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for value in stored:
+        result(value)
+    result_elapsed = time.perf_counter() - started
+    return len(stored[0]) / 1024, rows / bind_elapsed, rows / result_elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--size-kb", type=int, nargs="+", default=[50, 500])
+    args = parser.parse_args()
+
+    variants: dict[str, TypeEngine[Any]] = {
+        "Json": Json,
+        "CompressedJson zlib": CompressedJson(algorithm="zlib"),
+        "CompressedJson zlib 1": CompressedJson(algorithm="zlib", level=1),
+    }
+    try:
+        variants["CompressedJson zstd"] = CompressedJson(algorithm="zstd")
+    except ModuleNotFoundError:
+        print("zstd is not available, skipping")
+
+    for size_kb in args.size_kb:
+        document = _document(size_kb)
+        rows = max(1, args.rows * 50 // size_kb)
+        print(f"~{size_kb} KB document, {rows} rows")
+        for name, column_type in variants.items():
+            stored_kb, bind_rate, result_rate = _measure(column_type, document, rows)
+            print(
+                f"  {name:22s} {stored_kb:8.1f} KB stored  "
+                f"bind {bind_rate:8.0f} rows/s  result {result_rate:8.0f} rows/s",
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Measure the per-row cost of DateTimeUTC result and bind processing.
+
+"before" is the generic TypeDecorator path (process_result_value on every row,
+always calling astimezone()); "after" is the processor DateTimeUTC builds for
+the dialect. Rows are processed in memory, so the numbers are the type's own
+overhead without any driver or network time.
+
+Usage:
+    python benchmarks/datetime_utc.py --rows 1000000
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy.dialects.postgresql.asyncpg import dialect as asyncpg_dialect
+from sqlalchemy.dialects.postgresql.psycopg import dialect as psycopg_dialect
+from sqlalchemy.dialects.sqlite import dialect as sqlite_dialect
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator
+
+from brussels.types import DateTimeUTC
+
+
+class LegacyDateTimeUTC(DateTimeUTC):
+    """DateTimeUTC as it was before the dialect-specific processors."""
+
+    cache_ok = True
+
+    def process_bind_param(self, value: datetime | None, _dialect: Any) -> datetime | None:  # type: ignore[override]  # noqa: ANN401
+        if value is None:
+            return None
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=UTC)
+        return value.astimezone(UTC)
+
+    def process_result_value(self, value: Any, _dialect: Any) -> datetime | None:  # type: ignore[override]  # noqa: ANN401
+        if value is None:
+            return None
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=UTC)
+        return value.astimezone(UTC)
+
+    def bind_processor(self, dialect: Dialect) -> Callable[[Any], Any] | None:
+        return TypeDecorator.bind_processor(self, dialect)
+
+    def result_processor(self, dialect: Dialect, coltype: object) -> Callable[[Any], Any] | None:
+        return TypeDecorator.result_processor(self, dialect, coltype)
+
+
+def _rows(count: int, *, aware: bool) -> list[datetime]:
+    start = datetime(2024, 1, 1, tzinfo=UTC if aware else None)
+    return [start + timedelta(seconds=index) for index in range(count)]
+
+
+def _time(processor: Callable[[Any], Any] | None, values: list[Any]) -> float:
+    started = time.perf_counter()
+    if processor is not None:
+        for value in values:
+            processor(value)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    aware = _rows(args.rows, aware=True)
+    naive = _rows(args.rows, aware=False)
+    sqlite = sqlite_dialect()
+    sqlite_strings = [str(value) for value in naive]
+
+    # (label, dialect, result values)
+    scenarios: list[tuple[str, Dialect, list[Any]]] = [
+        ("asyncpg, aware UTC", asyncpg_dialect(), aware),
+        ("psycopg, UTC session", psycopg_dialect(), aware),
+        ("psycopg, naive values", psycopg_dialect(), naive),
+        ("sqlite, stored strings", sqlite, sqlite_strings),
+    ]
+
+    print(f"{args.rows} rows, ns per row (before -> after)")
+    for label, dialect, values in scenarios:
+        before_type = LegacyDateTimeUTC().dialect_impl(dialect)
+        after_type = DateTimeUTC().dialect_impl(dialect)
+        before = _time(before_type.result_processor(dialect, None), values)
+        after = _time(after_type.result_processor(dialect, None), values)
+        print(f"  result {label:24s} {before * 1e9 / args.rows:7.1f} -> {after * 1e9 / args.rows:7.1f}")
+
+    for label, dialect in (("psycopg", psycopg_dialect()), ("sqlite", sqlite)):
+        before_type = LegacyDateTimeUTC().dialect_impl(dialect)
+        after_type = DateTimeUTC().dialect_impl(dialect)
+        before = _time(before_type.bind_processor(dialect), aware)
+        after = _time(after_type.bind_processor(dialect), aware)
+        print(f"  bind   {label + ', aware UTC':24s} {before * 1e9 / args.rows:7.1f} -> {after * 1e9 / args.rows:7.1f}")
+
+
+if __name__ == "__main__":
+    main()
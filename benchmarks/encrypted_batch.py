@@ -0,0 +1,40 @@
+"""Compare per-row and thread-pooled batch decryption of EncryptedString values.
+
+Usage:
+    python benchmarks/encrypted_batch.py --rows 100000 --workers 1 2 4 8
+"""
+
+import argparse
+import time
+
+from cryptography.fernet import Fernet
+
+from brussels.types import EncryptedString
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--chunk-size", type=int, default=256)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    encrypted = EncryptedString(key=Fernet.generate_key())
+    ciphertexts = [encrypted.process_bind_param(f"secret-value-{index}", None) for index in range(args.rows)]
+
+    started = time.perf_counter()
+    expected = [encrypted.process_result_value(ciphertext, None) for ciphertext in ciphertexts]
+    baseline = time.perf_counter() - started
+    print(f"{args.rows} rows")
+    print(f"per-row:           {args.rows / baseline:10.0f} rows/s")
+
+    for workers in args.workers:
+        started = time.perf_counter()
+        decrypted = encrypted.decrypt_many(ciphertexts, chunk_size=args.chunk_size, max_workers=workers)
+        elapsed = time.perf_counter() - started
+        assert decrypted == expected  # noqa: S101
+        print(f"batch {workers:2d} workers: {args.rows / elapsed:10.0f} rows/s ({baseline / elapsed:4.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
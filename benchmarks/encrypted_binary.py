@@ -0,0 +1,50 @@
+"""Compare storage size and throughput of EncryptedString and EncryptedBinaryString.
+
+Usage:
+    python benchmarks/encrypted_binary.py --rows 50000 --length 32
+"""
+
+import argparse
+import time
+
+from cryptography.fernet import Fernet
+
+from brussels.types import EncryptedBinaryString, EncryptedString
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--length", type=int, default=32)
+    args = parser.parse_args()
+
+    key = Fernet.generate_key()
+    variants: dict[str, EncryptedString] = {
+        "text fernet": EncryptedString(key=key),
+        "binary fernet": EncryptedBinaryString(key=key, algorithm="fernet"),
+        "binary aes-gcm": EncryptedBinaryString(key=key, algorithm="aes-gcm"),
+        "binary chacha20": EncryptedBinaryString(key=key, algorithm="chacha20-poly1305"),
+    }
+    plaintexts = [f"{index:0{args.length}d}" for index in range(args.rows)]
+
+    print(f"{args.rows} rows of {args.length} characters")
+    for name, encrypted in variants.items():
+        started = time.perf_counter()
+        ciphertexts = [encrypted.process_bind_param(value, None) for value in plaintexts]
+        encrypt_elapsed = time.perf_counter() - started
+
+        started = time.perf_counter()
+        decrypted = [encrypted.process_result_value(value, None) for value in ciphertexts]
+        decrypt_elapsed = time.perf_counter() - started
+        assert decrypted == plaintexts  # noqa: S101
+
+        size = sum(len(value or "") for value in ciphertexts) / args.rows
+        print(
+            f"{name:16s} {size:6.1f} bytes/row "
+            f"encrypt {args.rows / encrypt_elapsed:9.0f} rows/s "
+            f"decrypt {args.rows / decrypt_elapsed:9.0f} rows/s",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Compare engine presets with plain create_engine() on SQLite and aiosqlite.
+
+Two workloads run against a fresh database file per engine: many short
+transactions that insert and read back one row (a web request), and one
+bulk_insert() of many rows (a batch import). The async run needs aiosqlite.
+
+Usage:
+    python benchmarks/engine_presets.py --transactions 5000 --rows 200000
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+
+from sqlalchemy import Engine, create_engine, select
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Mapped, Session, mapped_column, sessionmaker
+
+from brussels.base import Base
+from brussels.bulk import bulk_insert
+from brussels.engine import async_engine_from_preset, engine_from_preset
+
+PRESETS = ("web", "worker", "batch", "test")
+
+
+class PresetEvent(Base):
+    __tablename__ = "preset_events"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    source: Mapped[str] = mapped_column()
+
+
+def _transactions(engine: Engine, count: int) -> float:
+    session_local = sessionmaker(engine)
+    started = time.perf_counter()
+    for index in range(count):
+        with session_local.begin() as session:
+            session.add(PresetEvent(id=index, source="request"))
+            session.flush()
+            session.scalar(select(PresetEvent.source).where(PresetEvent.id == index))
+    return time.perf_counter() - started
+
+
+def _bulk(engine: Engine, rows: int) -> float:
+    started = time.perf_counter()
+    with Session(engine) as session:
+        bulk_insert(session, PresetEvent, ((index, "import") for index in range(rows)), columns=("id", "source"))
+        session.commit()
+    return time.perf_counter() - started
+
+
+async def _async_transactions(engine: AsyncEngine, count: int) -> float:
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all, tables=[PresetEvent.__table__])
+    session_local = async_sessionmaker(engine, expire_on_commit=False)
+    started = time.perf_counter()
+    for index in range(count):
+        async with session_local.begin() as session:
+            session.add(PresetEvent(id=index, source="request"))
+            await session.flush()
+            await session.scalar(select(PresetEvent.source).where(PresetEvent.id == index))
+    elapsed = time.perf_counter() - started
+    await engine.dispose()
+    return elapsed
+
+
+def _sync(directory: Path, make: Callable[[str], Engine], name: str, transactions: int, rows: int) -> None:
+    results = []
+    for workload, count in ((_transactions, transactions), (_bulk, rows)):
+        engine = make(f"sqlite:///{directory / f'{name}_{workload.__name__}.db'}")
+        Base.metadata.create_all(engine, tables=[PresetEvent.__table__])
+        results.append((count, workload(engine, count)))
+        engine.dispose()
+    (commits, commit_time), (inserted, insert_time) = results
+    print(f"  {name:10s} {commits / commit_time:9.0f} tx/s  {inserted / insert_time:9.0f} rows/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--transactions", type=int, default=5000)
+    parser.add_argument("--rows", type=int, default=200_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory)
+        print(f"sqlite: {args.transactions} transactions, bulk_insert of {args.rows} rows")
+        _sync(path, create_engine, "default", args.transactions, args.rows)
+        for preset in PRESETS:
+            _sync(path, partial(engine_from_preset, preset=preset), preset, args.transactions, args.rows)
+
+        print(f"aiosqlite: {args.transactions} transactions")
+        async_engines: list[tuple[str, Callable[[str], AsyncEngine]]] = [("default", create_async_engine)]
+        async_engines += [(preset, partial(async_engine_from_preset, preset=preset)) for preset in PRESETS]
+        for name, make_async in async_engines:
+            engine = make_async(f"sqlite+aiosqlite:///{path / f'async_{name}.db'}")
+            elapsed = asyncio.run(_async_transactions(engine, args.transactions))
+            print(f"  {name:10s} {args.transactions / elapsed:9.0f} tx/s")
+
+
+if __name__ == "__main__":
+    main()
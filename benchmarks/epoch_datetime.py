@@ -0,0 +1,78 @@
+"""Compare DateTimeUTC (ISO strings on SQLite) with EpochDateTimeUTC (BIGINT microseconds).
+
+Each variant gets an in-memory SQLite table with an indexed timestamp column;
+the benchmark times a bulk insert, a full load and a batch of range scans.
+
+Usage:
+    python benchmarks/epoch_datetime.py --rows 200000 --scans 2000
+"""
+
+import argparse
+import time
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import Column, Engine, Integer, MetaData, Table, create_engine, insert, select
+from sqlalchemy.types import TypeEngine
+
+from brussels.types import DateTimeUTC, EpochDateTimeUTC
+
+START = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def _table(column_type: TypeEngine[Any]) -> tuple[Engine, Table]:
+    engine = create_engine("sqlite:///:memory:")
+    table = Table(
+        "events",
+        MetaData(),
+        Column("id", Integer, primary_key=True),
+        Column("created_at", column_type, index=True, nullable=False),
+    )
+    table.metadata.create_all(engine)
+    return engine, table
+
+
+def _measure(column_type: TypeEngine[Any], rows: int, scans: int) -> tuple[float, float, float]:
+    engine, table = _table(column_type)
+    values = [{"created_at": START + timedelta(seconds=index)} for index in range(rows)]
+
+    with engine.begin() as connection:
+        started = time.perf_counter()
+        connection.execute(insert(table), values)
+        insert_elapsed = time.perf_counter() - started
+
+        started = time.perf_counter()
+        connection.execute(select(table.c.created_at)).scalars().all()
+        load_elapsed = time.perf_counter() - started
+
+        window = timedelta(seconds=max(1, rows // 1000))
+        step = timedelta(seconds=rows // max(1, scans))
+        started = time.perf_counter()
+        for scan in range(scans):
+            lower = START + step * scan
+            statement = select(table.c.id).where(table.c.created_at.between(lower, lower + window))
+            connection.execute(statement).scalars().all()
+        scan_elapsed = time.perf_counter() - started
+
+    engine.dispose()
+    return rows / insert_elapsed, rows / load_elapsed, scans / scan_elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--scans", type=int, default=2000)
+    args = parser.parse_args()
+
+    variants: dict[str, TypeEngine[Any]] = {"DateTimeUTC": DateTimeUTC(), "EpochDateTimeUTC": EpochDateTimeUTC()}
+    print(f"{args.rows} rows, {args.scans} range scans of ~{max(1, args.rows // 1000)} rows")
+    for name, column_type in variants.items():
+        insert_rate, load_rate, scan_rate = _measure(column_type, args.rows, args.scans)
+        print(
+            f"  {name:18s} insert {insert_rate:9.0f} rows/s  "
+            f"load {load_rate:9.0f} rows/s  range scan {scan_rate:7.0f} scans/s",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Compare exporting a table through ORM instances with the streaming export_model().
+
+The ORM baseline loads every row with session.scalars(select(Model)).all()
+before serializing it to NDJSON; export_model() streams batches instead. Peak
+memory is traced with tracemalloc, so run it at two sizes to see the
+streaming peak stay flat while the baseline grows with the table.
+
+Usage:
+    python benchmarks/export.py --rows 100000 500000 --formats ndjson csv arrow
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import Engine, create_engine, select
+from sqlalchemy.orm import Mapped, Session, mapped_column
+
+from brussels.base import Base
+from brussels.bulk import bulk_insert
+from brussels.export import export_model
+from brussels.types import DateTimeUTC, Json
+
+START = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+class ExportedEvent(Base):
+    __tablename__ = "exported_events"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    source: Mapped[str] = mapped_column()
+    recorded_at: Mapped[datetime] = mapped_column(DateTimeUTC)
+    payload: Mapped[dict[str, Any]] = mapped_column(Json)
+
+
+def _orm_ndjson(engine: Engine) -> None:
+    with Session(engine) as session, Path(os.devnull).open("w") as sink:
+        for event in session.scalars(select(ExportedEvent)).all():
+            record = {
+                "id": event.id,
+                "source": event.source,
+                "recorded_at": event.recorded_at.isoformat(),
+                "payload": event.payload,
+            }
+            sink.write(json.dumps(record) + "\n")
+
+
+def _exporter(file_format: str) -> Callable[[Engine], None]:
+    def export(engine: Engine) -> None:
+        with Path(os.devnull).open("wb" if file_format == "arrow" else "w") as sink:
+            export_model(engine, ExportedEvent, sink, file_format=file_format)  # type: ignore[arg-type]
+
+    return export
+
+
+def _measure(run: Callable[[Engine], None], engine: Engine) -> tuple[float, float]:
+    started = time.perf_counter()
+    run(engine)
+    elapsed = time.perf_counter() - started
+    # Tracing slows allocation-heavy code down, so peak memory is taken from a second run.
+    tracemalloc.start()
+    run(engine)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1024 / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 500_000])
+    parser.add_argument("--formats", nargs="+", choices=("ndjson", "csv", "arrow"), default=["ndjson", "csv"])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        for rows in args.rows:
+            engine = create_engine(f"sqlite:///{Path(directory) / f'export_{rows}.db'}")
+            Base.metadata.create_all(engine)
+            with engine.begin() as connection:
+                values = (
+                    (index, f"source-{index % 16}", START + timedelta(seconds=index), {"index": index, "ok": True})
+                    for index in range(rows)
+                )
+                bulk_insert(connection, ExportedEvent, values, columns=("id", "source", "recorded_at", "payload"))
+
+            print(f"{rows} rows")
+            runs = [("orm .all()", _orm_ndjson)] + [(f"export {name}", _exporter(name)) for name in args.formats]
+            for name, run in runs:
+                elapsed, peak = _measure(run, engine)
+                print(f"  {name:16s} {elapsed:7.2f} s  {rows / elapsed:9.0f} rows/s  peak {peak:8.1f} MiB")
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
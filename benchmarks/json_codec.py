@@ -0,0 +1,76 @@
+"""Compare JSON column bind/result processing across the installed codecs.
+
+Usage:
+    python benchmarks/json_codec.py --rows 20000
+
+Runs the SQLite bind and result processors (text storage) for a small
+document (a typical settings blob) and a large one (a list of nested records),
+for the default Json type and json_type() with every codec that is installed.
+"""
+
+import argparse
+import time
+from typing import Any
+
+from sqlalchemy.dialects.sqlite import dialect as sqlite_dialect
+from sqlalchemy.types import TypeEngine
+
+from brussels.types import Json, json_codec, json_type
+
+SMALL_DOCUMENT: dict[str, Any] = {"theme": "dark", "notifications": {"email": True, "sms": False}, "limit": 25}
+LARGE_DOCUMENT: dict[str, Any] = {
+    "items": [
+        {
+            "id": index,
+            "name": f"item-{index}",
+            "price": index * 1.25,
+            "tags": ["alpha", "beta", "gamma"],
+            "attributes": {"color": "red", "size": index % 5, "active": index % 2 == 0},
+        }
+        for index in range(200)
+    ],
+}
+
+
+def _measure(column_type: TypeEngine[Any], document: dict[str, Any], rows: int) -> tuple[float, float]:
+    dialect = sqlite_dialect()
+    impl = column_type.dialect_impl(dialect)
+    bind = impl.bind_processor(dialect)
+    result = impl.result_processor(dialect, None)
+    assert bind is not None  # noqa: S101
+    assert result is not None  # noqa: S101
+
+    started = time.perf_counter()
+    serialized = [bind(document) for _ in range(rows)]
+    bind_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for value in serialized:
+        result(value)
+    result_elapsed = time.perf_counter() - started
+    return rows / bind_elapsed, rows / result_elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=20_000)
+    args = parser.parse_args()
+
+    variants: dict[str, TypeEngine[Any]] = {"Json (stdlib)": Json}
+    for name in ("json", "orjson", "msgspec"):
+        try:
+            json_codec(name)
+        except ModuleNotFoundError:
+            print(f"{name} is not installed, skipping")
+            continue
+        variants[f"json_type({name!r})"] = json_type(name)
+
+    for label, document, rows in (("small", SMALL_DOCUMENT, args.rows), ("large", LARGE_DOCUMENT, args.rows // 100)):
+        print(f"{label} document, {rows} rows")
+        for name, column_type in variants.items():
+            bind_rate, result_rate = _measure(column_type, document, rows)
+            print(f"  {name:22s} bind {bind_rate:10.0f} rows/s  result {result_rate:10.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
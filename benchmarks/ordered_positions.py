@@ -0,0 +1,123 @@
+"""Compare head inserts for dense OrderedMixin and SparseOrderedMixin on SQLite.
+
+Usage:
+    python benchmarks/ordered_positions.py --items 50000 --inserts 20
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from uuid import UUID, uuid4
+
+from sqlalchemy import Engine, ForeignKey, create_engine, event, insert, select
+from sqlalchemy.ext.orderinglist import ordering_list
+from sqlalchemy.orm import Mapped, Session, mapped_column, relationship
+
+from brussels.base import DataclassBase
+from brussels.mixins import OrderedMixin, PrimaryKeyMixin, SparseOrderedMixin
+from brussels.mixins.ordered import POSITION_GAP
+
+
+class BenchList(DataclassBase, PrimaryKeyMixin):
+    name: Mapped[str] = mapped_column()
+    dense_items: Mapped[list["DenseBenchItem"]] = relationship(
+        order_by="DenseBenchItem.position",
+        collection_class=ordering_list("position"),
+        default_factory=list,
+    )
+
+
+class DenseBenchItem(DataclassBase, PrimaryKeyMixin, OrderedMixin):
+    list_id: Mapped[UUID] = mapped_column(ForeignKey("bench_list.id"))
+    name: Mapped[str] = mapped_column()
+
+
+class SparseBenchItem(DataclassBase, PrimaryKeyMixin, SparseOrderedMixin):
+    __ordering_scope__ = ("list_id",)
+
+    list_id: Mapped[UUID] = mapped_column(ForeignKey("bench_list.id"))
+    name: Mapped[str] = mapped_column()
+
+
+def count_updated_rows(engine: Engine) -> Callable[[], int]:
+    updated = [0]
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _count(_conn, cursor, statement, _parameters, _context, _executemany) -> None:  # noqa: ANN001
+        if statement.startswith("UPDATE"):
+            updated[0] += max(cursor.rowcount, 0)
+
+    def reset() -> int:
+        value, updated[0] = updated[0], 0
+        return value
+
+    return reset
+
+
+def seed(engine: Engine, items: int) -> UUID:
+    with Session(engine) as session:
+        bench_list = BenchList(name="bench")
+        session.add(bench_list)
+        session.flush()
+        list_id = bench_list.id
+        session.execute(
+            insert(DenseBenchItem),
+            [{"id": uuid4(), "list_id": list_id, "name": f"dense-{i}", "position": i} for i in range(items)],
+        )
+        session.execute(
+            insert(SparseBenchItem),
+            [
+                {"id": uuid4(), "list_id": list_id, "name": f"sparse-{i}", "position": i * POSITION_GAP}
+                for i in range(items)
+            ],
+        )
+        session.commit()
+    return list_id
+
+
+def bench_dense(engine: Engine, list_id: UUID, inserts: int) -> float:
+    started = time.perf_counter()
+    for i in range(inserts):
+        with Session(engine) as session:
+            bench_list = session.get_one(BenchList, list_id)
+            bench_list.dense_items.insert(0, DenseBenchItem(list_id=list_id, name=f"dense-head-{i}"))
+            session.commit()
+    return time.perf_counter() - started
+
+
+def bench_sparse(engine: Engine, list_id: UUID, inserts: int) -> float:
+    started = time.perf_counter()
+    for i in range(inserts):
+        with Session(engine) as session:
+            head = session.scalars(
+                select(SparseBenchItem)
+                .where(SparseBenchItem.list_id == list_id)
+                .order_by(SparseBenchItem.position)
+                .limit(1),
+            ).one()
+            SparseBenchItem(list_id=list_id, name=f"sparse-head-{i}").place(session, before=head)
+            session.commit()
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=50_000)
+    parser.add_argument("--inserts", type=int, default=20)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    DataclassBase.metadata.create_all(engine)
+    list_id = seed(engine, args.items)
+    updated_rows = count_updated_rows(engine)
+
+    print(f"{args.inserts} head inserts into a {args.items}-item list")
+    for label, bench in (("dense", bench_dense), ("sparse", bench_sparse)):
+        elapsed = bench(engine, list_id, args.inserts)
+        rows = updated_rows()
+        per_insert_ms = elapsed / args.inserts * 1000
+        print(f"{label:>6}: {per_insert_ms:9.2f} ms/insert {rows / args.inserts:10.1f} rows updated/insert")
+
+
+if __name__ == "__main__":
+    main()
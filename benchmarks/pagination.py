@@ -0,0 +1,88 @@
+"""Compare OFFSET and keyset pagination latency as pages get deeper.
+
+Seeds an in-memory SQLite table of TimestampMixin rows with a (created_at, id)
+index and times fetching one page at increasing depths with each strategy.
+
+Usage:
+    python benchmarks/pagination.py --rows 200000 --page-size 50 --depths 1 100 1000 3000
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Mapped, Session, mapped_column
+
+from brussels.base import DataclassBase
+from brussels.mixins import PrimaryKeyMixin, TimestampMixin
+from brussels.pagination import encode_cursor, keyset_index, paginate
+
+
+class BenchmarkItem(DataclassBase, PrimaryKeyMixin, TimestampMixin):
+    __tablename__ = "benchmark_items"
+    __table_args__ = (keyset_index(),)
+
+    value: Mapped[int] = mapped_column()
+
+
+def _seed(session: Session, rows: int) -> None:
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    values = [
+        {"id": uuid4(), "value": index, "created_at": start + timedelta(seconds=index), "updated_at": start}
+        for index in range(rows)
+    ]
+    session.execute(insert(BenchmarkItem), values)
+    session.commit()
+
+
+def _time(repeat: int, fetch: Callable[[], None]) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fetch()
+    return (time.perf_counter() - started) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--depths", type=int, nargs="+", default=[1, 100, 1000, 3000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite:///:memory:")
+    DataclassBase.metadata.create_all(engine)
+    with Session(engine) as session:
+        _seed(session, args.rows)
+        keys = (BenchmarkItem.created_at, BenchmarkItem.id)
+        ordered = select(BenchmarkItem).order_by(*keys)
+        print(f"{args.rows} rows, {args.page_size} per page, ms per page (OFFSET -> keyset)")
+        for depth in args.depths:
+            offset = (depth - 1) * args.page_size
+            if offset >= args.rows:
+                continue
+            # The cursor a client would hold after reading the previous page.
+            cursor = None
+            if offset:
+                previous = session.execute(select(*keys).order_by(*keys).offset(offset - 1).limit(1)).one()
+                cursor = encode_cursor(tuple(previous))
+
+            def offset_page(offset: int = offset) -> None:
+                session.scalars(ordered.offset(offset).limit(args.page_size)).all()
+                session.expunge_all()
+
+            def keyset_page(cursor: str | None = cursor) -> None:
+                paginate(session, select(BenchmarkItem), limit=args.page_size, cursor=cursor)
+                session.expunge_all()
+
+            offset_ms = _time(args.repeat, offset_page) * 1000
+            keyset_ms = _time(args.repeat, keyset_page) * 1000
+            print(f"  page {depth:6d}  {offset_ms:8.2f} -> {keyset_ms:8.2f}")
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Compare insert throughput and index size of UUIDv4 and UUIDv7 primary keys on SQLite.
+
+Usage:
+    python benchmarks/primary_keys.py --rows 200000 --batch 500
+"""
+
+import argparse
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from uuid import UUID, uuid4
+
+from sqlalchemy import Engine, create_engine, insert, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from brussels.base import DataclassBase
+from brussels.mixins import PrimaryKeyMixin, UUIDv7PrimaryKeyMixin
+from brussels.mixins.primary_key import uuid7
+
+
+class RandomKeyRow(DataclassBase, PrimaryKeyMixin):
+    payload: Mapped[str] = mapped_column()
+
+
+class TimeOrderedKeyRow(DataclassBase, UUIDv7PrimaryKeyMixin):
+    payload: Mapped[str] = mapped_column()
+
+
+def bench(engine: Engine, model: type[DataclassBase], factory: Callable[[], UUID], rows: int, batch: int) -> float:
+    statement = insert(model.__table__)
+    started = time.perf_counter()
+    for offset in range(0, rows, batch):
+        with engine.begin() as connection:
+            connection.execute(
+                statement,
+                [{"id": factory(), "payload": f"row-{offset + i}"} for i in range(min(batch, rows - offset))],
+            )
+    return time.perf_counter() - started
+
+
+def table_bytes(engine: Engine, table_name: str) -> dict[str, int]:
+    with engine.connect() as connection:
+        result = connection.execute(
+            text(
+                "SELECT name, SUM(pgsize) FROM dbstat WHERE name = :table OR name IN "
+                "(SELECT name FROM sqlite_schema WHERE type = 'index' AND tbl_name = :table) GROUP BY name",
+            ),
+            {"table": table_name},
+        )
+        return dict(result.tuples().all())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--batch", type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{Path(directory) / 'keys.db'}")
+        DataclassBase.metadata.create_all(engine, tables=[RandomKeyRow.__table__, TimeOrderedKeyRow.__table__])
+
+        print(f"{args.rows} rows in transactions of {args.batch}")
+        for label, model, factory in (("uuid4", RandomKeyRow, uuid4), ("uuid7", TimeOrderedKeyRow, uuid7)):
+            elapsed = bench(engine, model, factory, args.rows, args.batch)
+            sizes = table_bytes(engine, model.__tablename__)
+            index_bytes = sum(size for name, size in sizes.items() if name != model.__tablename__)
+            print(
+                f"{label}: {args.rows / elapsed:10.0f} rows/s "
+                f"table {sizes[model.__tablename__] / 1024:8.0f} KiB indexes {index_bytes / 1024:8.0f} KiB",
+            )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
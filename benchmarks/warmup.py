@@ -0,0 +1,114 @@
+"""Measure first-request latency with and without warm_up().
+
+Mapper configuration and statement compilation are per process, so each
+scenario runs in a fresh interpreter: it declares --models models with
+PrimaryKeyMixin, TimestampMixin and a few columns, then times a "request"
+(get, insert, update and delete on every model) once after startup and
+again once everything is cached.
+
+Usage:
+    python benchmarks/warmup.py --models 50 --repeat 5
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.orm import Mapped, Session, mapped_column
+
+from brussels.base import DataclassBase
+from brussels.mixins import PrimaryKeyMixin, TimestampMixin
+from brussels.types import Json
+from brussels.warmup import warm_up
+
+
+def _declare(count: int) -> list[type[Any]]:
+    models = []
+    for index in range(count):
+        namespace = {
+            "__tablename__": f"warm_model_{index}",
+            "__annotations__": {
+                "name": Mapped[str],
+                "quantity": Mapped[int],
+                "payload": Mapped[dict[str, Any]],
+                "note": Mapped[str | None],
+            },
+            "payload": mapped_column(Json),
+            "note": mapped_column(default=None),
+        }
+        models.append(type(f"WarmModel{index}", (DataclassBase, PrimaryKeyMixin, TimestampMixin), namespace))
+    return models
+
+
+def _request(engine: Engine, models: list[type[Any]]) -> float:
+    started = time.perf_counter()
+    with Session(engine) as session:
+        for model in models:
+            instance = model(name="item", quantity=1, payload={"a": 1})
+            session.add(instance)
+            session.flush()
+            instance.quantity = 2
+            session.flush()
+            session.expunge(instance)
+            loaded = session.get(model, instance.id)
+            session.delete(loaded)
+            session.flush()
+        session.rollback()
+    return time.perf_counter() - started
+
+
+def _child(mode: str, models_count: int, database: str) -> None:
+    models = _declare(models_count)
+    engine = create_engine(f"sqlite:///{database}")
+    if mode == "warm":
+        report = warm_up(DataclassBase, engine)
+        print(f"warm_up {report.total_seconds:.6f}")
+    first = _request(engine, models)
+    steady = min(_request(engine, models) for _ in range(3))
+    print(f"first {first:.6f}")
+    print(f"steady {steady:.6f}")
+
+
+def _run(mode: str, models: int, database: Path) -> dict[str, float]:
+    command = [sys.executable, __file__, "--child", mode, "--models", str(models), "--database", str(database)]
+    output = subprocess.run(command, check=True, capture_output=True, text=True).stdout  # noqa: S603
+    return {name: float(value) for name, value in (line.split() for line in output.splitlines())}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--models", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--child", choices=("cold", "warm"), help=argparse.SUPPRESS)
+    parser.add_argument("--database", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child(args.child, args.models, args.database)
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        database = Path(directory) / "warmup.db"
+        engine = create_engine(f"sqlite:///{database}")
+        DataclassBase.metadata.create_all(engine, tables=[model.__table__ for model in _declare(args.models)])
+        engine.dispose()
+
+        print(f"{args.models} models, median of {args.repeat} processes")
+        for mode in ("cold", "warm"):
+            runs = [_run(mode, args.models, database) for _ in range(args.repeat)]
+            first = statistics.median(run["first"] for run in runs) * 1000
+            steady = statistics.median(run["steady"] for run in runs) * 1000
+            line = f"  {mode:5s} first request {first:8.1f} ms  steady {steady:8.1f} ms"
+            if mode == "warm":
+                line += f"  warm_up {statistics.median(run['warm_up'] for run in runs) * 1000:8.1f} ms"
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
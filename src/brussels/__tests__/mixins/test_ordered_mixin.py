@@ -1,14 +1,16 @@
 import inspect
 from collections.abc import Iterator
 from typing import cast
+from uuid import UUID
 
 import pytest
-from sqlalchemy import Engine, ForeignKey, Integer, Table, create_engine
+from sqlalchemy import BigInteger, Engine, ForeignKey, Integer, Table, create_engine, event, select
 from sqlalchemy.ext.orderinglist import OrderingList, ordering_list
 from sqlalchemy.orm import Mapped, Session, mapped_column, relationship
 
 from brussels.base import DataclassBase
-from brussels.mixins import OrderedMixin, PrimaryKeyMixin
+from brussels.mixins import OrderedMixin, PrimaryKeyMixin, SparseOrderedMixin
+from brussels.mixins.ordered import POSITION_GAP, REBALANCE_WINDOW
 
 
 class OrderedList(DataclassBase, PrimaryKeyMixin):
@@ -26,12 +28,21 @@ class OrderedList(DataclassBase, PrimaryKeyMixin):
 
 class OrderedItem(DataclassBase, PrimaryKeyMixin, OrderedMixin):
     __tablename__ = "ordered_items"
+    __ordering_scope__ = ("list_id",)
 
     list_id: Mapped[int] = mapped_column(ForeignKey("ordered_lists.id"), init=False)
     list: Mapped[OrderedList] = relationship("OrderedList", back_populates="items", init=False)
     name: Mapped[str] = mapped_column()
 
 
+class SparseItem(DataclassBase, PrimaryKeyMixin, SparseOrderedMixin):
+    __tablename__ = "sparse_items"
+    __ordering_scope__ = ("list_id",)
+
+    list_id: Mapped[UUID] = mapped_column(ForeignKey("ordered_lists.id"))
+    name: Mapped[str] = mapped_column()
+
+
 def test_position_column_definition() -> None:
     table = cast("Table", OrderedItem.__table__)
     column = table.c.position
@@ -147,3 +158,239 @@ def test_ordering_list_reorder_updates_positions(engine: Engine) -> None:
         assert [item.name for item in ordered_list.items] == ["alpha", "beta", "gamma"]
         assert before_positions["beta"] == 0
         assert after_positions["beta"] == 1
+
+
+def _seed_ordered_list(session: Session, *names: str) -> OrderedList:
+    ordered_list = OrderedList(name="list")
+    for name in names:
+        ordered_list.items.append(OrderedItem(name=name))
+    session.add(ordered_list)
+    session.flush()
+    return ordered_list
+
+
+def _ordered_names(session: Session, ordered_list: OrderedList) -> list[str]:
+    statement = select(OrderedItem.name).where(OrderedItem.list_id == ordered_list.id).order_by(OrderedItem.position)
+    return list(session.scalars(statement))
+
+
+def _capture_updates(engine: Engine) -> list[str]:
+    statements: list[str] = []
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def capture(_conn, _cursor, statement, _parameters, _context, _executemany) -> None:
+        if statement.startswith("UPDATE"):
+            statements.append(statement)
+
+    return statements
+
+
+def test_insert_at_shifts_siblings_with_single_update(engine: Engine) -> None:
+    DataclassBase.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        ordered_list = _seed_ordered_list(session, "a", "b", "c")
+        second = ordered_list.items[1]
+        updates = _capture_updates(engine)
+
+        item = OrderedItem(name="new")
+        item.list_id = ordered_list.id
+        OrderedItem.insert_at(session, item, 1)
+        session.flush()
+
+        assert len(updates) == 1
+        assert item.position == 1
+        assert second.position == 2
+        assert _ordered_names(session, ordered_list) == ["a", "new", "b", "c"]
+
+
+def test_insert_at_clamps_index_to_end(engine: Engine) -> None:
+    DataclassBase.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        ordered_list = _seed_ordered_list(session, "a", "b")
+
+        item = OrderedItem(name="last")
+        item.list_id = ordered_list.id
+        OrderedItem.insert_at(session, item, 10)
+        session.flush()
+
+        assert item.position == 2
+        assert _ordered_names(session, ordered_list) == ["a", "b", "last"]
+
+
+def test_move_up_and_down_with_single_update(engine: Engine) -> None:
+    DataclassBase.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        ordered_list = _seed_ordered_list(session, "a", "b", "c", "d")
+        first, second, _, last = list(ordered_list.items)
+        updates = _capture_updates(engine)
+
+        OrderedItem.move(session, last, to=0)
+        session.flush()
+
+        assert len(updates) == 2  # shift siblings + the moved row itself
+        assert first.position == 1
+        assert _ordered_names(session, ordered_list) == ["d", "a", "b", "c"]
+
+        OrderedItem.move(session, second, to=10)
+        session.flush()
+
+        assert second.position == 3
+        assert _ordered_names(session, ordered_list) == ["d", "a", "c", "b"]
+
+
+def test_move_to_same_position_is_noop(engine: Engine) -> None:
+    DataclassBase.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        ordered_list = _seed_ordered_list(session, "a", "b")
+        updates = _capture_updates(engine)
+
+        OrderedItem.move(session, ordered_list.items[1], to=1)
+        session.flush()
+
+        assert updates == []
+
+
+def test_remove_and_compact_closes_gap(engine: Engine) -> None:
+    DataclassBase.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        ordered_list = _seed_ordered_list(session, "a", "b", "c")
+        _, second, third = list(ordered_list.items)
+        session.expire(ordered_list, ["items"])
+
+        OrderedItem.remove_and_compact(session, second)
+        session.flush()
+
+        assert third.position == 1
+        assert _ordered_names(session, ordered_list) == ["a", "c"]
+
+
+def test_sparse_position_column_definition() -> None:
+    table = cast("Table", SparseItem.__table__)
+    column = table.c.position
+
+    assert isinstance(column.type, BigInteger)
+    assert column.nullable is False
+    assert any("position" in index.columns for index in table.indexes)
+    assert "position" not in inspect.signature(SparseItem).parameters
+
+
+def _sparse_names(session: Session, list_id: UUID) -> list[str]:
+    statement = select(SparseItem.name).where(SparseItem.list_id == list_id).order_by(SparseItem.position)
+    return list(session.scalars(statement))
+
+
+def test_sparse_place_appends_with_gaps(engine: Engine) -> None:
+    DataclassBase.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        ordered_list = OrderedList(name="list")
+        session.add(ordered_list)
+        session.flush()
+
+        items = [SparseItem(list_id=ordered_list.id, name=name) for name in ("first", "second", "third")]
+        for item in items:
+            item.place(session)
+            session.flush()
+
+        assert [item.position for item in items] == [0, POSITION_GAP, 2 * POSITION_GAP]
+        assert _sparse_names(session, ordered_list.id) == ["first", "second", "third"]
+
+
+def test_sparse_place_before_and_after_touches_single_row(engine: Engine) -> None:
+    DataclassBase.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        ordered_list = OrderedList(name="list")
+        session.add(ordered_list)
+        session.flush()
+
+        first = SparseItem(list_id=ordered_list.id, name="first")
+        last = SparseItem(list_id=ordered_list.id, name="last")
+        for item in (first, last):
+            item.place(session)
+            session.flush()
+
+        head = SparseItem(list_id=ordered_list.id, name="head")
+        head.place(session, before=first)
+        middle = SparseItem(list_id=ordered_list.id, name="middle")
+        middle.place(session, after=first)
+
+        assert not session.dirty
+        session.flush()
+
+        assert head.position == -POSITION_GAP
+        assert middle.position == POSITION_GAP // 2
+        assert _sparse_names(session, ordered_list.id) == ["head", "first", "middle", "last"]
+
+
+def test_sparse_place_moves_existing_item(engine: Engine) -> None:
+    DataclassBase.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        ordered_list = OrderedList(name="list")
+        session.add(ordered_list)
+        session.flush()
+
+        items = [SparseItem(list_id=ordered_list.id, name=name) for name in ("a", "b", "c")]
+        for item in items:
+            item.place(session)
+            session.flush()
+
+        items[2].place(session, before=items[0])
+        session.flush()
+
+        assert _sparse_names(session, ordered_list.id) == ["c", "a", "b"]
+
+
+def test_sparse_place_rebalances_local_window(engine: Engine) -> None:
+    DataclassBase.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        ordered_list = OrderedList(name="list")
+        session.add(ordered_list)
+        session.flush()
+
+        count = REBALANCE_WINDOW * 4
+        items = [SparseItem(list_id=ordered_list.id, name=f"item-{index:03d}") for index in range(count)]
+        for item in items:
+            item.place(session)
+            session.flush()
+
+        anchor = items[0]
+        for _ in range(10):
+            SparseItem(list_id=ordered_list.id, name="item-000").place(session, after=anchor)
+            session.flush()
+
+        updated_rows: list[int] = []
+
+        @event.listens_for(engine, "after_cursor_execute")
+        def count_updates(_conn, cursor, statement, _parameters, _context, _executemany) -> None:
+            if statement.startswith("UPDATE"):
+                updated_rows.append(cursor.rowcount)
+
+        tight = SparseItem(list_id=ordered_list.id, name="item-000")
+        tight.place(session, after=anchor)
+        session.flush()
+
+        positions = list(
+            session.scalars(
+                select(SparseItem.position).where(SparseItem.list_id == ordered_list.id).order_by(SparseItem.position),
+            ),
+        )
+        assert len(set(positions)) == len(positions)
+        assert 0 < sum(updated_rows) <= REBALANCE_WINDOW
+        assert _sparse_names(session, ordered_list.id)[-1] == f"item-{count - 1:03d}"
+
+
+def test_sparse_place_rejects_both_anchors(engine: Engine) -> None:
+    DataclassBase.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        item = SparseItem(list_id=UUID(int=0), name="item")
+        with pytest.raises(ValueError, match="either before or after"):
+            item.place(session, before=item, after=item)
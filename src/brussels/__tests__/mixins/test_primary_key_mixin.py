@@ -1,7 +1,8 @@
 import inspect
+import time
 from collections.abc import Iterator
 from typing import Any, cast
-from uuid import UUID, uuid4
+from uuid import RFC_4122, UUID, uuid4
 
 import pytest
 from sqlalchemy import Engine, Table, create_engine
@@ -9,7 +10,8 @@ from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import Mapped, Session, mapped_column
 
 from brussels.base import DataclassBase
-from brussels.mixins import PrimaryKeyMixin, TimestampMixin
+from brussels.mixins import PrimaryKeyMixin, TimestampMixin, UUIDv7PrimaryKeyMixin
+from brussels.mixins.primary_key import uuid7
 
 
 class Widget(DataclassBase, PrimaryKeyMixin, TimestampMixin):
@@ -18,6 +20,12 @@ class Widget(DataclassBase, PrimaryKeyMixin, TimestampMixin):
     name: Mapped[str] = mapped_column()
 
 
+class TimeOrderedWidget(DataclassBase, UUIDv7PrimaryKeyMixin):
+    __tablename__ = "uuid7_primary_key_widgets"
+
+    name: Mapped[str] = mapped_column()
+
+
 @pytest.fixture
 def engine() -> Iterator[Engine]:
     engine = create_engine("sqlite:///:memory:")
@@ -32,8 +40,8 @@ def test_id_column_definition() -> None:
     column = table.c.id
 
     assert column.primary_key is True
-    assert column.unique is True
-    assert any("id" in index.columns for index in table.indexes)
+    assert not column.unique
+    assert not any("id" in index.columns for index in table.indexes)
 
     server_default = column.server_default
     assert server_default is not None
@@ -59,3 +67,46 @@ def test_id_default_factory_generates_uuid_on_flush(engine: Engine) -> None:
         session.flush()
 
         assert isinstance(widget.id, UUID)
+
+
+def test_uuid7_sets_version_variant_and_timestamp() -> None:
+    before_ms = time.time_ns() // 1_000_000
+    value = uuid7()
+    after_ms = time.time_ns() // 1_000_000
+
+    assert value.version == 7
+    assert value.variant == RFC_4122
+    assert before_ms <= value.int >> 80 <= after_ms + 1
+
+
+def test_uuid7_is_monotonic() -> None:
+    values = [uuid7() for _ in range(10_000)]
+
+    assert values == sorted(values)
+    assert len(set(values)) == len(values)
+
+
+def test_uuid7_id_column_definition() -> None:
+    table = cast("Table", TimeOrderedWidget.__table__)
+    column = table.c.id
+
+    assert column.primary_key is True
+    assert "id" not in inspect.signature(TimeOrderedWidget).parameters
+
+    server_default = column.server_default
+    assert server_default is not None
+    compiled = cast("Any", server_default).arg.compile(dialect=postgresql.dialect())
+    assert "uuidv7" in str(compiled)
+
+
+def test_uuid7_default_factory_generates_ordered_ids_on_flush(engine: Engine) -> None:
+    DataclassBase.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        widgets = [TimeOrderedWidget(name=f"widget-{index}") for index in range(5)]
+        session.add_all(widgets)
+        session.flush()
+
+        ids = [widget.id for widget in widgets]
+        assert all(isinstance(value, UUID) and value.version == 7 for value in ids)
+        assert ids == sorted(ids)
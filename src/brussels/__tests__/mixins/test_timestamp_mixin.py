@@ -1,15 +1,16 @@
 import inspect
 import time
 from collections.abc import Iterator
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 
 import pytest
-from sqlalchemy import Engine, create_engine
+from sqlalchemy import Engine, create_engine, event, select, text
 from sqlalchemy.orm import Mapped, Session, mapped_column
 
 from brussels.base import DataclassBase
-from brussels.mixins import PrimaryKeyMixin, TimestampMixin
-from brussels.types import DateTimeUTC
+from brussels.mixins import EpochTimestampMixin, PrimaryKeyMixin, ServerTimestampMixin, TimestampMixin
+from brussels.mixins.timestamp import updated_at_triggers
+from brussels.types import DateTimeUTC, EpochDateTimeUTC
 
 
 class Widget(DataclassBase, PrimaryKeyMixin, TimestampMixin):
@@ -18,6 +19,18 @@ class Widget(DataclassBase, PrimaryKeyMixin, TimestampMixin):
     name: Mapped[str] = mapped_column()
 
 
+class EpochWidget(DataclassBase, PrimaryKeyMixin, EpochTimestampMixin):
+    __tablename__ = "epoch_timestamp_widgets"
+
+    name: Mapped[str] = mapped_column()
+
+
+class ServerWidget(DataclassBase, PrimaryKeyMixin, ServerTimestampMixin):
+    __tablename__ = "server_timestamp_widgets"
+
+    name: Mapped[str] = mapped_column()
+
+
 @pytest.fixture
 def engine() -> Iterator[Engine]:
     engine = create_engine("sqlite:///:memory:")
@@ -110,3 +123,149 @@ def test_mark_deleted_sets_deleted_at(engine: Engine) -> None:
 
         assert widget.deleted_at is not None
         assert_is_utc(widget.deleted_at)
+
+
+def test_epoch_timestamp_column_definitions() -> None:
+    table = EpochWidget.__table__
+
+    for name in ("created_at", "updated_at", "deleted_at"):
+        assert isinstance(table.c[name].type, EpochDateTimeUTC)
+    assert table.c.updated_at.onupdate is not None
+    assert table.c.deleted_at.nullable is True
+    assert "created_at" not in inspect.signature(EpochWidget).parameters
+
+
+def test_epoch_timestamps_round_trip(engine: Engine) -> None:
+    DataclassBase.metadata.create_all(engine)
+
+    before = datetime.now(UTC)
+    with Session(engine) as session:
+        widget = EpochWidget(name="widget")
+        session.add(widget)
+        session.commit()
+        session.refresh(widget)
+
+        assert widget.created_at.tzinfo is UTC
+        assert before <= widget.created_at <= datetime.now(UTC)
+        created_at = widget.created_at
+
+        widget.name = "updated"
+        session.commit()
+        session.refresh(widget)
+        assert widget.updated_at >= created_at
+
+        widget.mark_deleted()
+        session.commit()
+        session.refresh(widget)
+        assert widget.deleted_at is not None
+        assert widget.deleted_at.tzinfo is UTC
+
+    with engine.connect() as connection:
+        raw = connection.exec_driver_sql("SELECT created_at FROM epoch_timestamp_widgets").scalar_one()
+    assert isinstance(raw, int)
+
+
+def test_epoch_range_query_compiles_to_integers(engine: Engine) -> None:
+    DataclassBase.metadata.create_all(engine)
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+
+    with Session(engine) as session:
+        for day in range(5):
+            widget = EpochWidget(name=f"day-{day}")
+            session.add(widget)
+            session.flush()
+            widget.created_at = start + timedelta(days=day)
+        session.commit()
+
+        statement = select(EpochWidget.name).where(
+            EpochWidget.created_at.between(start + timedelta(days=1), start + timedelta(days=3)),
+        )
+        compiled = str(statement.compile(engine, compile_kwargs={"literal_binds": True}))
+        assert "BETWEEN 1704153600000000 AND 1704326400000000" in compiled
+        assert session.scalars(statement.order_by(EpochWidget.created_at)).all() == ["day-1", "day-2", "day-3"]
+
+
+@pytest.mark.parametrize("model", [Widget, EpochWidget])
+def test_bulk_mark_deleted_and_restore(engine: Engine, model: type[Widget] | type[EpochWidget]) -> None:
+    DataclassBase.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.add_all([model(name="a"), model(name="b"), model(name="c")])
+        session.commit()
+        earlier = session.scalars(select(model).where(model.name == "a")).one()
+        earlier.deleted_at = datetime(2020, 1, 1, tzinfo=UTC)
+        session.commit()
+
+        result = session.execute(model.bulk_mark_deleted(model.name.in_(["a", "b"])))
+        session.commit()
+        assert result.rowcount == 1  # type: ignore[attr-defined]
+        deleted = dict(session.execute(select(model.name, model.deleted_at)).tuples().all())
+        assert deleted["a"] == datetime(2020, 1, 1, tzinfo=UTC)
+        assert deleted["b"] is not None
+        assert deleted["c"] is None
+
+        result = session.execute(model.bulk_restore())
+        session.commit()
+        assert result.rowcount == 2  # type: ignore[attr-defined]
+        assert session.scalars(select(model.deleted_at)).all() == [None, None, None]
+
+
+def test_server_timestamp_column_definitions() -> None:
+    table = ServerWidget.__table__
+
+    assert table.c.created_at.server_default is not None
+    assert table.c.updated_at.server_default is not None
+    assert table.c.updated_at.server_onupdate is not None
+    assert ServerWidget.__mapper__.eager_defaults is True
+    assert isinstance(ServerWidget(name="widget"), TimestampMixin)
+
+
+def test_server_timestamps_returned_without_extra_queries(engine: Engine) -> None:
+    DataclassBase.metadata.create_all(engine)
+    statements: list[str] = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    with Session(engine) as session:
+        widget = ServerWidget(name="widget")
+        session.add(widget)
+        session.flush()
+        assert_is_utc(widget.created_at)
+        assert_is_utc(widget.updated_at)
+
+        widget.mark_deleted()
+        session.flush()
+        assert widget.deleted_at is not None
+        assert_is_utc(widget.deleted_at)
+
+    assert len(statements) == 2
+    assert all("RETURNING" in statement for statement in statements)
+
+
+def test_server_trigger_updates_raw_sql_writes(engine: Engine) -> None:
+    DataclassBase.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        widget = ServerWidget(name="widget")
+        session.add(widget)
+        session.commit()
+
+    with engine.begin() as connection:
+        connection.execute(text("UPDATE server_timestamp_widgets SET updated_at = '2000-01-01 00:00:00'"))
+        connection.execute(text("UPDATE server_timestamp_widgets SET name = 'renamed'"))
+        updated_at = connection.execute(select(ServerWidget.updated_at)).scalar_one()
+
+    assert updated_at > datetime(2020, 1, 1, tzinfo=UTC)
+
+
+def test_server_trigger_ddl_per_dialect() -> None:
+    table = ServerWidget.__table__
+
+    postgresql = [str(ddl.statement) for ddl in updated_at_triggers(table, "postgresql")]
+    sqlite = [str(ddl.statement) for ddl in updated_at_triggers(table, "sqlite")]
+
+    assert "CREATE OR REPLACE FUNCTION brussels_touch_updated_at()" in postgresql[0]
+    assert "BEFORE UPDATE" in postgresql[1]
+    assert "IS NOT DISTINCT FROM" in postgresql[1]
+    assert "AFTER UPDATE" in sqlite[0]
+    assert "WHERE id = NEW.id" in sqlite[0]
+    assert updated_at_triggers(table, "mysql") == []
@@ -0,0 +1,107 @@
+import sys
+from types import ModuleType
+
+from sqlalchemy import Column, Index, Integer, MetaData, String, Table, UniqueConstraint, text
+
+from brussels.audit import IndexFinding, audit_indexes, audit_table, main
+from brussels.base import NAMING_CONVENTION
+
+
+def make_metadata() -> MetaData:
+    return MetaData(naming_convention=NAMING_CONVENTION)
+
+
+def test_audit_reports_index_duplicating_primary_key() -> None:
+    metadata = make_metadata()
+    table = Table("widgets", metadata, Column("id", Integer, primary_key=True, index=True, unique=True))
+
+    assert audit_table(table) == [IndexFinding("widgets", "ix_widgets_id", "pk_widgets", "same columns")]
+
+
+def test_audit_reports_unique_constraint_duplicating_primary_key() -> None:
+    metadata = make_metadata()
+    table = Table("widgets", metadata, Column("id", Integer, primary_key=True), UniqueConstraint("id"))
+
+    assert audit_table(table) == [IndexFinding("widgets", "uq_widgets_id", "pk_widgets", "same columns")]
+
+
+def test_audit_reports_leading_column_prefix() -> None:
+    metadata = make_metadata()
+    table = Table(
+        "widgets",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("owner_id", Integer, index=True),
+        Column("name", String),
+        Index("ix_widgets_owner_id_name", "owner_id", "name"),
+    )
+
+    assert audit_table(table) == [
+        IndexFinding("widgets", "ix_widgets_owner_id", "ix_widgets_owner_id_name", "leading columns"),
+    ]
+
+
+def test_audit_keeps_unique_index_over_plain_index() -> None:
+    metadata = make_metadata()
+    table = Table(
+        "widgets",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("code", String),
+        Index("ix_widgets_code_unique", "code", unique=True),
+        Index("ix_widgets_code_plain", "code"),
+    )
+
+    assert audit_table(table) == [
+        IndexFinding("widgets", "ix_widgets_code_plain", "ix_widgets_code_unique", "same columns"),
+    ]
+
+
+def test_audit_ignores_partial_and_expression_indexes() -> None:
+    metadata = make_metadata()
+    table = Table(
+        "widgets",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("code", String, index=True),
+        Index("ix_widgets_code_live", "code", postgresql_where=text("code IS NOT NULL")),
+        Index("ix_widgets_code_lower", text("lower(code)")),
+    )
+
+    assert audit_table(table) == []
+
+
+def test_audit_indexes_reports_name_collisions() -> None:
+    metadata = make_metadata()
+    Table("widgets", metadata, Column("id", Integer, primary_key=True), Column("code", String, index=True))
+    Table(
+        "gadgets",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("code", String),
+        Index("ix_widgets_code", "code"),
+    )
+
+    assert audit_indexes(metadata) == [
+        IndexFinding("widgets", "ix_widgets_code", "gadgets.ix_widgets_code", "duplicate name"),
+    ]
+
+
+def test_main_reports_findings_and_exit_status(monkeypatch, capsys) -> None:
+    module = ModuleType("audit_models")
+    module.metadata = make_metadata()  # type: ignore[attr-defined]
+    Table("widgets", module.metadata, Column("id", Integer, primary_key=True, index=True))
+    monkeypatch.setitem(sys.modules, "audit_models", module)
+
+    assert main(["--metadata", "audit_models:metadata"]) == 1
+    assert capsys.readouterr().out == "widgets: ix_widgets_id is redundant with pk_widgets (same columns)\n"
+
+
+def test_main_exits_cleanly_without_findings(monkeypatch, capsys) -> None:
+    module = ModuleType("audit_models")
+    module.metadata = make_metadata()  # type: ignore[attr-defined]
+    Table("widgets", module.metadata, Column("id", Integer, primary_key=True))
+    monkeypatch.setitem(sys.modules, "audit_models", module)
+
+    assert main(["audit_models", "--metadata", "audit_models:metadata"]) == 0
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,142 @@
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from uuid import UUID
+
+import pytest
+from sqlalchemy import Engine, create_engine, select
+from sqlalchemy.orm import Mapped, Session, mapped_column
+
+from brussels.base import DataclassBase
+from brussels.bulk import bulk_insert, bulk_upsert
+from brussels.mixins import EpochTimestampMixin, PrimaryKeyMixin, TimestampMixin
+
+
+class BulkProduct(DataclassBase, PrimaryKeyMixin, TimestampMixin):
+    __tablename__ = "bulk_products"
+
+    sku: Mapped[str] = mapped_column(unique=True)
+    price: Mapped[int] = mapped_column()
+    label: Mapped[str | None] = mapped_column("product_label", default=None)
+
+
+class BulkReading(DataclassBase, EpochTimestampMixin):
+    __tablename__ = "bulk_readings"
+
+    id: Mapped[int] = mapped_column(primary_key=True, init=False)
+    value: Mapped[float] = mapped_column()
+
+
+@pytest.fixture
+def engine() -> Iterator[Engine]:
+    engine = create_engine("sqlite:///:memory:")
+    DataclassBase.metadata.create_all(engine)
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
+def products(session: Session) -> dict[str, tuple[int, str | None]]:
+    rows = session.execute(select(BulkProduct.sku, BulkProduct.price, BulkProduct.label))
+    return {sku: (price, label) for sku, price, label in rows}
+
+
+def test_bulk_insert_fills_mixin_defaults_and_returns_ids(engine: Engine) -> None:
+    with Session(engine) as session:
+        ids = bulk_insert(
+            session,
+            BulkProduct,
+            ({"sku": f"sku-{number}", "price": number} for number in range(5)),
+            chunk_size=2,
+            returning=True,
+        )
+        session.commit()
+
+        loaded = session.scalars(select(BulkProduct)).all()
+        assert isinstance(ids, list)
+        assert len(set(ids)) == 5
+        assert all(isinstance(identifier, UUID) for identifier in ids)
+        assert {product.id: product.sku for product in loaded} == {ids[number]: f"sku-{number}" for number in range(5)}
+        assert all(product.created_at.tzinfo is not None for product in loaded)
+        assert all(product.deleted_at is None for product in loaded)
+
+
+def test_bulk_insert_accepts_tuples_and_attribute_names(engine: Engine) -> None:
+    with Session(engine) as session:
+        count = BulkProduct.bulk_insert(session, [("a", 1, "first"), ("b", 2, None)], columns=("sku", "price", "label"))
+
+        assert count == 2
+        assert products(session) == {"a": (1, "first"), "b": (2, None)}
+
+
+def test_bulk_insert_rejects_unknown_attributes(engine: Engine) -> None:
+    with Session(engine) as session, pytest.raises(ValueError, match="Unknown attributes for bulk_products: colour"):
+        bulk_insert(session, BulkProduct, [{"sku": "a", "price": 1, "colour": "red"}])
+
+
+def test_bulk_insert_requires_mapped_class(engine: Engine) -> None:
+    with Session(engine) as session, pytest.raises(TypeError, match="mapped class"):
+        bulk_insert(session, dict, [{}])
+
+
+def test_bulk_insert_ignore_conflicts(engine: Engine) -> None:
+    with Session(engine) as session:
+        bulk_insert(session, BulkProduct, [{"sku": "a", "price": 1}])
+        rows = [{"sku": "a", "price": 5}, {"sku": "b", "price": 2}]
+        count = bulk_insert(session, BulkProduct, rows, ignore_conflicts=True)
+
+        assert count == 1
+        assert products(session) == {"a": (1, None), "b": (2, None)}
+
+
+def test_bulk_upsert_updates_supplied_attributes(engine: Engine) -> None:
+    with Session(engine) as session:
+        bulk_insert(session, BulkProduct, [("a", 1, "kept"), ("b", 2, None)], columns=("sku", "price", "label"))
+        original = session.scalars(select(BulkProduct).where(BulkProduct.sku == "a")).one()
+        original_id, created_at = original.id, original.created_at
+        original.mark_deleted()
+        session.commit()
+
+        ids = BulkProduct.bulk_upsert(
+            session,
+            [("a", 10), ("c", 3)],
+            columns=("sku", "price"),
+            conflict=("sku",),
+            returning=True,
+        )
+        session.commit()
+        session.expire_all()
+
+        assert isinstance(ids, list)
+        assert ids[0] == original_id
+        assert products(session) == {"a": (10, "kept"), "b": (2, None), "c": (3, None)}
+        updated = session.get(BulkProduct, original_id)
+        assert updated is not None
+        assert updated.created_at == created_at
+        assert updated.deleted_at is not None
+
+
+def test_bulk_upsert_explicit_update_columns(engine: Engine) -> None:
+    with Session(engine) as session:
+        bulk_insert(session, BulkProduct, [{"sku": "a", "price": 1, "label": "old"}])
+        rows = [{"sku": "a", "price": 5, "label": "new"}]
+        bulk_upsert(session, BulkProduct, rows, conflict=("sku",), update=("label",))
+
+        assert products(session) == {"a": (1, "new")}
+
+
+def test_bulk_upsert_without_rows(engine: Engine) -> None:
+    with Session(engine) as session:
+        assert bulk_upsert(session, BulkProduct, []) == 0
+        assert bulk_upsert(session, BulkProduct, [], returning=True) == []
+
+
+def test_bulk_insert_uses_python_column_defaults(engine: Engine) -> None:
+    before = datetime.now(UTC)
+    with engine.begin() as connection:
+        ids = bulk_insert(connection, BulkReading, [{"value": 1.5}, {"value": 2.5}], returning=True)
+
+    with Session(engine) as session:
+        readings = session.scalars(select(BulkReading).order_by(BulkReading.id)).all()
+        assert [reading.id for reading in readings] == ids
+        assert all(reading.created_at >= before for reading in readings)
@@ -0,0 +1,137 @@
+import asyncio
+import dataclasses
+from pathlib import Path
+
+import pytest
+from sqlalchemy import MetaData, select, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.pool import NullPool, QueuePool, StaticPool
+
+from brussels.base import Base
+from brussels.engine import (
+    ENGINE_PRESETS,
+    _async_url,
+    async_engine_from_preset,
+    async_session_factory,
+    engine_from_preset,
+    session_factory,
+)
+
+
+class PresetWidget(Base):
+    __tablename__ = "preset_widgets"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column()
+
+
+def test_web_preset_on_sqlite_file(tmp_path: Path) -> None:
+    engine = engine_from_preset(f"sqlite:///{tmp_path / 'web.db'}")
+    try:
+        with engine.connect() as connection:
+            journal_mode = connection.execute(text("PRAGMA journal_mode")).scalar()
+            synchronous = connection.execute(text("PRAGMA synchronous")).scalar()
+            busy_timeout = connection.execute(text("PRAGMA busy_timeout")).scalar()
+
+        assert journal_mode == "wal"
+        assert synchronous == 1
+        assert busy_timeout == 5000
+        assert isinstance(engine.pool, QueuePool)
+        assert engine.pool.size() == 10
+        assert engine.dialect.insertmanyvalues_page_size == 1000
+    finally:
+        engine.dispose()
+
+
+def test_batch_preset_and_overrides(tmp_path: Path) -> None:
+    engine = engine_from_preset(f"sqlite:///{tmp_path / 'batch.db'}", "batch", poolclass=NullPool)
+    try:
+        with engine.connect() as connection:
+            assert connection.execute(text("PRAGMA temp_store")).scalar() == 2
+
+        assert isinstance(engine.pool, NullPool)
+        assert engine.dialect.insertmanyvalues_page_size == 10_000
+    finally:
+        engine.dispose()
+
+
+def test_custom_preset(tmp_path: Path) -> None:
+    preset = dataclasses.replace(ENGINE_PRESETS["worker"], pool_size=3, sqlite_pragmas={})
+    engine = engine_from_preset(f"sqlite:///{tmp_path / 'worker.db'}", preset)
+    try:
+        with engine.connect() as connection:
+            assert connection.execute(text("PRAGMA journal_mode")).scalar() == "delete"
+        assert engine.pool.size() == 3  # type: ignore[attr-defined]
+    finally:
+        engine.dispose()
+
+
+def test_test_preset_shares_in_memory_database() -> None:
+    engine = engine_from_preset("sqlite://", "test")
+    try:
+        session_local = session_factory(engine, create_all=True)
+        with session_local() as session:
+            session.add(PresetWidget(id=1, name="shared"))
+            session.commit()
+        with session_local() as session:
+            assert session.scalars(select(PresetWidget.name)).all() == ["shared"]
+        assert isinstance(engine.pool, StaticPool)
+    finally:
+        engine.dispose()
+
+
+def test_session_factory_uses_given_metadata() -> None:
+    engine = engine_from_preset("sqlite://", "test")
+    try:
+        session_factory(engine, metadata=MetaData(), create_all=True)
+        with engine.connect() as connection:
+            assert connection.execute(text("SELECT name FROM sqlite_master")).all() == []
+    finally:
+        engine.dispose()
+
+
+def test_unknown_preset() -> None:
+    with pytest.raises(ValueError, match="Unknown engine preset 'api'"):
+        engine_from_preset("sqlite://", "api")  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("sqlite:///app.db", "sqlite+aiosqlite"),
+        ("postgresql://app@db/app", "postgresql+asyncpg"),
+        ("postgresql+psycopg2://app@db/app", "postgresql+asyncpg"),
+        ("postgresql+psycopg://app@db/app", "postgresql+psycopg"),
+        ("mysql+pymysql://app@db/app", "mysql+aiomysql"),
+        ("sqlite+aiosqlite://", "sqlite+aiosqlite"),
+    ],
+)
+def test_async_driver_choice(url: str, expected: str) -> None:
+    assert _async_url(make_url(url)).drivername == expected
+
+
+def test_async_driver_choice_rejects_unknown_backend() -> None:
+    with pytest.raises(ValueError, match="No asyncio driver known for oracle"):
+        _async_url(make_url("oracle://app@db/app"))
+
+
+def test_async_engine_from_preset(tmp_path: Path) -> None:
+    pytest.importorskip("aiosqlite")
+
+    async def run() -> tuple[str, list[str]]:
+        engine = async_engine_from_preset(f"sqlite:///{tmp_path / 'async.db'}", "worker")
+        try:
+            async with engine.begin() as connection:
+                await connection.run_sync(Base.metadata.create_all, tables=[PresetWidget.__table__])
+                journal_mode = (await connection.execute(text("PRAGMA journal_mode"))).scalar_one()
+            session_local = async_session_factory(engine)
+            async with session_local() as session:
+                session.add(PresetWidget(id=1, name="async"))
+                await session.commit()
+                names = list(await session.scalars(select(PresetWidget.name)))
+        finally:
+            await engine.dispose()
+        return journal_mode, names
+
+    assert asyncio.run(run()) == ("wal", ["async"])
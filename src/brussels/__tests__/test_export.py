@@ -0,0 +1,157 @@
+import csv
+import io
+import json
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+import pytest
+from sqlalchemy import Engine, LargeBinary, Numeric, create_engine
+from sqlalchemy.orm import Mapped, Session, mapped_column
+
+from brussels.base import Base
+from brussels.export import export_model
+from brussels.types import DateTimeUTC, EpochDateTimeUTC, Json
+
+try:
+    from brussels.types import EncryptedString
+except ImportError:
+    pytest.skip("cryptography optional dependency not installed", allow_module_level=True)
+
+KEY = "MDEyMzQ1Njc4OWFiY2RlZjAxMjM0NTY3ODlhYmNkZWY="
+START = datetime(2024, 1, 1, tzinfo=UTC)
+TOKEN = UUID("0190d2c8-8f9b-7c3e-9a4b-1d2e3f405162")
+
+
+class ExportedRecord(Base):
+    __tablename__ = "exported_records"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column()
+    payload: Mapped[dict[str, Any] | None] = mapped_column(Json)
+    recorded_at: Mapped[datetime] = mapped_column(DateTimeUTC)
+    observed_at: Mapped[datetime | None] = mapped_column(EpochDateTimeUTC)
+    token: Mapped[UUID | None] = mapped_column()
+    amount: Mapped[Decimal | None] = mapped_column(Numeric(10, 2))
+    blob: Mapped[bytes | None] = mapped_column(LargeBinary)
+    secret: Mapped[str | None] = mapped_column(EncryptedString(key=KEY))
+
+
+@pytest.fixture
+def engine() -> Iterator[Engine]:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(
+            ExportedRecord(
+                id=index,
+                name=f"record-{index}",
+                payload={"index": index, "tags": ["a", "b"]} if index % 2 == 0 else None,
+                recorded_at=START + timedelta(minutes=index),
+                observed_at=START + timedelta(microseconds=index) if index % 2 == 0 else None,
+                token=TOKEN if index == 0 else None,
+                amount=Decimal("1.50") if index == 0 else None,
+                blob=b"\x00\xff" if index == 0 else None,
+                secret=f"secret-{index}",
+            )
+            for index in range(7)
+        )
+        session.commit()
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
+def test_ndjson_export_streams_every_row(engine: Engine) -> None:
+    stream = io.StringIO()
+    with Session(engine) as session:
+        count = export_model(session, ExportedRecord, stream, batch_size=3)
+
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert count == len(lines) == 7
+    assert lines[0] == {
+        "id": 0,
+        "name": "record-0",
+        "payload": {"index": 0, "tags": ["a", "b"]},
+        "recorded_at": "2024-01-01T00:00:00+00:00",
+        "observed_at": "2024-01-01T00:00:00+00:00",
+        "token": str(TOKEN),
+        "amount": "1.50",
+        "blob": "AP8=",
+        "secret": lines[0]["secret"],
+    }
+    assert lines[0]["secret"] != "secret-0"  # noqa: S105
+    assert lines[1]["payload"] is None
+    assert lines[2]["observed_at"] == "2024-01-01T00:00:00.000002+00:00"
+
+
+def test_decrypt_and_column_selection(engine: Engine, tmp_path: Path) -> None:
+    destination = tmp_path / "records.ndjson"
+
+    count = export_model(engine, ExportedRecord, destination, columns=("secret", "id"), decrypt=True, batch_size=2)
+
+    lines = [json.loads(line) for line in destination.read_text(encoding="utf-8").splitlines()]
+    assert count == 7
+    assert lines == [{"secret": f"secret-{index}", "id": index} for index in range(7)]
+
+
+def test_csv_export_with_filter(engine: Engine) -> None:
+    stream = io.StringIO(newline="")
+    with engine.connect() as connection:
+        count = export_model(
+            connection,
+            ExportedRecord,
+            stream,
+            file_format="csv",
+            columns=("id", "payload", "recorded_at"),
+            where=(ExportedRecord.id < 3,),
+        )
+
+    rows = list(csv.reader(io.StringIO(stream.getvalue(), newline="")))
+    assert count == 3
+    assert rows[0] == ["id", "payload", "recorded_at"]
+    assert rows[1][0] == "0"
+    assert json.loads(rows[1][1]) == {"index": 0, "tags": ["a", "b"]}
+    assert rows[2] == ["1", "", "2024-01-01T00:01:00+00:00"]
+
+
+def test_empty_csv_export_keeps_header(engine: Engine) -> None:
+    stream = io.StringIO()
+    where = (ExportedRecord.id < 0,)
+    count = export_model(engine, ExportedRecord, stream, file_format="csv", columns=("id",), where=where)
+
+    assert count == 0
+    assert stream.getvalue().splitlines() == ["id"]
+
+
+def test_arrow_export_has_typed_schema(engine: Engine) -> None:
+    pa = pytest.importorskip("pyarrow")
+    sink = io.BytesIO()
+
+    count = export_model(engine, ExportedRecord, sink, file_format="arrow", decrypt=True, batch_size=4)
+
+    table = pa.ipc.open_file(pa.BufferReader(sink.getvalue())).read_all()
+    assert count == table.num_rows == 7
+    assert table.schema.field("id").type == pa.int64()
+    assert table.schema.field("recorded_at").type == pa.timestamp("us", tz="UTC")
+    assert table.schema.field("observed_at").type == pa.timestamp("us", tz="UTC")
+    assert table.schema.field("blob").type == pa.binary()
+    assert table.column("observed_at").to_pylist()[:3] == [START, None, START + timedelta(microseconds=2)]
+    assert table.column("recorded_at").to_pylist()[1] == START + timedelta(minutes=1)
+    assert json.loads(table.column("payload")[0].as_py()) == {"index": 0, "tags": ["a", "b"]}
+    assert table.column("secret").to_pylist() == [f"secret-{index}" for index in range(7)]
+    assert table.column("token").to_pylist()[0] == str(TOKEN)
+
+
+def test_invalid_arguments_are_rejected(engine: Engine) -> None:
+    stream = io.StringIO()
+    with pytest.raises(ValueError, match="Unknown export format 'xml'"):
+        export_model(engine, ExportedRecord, stream, file_format="xml")  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="Unknown attributes for exported_records: colour"):
+        export_model(engine, ExportedRecord, stream, columns=("id", "colour"))
+    with pytest.raises(TypeError, match="mapped class"):
+        export_model(engine, dict, stream)
@@ -0,0 +1,223 @@
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import Column, Engine, Integer, String, Table, Text, create_engine, select, text, type_coerce
+from sqlalchemy.orm import Mapped, configure_mappers, mapped_column
+
+from brussels.base import Base, DataclassBase
+from brussels.jobs import BatchProgress, purge_deleted, reencrypt_column
+from brussels.mixins import TimestampMixin
+from brussels.types import DateTimeUTC
+
+try:
+    from brussels.types import EncryptedBinaryString, EncryptedString, blind_index_column
+except ImportError:
+    pytest.skip("cryptography optional dependency not installed", allow_module_level=True)
+
+OLD_KEY = "MDEyMzQ1Njc4OWFiY2RlZjAxMjM0NTY3ODlhYmNkZWY="
+NEW_KEY = "FC-c_21-lM4W6v8kWngjNjVj8T0ohgYVgSS_6G1iD2M="
+
+
+class RotatedSecret(Base):
+    __tablename__ = "rotated_secrets"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    secret: Mapped[str | None] = mapped_column(EncryptedString(key=[NEW_KEY, OLD_KEY]))
+
+
+class PurgedRecord(DataclassBase, TimestampMixin):
+    __tablename__ = "purged_records"
+
+    id: Mapped[int] = mapped_column(primary_key=True, init=False)
+    name: Mapped[str] = mapped_column()
+
+
+purged_records_archive = Table(
+    "purged_records_archive",
+    Base.metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", String),
+    Column("deleted_at", DateTimeUTC),
+)
+
+
+@pytest.fixture
+def engine() -> Iterator[Engine]:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
+def seed_secrets(engine: Engine) -> None:
+    old = EncryptedString(key=OLD_KEY)
+    new = EncryptedString(key=NEW_KEY)
+    rows = [
+        {"id": 1, "secret": old.process_bind_param("one", None)},
+        {"id": 2, "secret": new.process_bind_param("two", None)},
+        {"id": 3, "secret": None},
+        {"id": 4, "secret": old.process_bind_param("four", None)},
+        {"id": 5, "secret": old.process_bind_param("five", None)},
+    ]
+    with engine.begin() as connection:
+        connection.execute(text("INSERT INTO rotated_secrets (id, secret) VALUES (:id, :secret)"), rows)
+
+
+def raw_secrets(engine: Engine) -> dict[int, str | None]:
+    statement = select(RotatedSecret.id, type_coerce(RotatedSecret.secret, Text())).order_by(RotatedSecret.id)
+    with engine.connect() as connection:
+        return dict(connection.execute(statement).tuples().all())
+
+
+def test_reencrypt_column_rewrites_only_rows_on_old_keys(engine: Engine) -> None:
+    seed_secrets(engine)
+    before = raw_secrets(engine)
+
+    progress = list(reencrypt_column(engine, RotatedSecret.secret, batch_size=2))
+
+    assert progress[-1] == BatchProgress(batches=3, scanned=5, changed=3, last_key=5)
+    after = raw_secrets(engine)
+    assert after[2] == before[2]
+    assert after[3] is None
+
+    new_only = EncryptedString(key=NEW_KEY)
+    decrypted = {key: new_only.process_result_value(value, None) for key, value in after.items()}
+    assert decrypted == {1: "one", 2: "two", 3: None, 4: "four", 5: "five"}
+
+
+def test_reencrypt_column_resumes_after_last_key(engine: Engine) -> None:
+    seed_secrets(engine)
+
+    first = next(reencrypt_column(engine, RotatedSecret.secret, batch_size=2))
+    assert first == BatchProgress(batches=1, scanned=2, changed=1, last_key=2)
+
+    resumed = list(reencrypt_column(engine, RotatedSecret.secret, batch_size=2, start_after=first.last_key))
+    assert resumed[-1] == BatchProgress(batches=2, scanned=3, changed=2, last_key=5)
+    new_only = EncryptedString(key=NEW_KEY)
+    assert not any(new_only.needs_rotation(value) for value in raw_secrets(engine).values() if value)
+
+
+def test_reencrypt_column_rejects_plain_columns() -> None:
+    with pytest.raises(TypeError, match="requires an EncryptedString column"):
+        next(reencrypt_column(create_engine("sqlite://"), RotatedSecret.id))
+
+
+class RotatedIndexedSecret(Base):
+    __tablename__ = "rotated_indexed_secrets"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    secret: Mapped[str | None] = mapped_column(EncryptedString(key=[NEW_KEY, OLD_KEY], blind_index_key="index-key"))
+    secret_bidx: Mapped[str | None] = blind_index_column("secret")
+
+
+def test_reencrypt_column_keeps_blind_index(engine: Engine) -> None:
+    configure_mappers()
+    old = EncryptedString(key=OLD_KEY, blind_index_key="index-key")
+    rows = [
+        {"id": 1, "secret": old.process_bind_param("one", None), "digest": old.blind_index("one")},
+        {"id": 2, "secret": old.process_bind_param("two", None), "digest": old.blind_index("two")},
+    ]
+    with engine.begin() as connection:
+        connection.execute(
+            text("INSERT INTO rotated_indexed_secrets (id, secret, secret_bidx) VALUES (:id, :secret, :digest)"),
+            rows,
+        )
+
+    progress = list(reencrypt_column(engine, RotatedIndexedSecret.secret))
+
+    assert progress[-1].changed == 2
+    with engine.connect() as connection:
+        digests = connection.execute(select(RotatedIndexedSecret.id, RotatedIndexedSecret.secret_bidx)).all()
+        assert sorted(digests) == [(1, old.blind_index("one")), (2, old.blind_index("two"))]
+        statement = select(RotatedIndexedSecret.id).where(RotatedIndexedSecret.secret == "two")  # noqa: S105
+        assert connection.scalars(statement).all() == [2]
+
+
+class RotatedBinarySecret(Base):
+    __tablename__ = "rotated_binary_secrets"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    secret: Mapped[str | None] = mapped_column(EncryptedBinaryString(key=[NEW_KEY, OLD_KEY]))
+
+
+def test_reencrypt_column_upgrades_binary_column(engine: Engine) -> None:
+    legacy = (EncryptedString(key=OLD_KEY).process_bind_param("legacy", None) or "").encode("ascii")
+    with engine.begin() as connection:
+        connection.execute(
+            text("INSERT INTO rotated_binary_secrets (id, secret) VALUES (:id, :secret)"),
+            [{"id": 1, "secret": legacy}, {"id": 2, "secret": None}],
+        )
+
+    progress = list(reencrypt_column(engine, RotatedBinarySecret.secret))
+
+    assert progress == [BatchProgress(batches=1, scanned=2, changed=1, last_key=2)]
+    with engine.connect() as connection:
+        stored = connection.execute(text("SELECT secret FROM rotated_binary_secrets WHERE id = 1")).scalar_one()
+    assert EncryptedBinaryString(key=NEW_KEY).process_result_value(stored, None) == "legacy"
+
+
+def seed_deleted_records(engine: Engine) -> datetime:
+    now = datetime.now(UTC)
+    ages = [None, 40, 5, 60, None, 31, 90]
+    with engine.begin() as connection:
+        connection.execute(
+            PurgedRecord.__table__.insert(),
+            [
+                {
+                    "id": position,
+                    "name": f"record-{position}",
+                    "created_at": now,
+                    "updated_at": now,
+                    "deleted_at": None if age is None else now - timedelta(days=age),
+                }
+                for position, age in enumerate(ages, start=1)
+            ],
+        )
+    return now
+
+
+def remaining_records(engine: Engine) -> list[int]:
+    with engine.connect() as connection:
+        return list(connection.execute(select(PurgedRecord.id).order_by(PurgedRecord.id)).scalars())
+
+
+def test_purge_deleted_removes_rows_past_cutoff_in_batches(engine: Engine) -> None:
+    seed_deleted_records(engine)
+
+    progress = list(purge_deleted(engine, PurgedRecord.deleted_at, older_than=timedelta(days=30), batch_size=2))
+
+    assert remaining_records(engine) == [1, 3, 5]
+    assert progress == [
+        BatchProgress(batches=1, scanned=2, changed=2, last_key=4),
+        BatchProgress(batches=2, scanned=4, changed=4, last_key=7),
+    ]
+
+
+def test_purge_deleted_resumes_and_accepts_absolute_cutoff(engine: Engine) -> None:
+    now = seed_deleted_records(engine)
+
+    jobs = purge_deleted(engine, PurgedRecord.deleted_at, older_than=now - timedelta(days=50), batch_size=1)
+    first = next(jobs)
+    assert first.last_key == 4
+    jobs.close()
+
+    resumed = list(purge_deleted(engine, PurgedRecord.deleted_at, older_than=now, start_after=first.last_key))
+
+    assert remaining_records(engine) == [1, 2, 3, 5]
+    assert resumed[-1].changed == 2
+
+
+def test_purge_deleted_archives_before_deleting(engine: Engine) -> None:
+    seed_deleted_records(engine)
+
+    list(purge_deleted(engine, PurgedRecord.deleted_at, older_than=timedelta(days=45), archive=purged_records_archive))
+
+    with engine.connect() as connection:
+        archived = connection.execute(
+            select(purged_records_archive.c.id, purged_records_archive.c.name).order_by(purged_records_archive.c.id),
+        ).all()
+    assert [tuple(row) for row in archived] == [(4, "record-4"), (7, "record-7")]
+    assert remaining_records(engine) == [1, 2, 3, 5, 6]
@@ -0,0 +1,148 @@
+from typing import Any
+
+import pytest
+from sqlalchemy import Integer, create_engine, select, text
+from sqlalchemy.dialects.postgresql import dialect as postgres_dialect
+from sqlalchemy.dialects.sqlite import dialect as sqlite_dialect
+from sqlalchemy.engine import Dialect
+from sqlalchemy.orm import Mapped, Session, mapped_column
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from brussels.base import Base, DataclassBase
+from brussels.json_index import JsonGinIndex, JsonIndex, apply_json_indexes, json_path
+from brussels.types import Json
+
+
+class JsonIndexedEvent(Base):
+    id: Mapped[int] = mapped_column(primary_key=True)
+    payload: Mapped[dict[str, Any]] = mapped_column(Json)
+
+    __json_indexes__ = (
+        JsonIndex("payload", "customer.id"),
+        JsonIndex("payload", "status", generated=True),
+        JsonIndex("payload", ("items", 0, "qty"), type_=Integer()),
+        JsonGinIndex("payload"),
+    )
+
+
+class JsonIndexedDataclass(DataclassBase):
+    id: Mapped[int] = mapped_column(primary_key=True, init=False)
+    payload: Mapped[dict[str, Any]] = mapped_column(Json)
+
+    __json_indexes__ = (JsonIndex("payload", "kind", generated=True, unique=True),)
+
+
+def index_sql(name: str, dialect: Dialect) -> str:
+    index = next(index for index in JsonIndexedEvent.__table__.indexes if index.name == name)
+    return str(CreateIndex(index).compile(dialect=dialect))
+
+
+def test_index_names_follow_naming_convention() -> None:
+    names = {index.name for index in JsonIndexedEvent.__table__.indexes}
+
+    assert names == {
+        "ix_json_indexed_event_payload_customer_id",
+        "ix_json_indexed_event_payload_status",
+        "ix_json_indexed_event_payload_items_0_qty",
+        "ix_json_indexed_event_payload_gin",
+    }
+
+
+def test_functional_index_compiles_per_dialect() -> None:
+    assert index_sql("ix_json_indexed_event_payload_customer_id", postgres_dialect()) == (
+        "CREATE INDEX ix_json_indexed_event_payload_customer_id ON json_indexed_event ((payload #>> '{customer,id}'))"
+    )
+    assert index_sql("ix_json_indexed_event_payload_items_0_qty", sqlite_dialect()) == (
+        "CREATE INDEX ix_json_indexed_event_payload_items_0_qty ON json_indexed_event "
+        "(CAST(CAST(json_extract(payload, '$.\"items\"[0].\"qty\"') AS TEXT) AS INTEGER))"
+    )
+
+
+def test_gin_index_is_postgres_only() -> None:
+    assert "USING gin (payload jsonb_path_ops)" in index_sql("ix_json_indexed_event_payload_gin", postgres_dialect())
+    gin = next(index for index in JsonIndexedEvent.__table__.indexes if index.name.endswith("_gin"))
+    assert gin._ddl_if is not None
+    assert gin._ddl_if.dialect == "postgresql"
+
+
+def test_generated_column_is_stored_and_indexed() -> None:
+    ddl = str(CreateTable(JsonIndexedEvent.__table__).compile(dialect=postgres_dialect()))
+
+    assert "payload_status TEXT GENERATED ALWAYS AS ((payload #>> '{status}')) STORED" in ddl
+    assert JsonIndexedDataclass.__table__.c.payload_kind.computed is not None
+    assert any(index.unique for index in JsonIndexedDataclass.__table__.indexes)
+
+
+def test_queries_compile_to_indexed_expression() -> None:
+    statement = select(JsonIndexedEvent.id).where(
+        JsonIndexedEvent.payload_customer_id == "42",
+        JsonIndexedEvent.payload_items_0_qty > 3,
+    )
+
+    compiled = str(statement.compile(dialect=postgres_dialect()))
+
+    assert "(json_indexed_event.payload #>> '{customer,id}') = " in compiled
+    assert "CAST((json_indexed_event.payload #>> '{items,0,qty}') AS INTEGER) > " in compiled
+
+
+def test_path_segments_affect_cache_key() -> None:
+    column = JsonIndexedEvent.__table__.c.payload
+
+    assert json_path(column, "a")._generate_cache_key() != json_path(column, "b")._generate_cache_key()
+
+
+@pytest.mark.parametrize(
+    ("path", "error"),
+    [("a.b'c", ValueError), ((), ValueError), (("a", 1.5), TypeError), (("a", True), TypeError)],
+)
+def test_json_path_rejects_unsafe_segments(path: object, error: type[Exception]) -> None:
+    with pytest.raises(error):
+        json_path(JsonIndexedEvent.__table__.c.payload, path)  # type: ignore[arg-type]
+
+
+def test_json_path_is_text_and_quotes_keys() -> None:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    try:
+        with Session(engine) as session:
+            session.add(JsonIndexedEvent(payload={"customer": {"id": 42}, "customer-id": 7, "ratio": 1.5}))
+            session.commit()
+
+            statement = select(JsonIndexedEvent.id).where(JsonIndexedEvent.payload_customer_id == "42")
+            assert session.scalars(statement).all() == [1]
+            payload = JsonIndexedEvent.payload
+            values = session.execute(select(json_path(payload, "customer-id"), json_path(payload, "ratio"))).one()
+            assert tuple(values) == ("7", "1.5")
+    finally:
+        engine.dispose()
+
+
+def test_sqlite_uses_indexes() -> None:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    try:
+        with Session(engine) as session:
+            session.add(JsonIndexedEvent(payload={"customer": {"id": "42"}, "status": "open", "items": [{"qty": 5}]}))
+            session.add(JsonIndexedDataclass(payload={"kind": "a"}))
+            session.commit()
+
+            statement = select(JsonIndexedEvent.id).where(JsonIndexedEvent.payload_customer_id == "42")
+            assert session.scalars(statement).all() == [1]
+            compiled = statement.compile(engine, compile_kwargs={"literal_binds": True})
+            plan = session.execute(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+            assert "ix_json_indexed_event_payload_customer_id" in str(plan)
+
+            event = session.scalars(select(JsonIndexedEvent)).one()
+            assert event.payload_status == "open"
+            assert event.payload_items_0_qty == 5
+            assert session.scalars(select(JsonIndexedDataclass.payload_kind)).all() == ["a"]
+    finally:
+        engine.dispose()
+
+
+def test_declaration_requires_mapped_table() -> None:
+    class Unmapped:
+        pass
+
+    with pytest.raises(TypeError, match="requires a mapped class"):
+        apply_json_indexes(Unmapped, (JsonIndex("payload", "a"),))
@@ -0,0 +1,176 @@
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+import pytest
+from sqlalchemy import Engine, create_engine, select
+from sqlalchemy.orm import Mapped, Session, mapped_column
+
+from brussels.base import DataclassBase
+from brussels.mixins import EpochTimestampMixin, PrimaryKeyMixin, TimestampMixin
+from brussels.pagination import (
+    decode_cursor,
+    encode_cursor,
+    keyset_index,
+    keyset_page,
+    keyset_select,
+    paginate,
+    recommend_keyset_index,
+)
+
+START = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+class PagedItem(DataclassBase, PrimaryKeyMixin, TimestampMixin):
+    __tablename__ = "paged_items"
+    __table_args__ = (keyset_index(),)
+
+    position: Mapped[int] = mapped_column()
+
+
+class UnindexedPagedItem(DataclassBase, PrimaryKeyMixin, TimestampMixin):
+    __tablename__ = "unindexed_paged_items"
+
+
+class EpochPagedItem(DataclassBase, PrimaryKeyMixin, EpochTimestampMixin):
+    __tablename__ = "epoch_paged_items"
+
+    position: Mapped[int] = mapped_column()
+
+
+@pytest.fixture
+def session() -> Iterator[Session]:
+    engine: Engine = create_engine("sqlite:///:memory:")
+    DataclassBase.metadata.create_all(engine)
+    with Session(engine) as session:
+        items = [PagedItem(position=position) for position in range(23)]
+        session.add_all(items)
+        session.flush()
+        # Three rows share each created_at, so id has to break ties.
+        for item in items:
+            item.created_at = START + timedelta(seconds=item.position // 3)
+        session.commit()
+        yield session
+    engine.dispose()
+
+
+def expected_order(session: Session) -> list[int]:
+    return list(session.scalars(select(PagedItem.position).order_by(PagedItem.created_at, PagedItem.id)))
+
+
+def test_cursor_round_trip() -> None:
+    identifier = UUID("0190d2c8-8f9b-7c3e-9a4b-1d2e3f405162")
+    cursor = encode_cursor([START, identifier, 7], "previous")
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == ("previous", (START, identifier, 7))
+
+
+@pytest.mark.parametrize("cursor", ["", "not a cursor", encode_cursor([1]).upper()])
+def test_invalid_cursor_is_rejected(cursor: str) -> None:
+    with pytest.raises(ValueError, match="Invalid pagination cursor"):
+        decode_cursor(cursor)
+
+
+def test_forward_pages_cover_every_row_once(session: Session) -> None:
+    pages: list[list[int]] = []
+    cursor = None
+    while True:
+        page = paginate(session, select(PagedItem), limit=5, cursor=cursor)
+        pages.append([item.position for item in page.items])
+        assert (page.previous_cursor is None) == (cursor is None)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert [len(page) for page in pages] == [5, 5, 5, 5, 3]
+    assert [position for page in pages for position in page] == expected_order(session)
+
+
+def test_backward_paging_returns_previous_page(session: Session) -> None:
+    first = paginate(session, select(PagedItem), limit=5)
+    second = paginate(session, select(PagedItem), limit=5, cursor=first.next_cursor)
+    back = paginate(session, select(PagedItem), limit=5, cursor=second.previous_cursor)
+
+    assert [item.position for item in back.items] == [item.position for item in first.items]
+    assert back.previous_cursor is None
+    assert back.next_cursor is not None
+
+
+def test_descending_pages(session: Session) -> None:
+    first = paginate(session, select(PagedItem), limit=10, descending=True)
+    second = paginate(session, select(PagedItem), limit=10, cursor=first.next_cursor, descending=True)
+
+    positions = [item.position for item in first.items + second.items]
+    assert positions == expected_order(session)[::-1][:20]
+
+
+def test_filtered_select_and_explicit_keys(session: Session) -> None:
+    keys = (PagedItem.position,)
+    statement = select(PagedItem.position, PagedItem.id).where(PagedItem.position % 2 == 0)
+
+    first = paginate(session, statement, keys=keys, limit=4)
+    second = paginate(session, statement, keys=keys, limit=4, cursor=first.next_cursor)
+
+    assert [row.position for row in first.items] == [0, 2, 4, 6]
+    assert [row.position for row in second.items] == [8, 10, 12, 14]
+
+
+def test_keyset_select_and_page_without_session_helper(session: Session) -> None:
+    keys = (PagedItem.created_at, PagedItem.id)
+    statement = keyset_select(select(PagedItem), keys, limit=30)
+    page = keyset_page(session.scalars(statement).all(), keys, limit=30)
+
+    assert len(page.items) == 23
+    assert page.next_cursor is None
+    assert page.previous_cursor is None
+
+
+def test_epoch_timestamp_keys(session: Session) -> None:
+    events = [EpochPagedItem(position=position) for position in range(5)]
+    session.add_all(events)
+    session.flush()
+    for event in events:
+        event.created_at = START + timedelta(seconds=event.position // 2)
+    session.commit()
+
+    first = paginate(session, select(EpochPagedItem), limit=3)
+    second = paginate(session, select(EpochPagedItem), limit=3, cursor=first.next_cursor)
+
+    positions = sorted(item.position for item in first.items + second.items)
+    assert positions == [0, 1, 2, 3, 4]
+    assert second.next_cursor is None
+
+
+def test_database_generated_timestamps(session: Session) -> None:
+    # Inserted in one flush, so most rows share created_at down to the millisecond.
+    session.add_all([UnindexedPagedItem() for _ in range(10)])
+    session.commit()
+
+    seen: list[int] = []
+    cursor = None
+    while True:
+        page = paginate(session, select(UnindexedPagedItem), limit=3, cursor=cursor)
+        seen.extend(item.id for item in page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert len(seen) == 10
+    assert set(seen) == set(session.scalars(select(UnindexedPagedItem.id)))
+
+
+def test_default_keys_require_timestamp_model(session: Session) -> None:
+    with pytest.raises(TypeError, match="needs keys"):
+        paginate(session, select(PagedItem.position))
+
+
+def test_keyset_index_declaration_and_recommendation() -> None:
+    index = next(iter(PagedItem.__table__.indexes))
+
+    assert index.name == "ix_paged_items_created_at_id"
+    assert list(index.columns.keys()) == ["created_at", "id"]
+    assert recommend_keyset_index(PagedItem.__table__) is None
+    assert recommend_keyset_index(UnindexedPagedItem.__table__) == (
+        "CREATE INDEX ix_unindexed_paged_items_created_at_id ON unindexed_paged_items (created_at, id)"
+    )
@@ -0,0 +1,107 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy.orm import decl_api, decl_base
+
+from brussels.base import Base
+from brussels.profile import ClassTiming, ImportProfile, format_profile, main, profile_import
+
+MODELS = """\
+from sqlalchemy.orm import Mapped, MappedAsDataclass, mapped_column
+
+from brussels.base import Base, DataclassBase
+from brussels.mixins import PrimaryKeyMixin, TimestampMixin
+
+
+class ProfiledNoteMixin{suffix}(MappedAsDataclass):
+    note: Mapped[str | None] = mapped_column(default=None)
+
+
+class ProfiledHTTPRequest{suffix}(DataclassBase, PrimaryKeyMixin, TimestampMixin, ProfiledNoteMixin{suffix}):
+    path: Mapped[str] = mapped_column(default="/")
+
+
+class ProfiledSetting{suffix}(Base):
+    id: Mapped[int] = mapped_column(primary_key=True)
+"""
+
+
+@pytest.fixture
+def models_module(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, request: pytest.FixtureRequest) -> str:
+    suffix = request.node.name.title().replace("_", "")
+    name = f"profiled_models_{request.node.name}"
+    (tmp_path / f"{name}.py").write_text(MODELS.format(suffix=suffix), encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    return name
+
+
+def test_profile_import_times_each_class(models_module: str) -> None:
+    profile = profile_import(models_module)
+
+    suffix = "TestProfileImportTimesEachClass"
+    timings = {timing.name.removeprefix(f"{models_module}.").removesuffix(suffix): timing for timing in profile.classes}
+    assert set(timings) == {"ProfiledNoteMixin", "ProfiledHTTPRequest", "ProfiledSetting"}
+    request, setting, mixin = timings["ProfiledHTTPRequest"], timings["ProfiledSetting"], timings["ProfiledNoteMixin"]
+    assert request.declare >= request.dataclass > 0
+    assert request.tablename > 0
+    assert request.configure > 0
+    assert setting.dataclass == 0
+    assert setting.configure > 0
+    assert mixin.declare == mixin.dataclass > 0
+    assert mixin.configure == 0
+    assert profile.import_seconds > 0
+
+
+def test_profile_restores_sqlalchemy_hooks(models_module: str) -> None:
+    hooks = (
+        decl_api._as_declarative,
+        decl_base._ClassScanMapperConfig.__dict__["_apply_dataclasses_to_any_class"],
+        Base.__dict__["__tablename__"].fget,
+    )
+    profile_import(models_module)
+
+    assert hooks == (
+        decl_api._as_declarative,
+        decl_base._ClassScanMapperConfig.__dict__["_apply_dataclasses_to_any_class"],
+        Base.__dict__["__tablename__"].fget,
+    )
+
+
+def test_already_imported_module_is_rejected() -> None:
+    with pytest.raises(ValueError, match=r"already imported: brussels\.bulk"):
+        profile_import("brussels.bulk")
+
+
+def test_format_profile_sorts_and_limits() -> None:
+    profile = ImportProfile(
+        modules=("pkg.models",),
+        import_seconds=0.5,
+        configure_seconds=0.25,
+        classes=(
+            ClassTiming("pkg.models.Fast", 0.001, 0.0, 0.0, 0.001),
+            ClassTiming("pkg.models.Slow", 0.002, 0.001, 0.0, 0.05),
+        ),
+    )
+
+    lines = format_profile(profile, sort="declare", limit=1).splitlines()
+
+    assert lines[0] == "Imported pkg.models in 500.0 ms (2 classes); configured 2 mappers in 250.0 ms"
+    assert lines[3].startswith("pkg.models.Slow")
+    assert lines[-1] == "... 1 more"
+
+
+def test_main_prints_report(models_module: str, capsys: pytest.CaptureFixture[str]) -> None:
+    assert main([models_module, "--sort", "configure", "--limit", "0"]) == 0
+
+    output = capsys.readouterr().out
+    assert output.startswith(f"Imported {models_module} in ")
+    assert f"{models_module}.ProfiledSettingTestMainPrintsReport" in output
+
+
+def test_brussels_types_defers_cryptography() -> None:
+    code = "import sys, brussels.types; print('cryptography' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True)  # noqa: S603
+
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,157 @@
+from collections.abc import Iterator
+
+import pytest
+from sqlalchemy import Engine, ForeignKey, create_engine, select
+from sqlalchemy.dialects.postgresql import dialect as postgres_dialect
+from sqlalchemy.dialects.sqlite import dialect as sqlite_dialect
+from sqlalchemy.orm import Mapped, Session, mapped_column, relationship, selectinload, sessionmaker
+from sqlalchemy.schema import CreateIndex
+
+from brussels.base import DataclassBase
+from brussels.mixins import EpochTimestampMixin, PrimaryKeyMixin, TimestampMixin
+from brussels.soft_delete import disable_soft_delete_filter, enable_soft_delete_filter, live_index
+
+
+class SoftAuthor(DataclassBase, PrimaryKeyMixin, TimestampMixin):
+    __tablename__ = "soft_delete_authors"
+    __table_args__ = (live_index("email", unique=True),)
+
+    email: Mapped[str] = mapped_column()
+    posts: Mapped[list["SoftPost"]] = relationship(default_factory=list, back_populates="author")
+
+
+class SoftPost(DataclassBase, PrimaryKeyMixin, TimestampMixin):
+    __tablename__ = "soft_delete_posts"
+
+    title: Mapped[str] = mapped_column()
+    author_id: Mapped[int | None] = mapped_column(ForeignKey("soft_delete_authors.id"), default=None, init=False)
+    author: Mapped[SoftAuthor | None] = relationship(default=None, back_populates="posts")
+
+
+class SoftEvent(DataclassBase, PrimaryKeyMixin, EpochTimestampMixin):
+    __tablename__ = "soft_delete_events"
+    __table_args__ = (live_index("name", name="ix_soft_delete_events_live_name"),)
+
+    name: Mapped[str] = mapped_column()
+
+
+@pytest.fixture
+def session_factory() -> Iterator[sessionmaker[Session]]:
+    engine = create_engine("sqlite:///:memory:")
+    DataclassBase.metadata.create_all(engine)
+    factory = sessionmaker(engine)
+    enable_soft_delete_filter(factory)
+    with factory() as session:
+        live = SoftAuthor(email="live@example.com")
+        deleted = SoftAuthor(email="deleted@example.com")
+        live.posts.extend([SoftPost(title="kept"), SoftPost(title="removed")])
+        session.add_all([live, deleted, SoftEvent(name="live"), SoftEvent(name="deleted")])
+        session.flush()
+        deleted.mark_deleted()
+        live.posts[1].mark_deleted()
+        session.scalars(select(SoftEvent).where(SoftEvent.name == "deleted")).one().mark_deleted()
+        session.commit()
+    try:
+        yield factory
+    finally:
+        engine.dispose()
+
+
+def test_queries_hide_deleted_rows(session_factory: sessionmaker[Session]) -> None:
+    with session_factory() as session:
+        assert session.scalars(select(SoftAuthor.email)).all() == ["live@example.com"]
+        assert session.scalars(select(SoftEvent.name)).all() == ["live"]
+
+
+def test_relationship_loads_hide_deleted_rows(session_factory: sessionmaker[Session]) -> None:
+    with session_factory() as session:
+        author = session.scalars(select(SoftAuthor)).one()
+        assert [post.title for post in author.posts] == ["kept"]
+
+    with session_factory() as session:
+        author = session.scalars(select(SoftAuthor).options(selectinload(SoftAuthor.posts))).one()
+        assert [post.title for post in author.posts] == ["kept"]
+
+    with session_factory() as session:
+        author = SoftAuthor(email="new@example.com")
+        author.posts.extend([SoftPost(title="live2"), SoftPost(title="dead2")])
+        session.add(author)
+        session.flush()
+        author.posts[1].mark_deleted()
+        session.flush()
+        session.expire(author, ["posts"])
+        assert [post.title for post in author.posts] == ["live2"]
+
+
+def test_relationship_loads_follow_include_deleted(session_factory: sessionmaker[Session]) -> None:
+    with session_factory() as session:
+        statement = select(SoftAuthor).where(SoftAuthor.email == "live@example.com")
+        author = session.scalars(statement.execution_options(include_deleted=True)).one()
+        assert sorted(post.title for post in author.posts) == ["kept", "removed"]
+
+
+def test_include_deleted_execution_option(session_factory: sessionmaker[Session]) -> None:
+    with session_factory() as session:
+        statement = select(SoftAuthor.email).order_by(SoftAuthor.email).execution_options(include_deleted=True)
+        assert session.scalars(statement).all() == ["deleted@example.com", "live@example.com"]
+
+
+def test_include_deleted_session_info(session_factory: sessionmaker[Session]) -> None:
+    with session_factory(info={"include_deleted": True}) as session:
+        assert len(session.scalars(select(SoftPost)).all()) == 2
+
+
+def test_refresh_still_loads_deleted_row(session_factory: sessionmaker[Session]) -> None:
+    with session_factory() as session:
+        author = session.scalars(select(SoftAuthor)).one()
+        author.mark_deleted()
+        session.commit()
+        session.refresh(author)
+
+        assert author.deleted_at is not None
+        assert session.scalars(select(SoftAuthor)).all() == []
+
+
+def test_filter_is_opt_in(session_factory: sessionmaker[Session]) -> None:
+    enable_soft_delete_filter(session_factory)
+    disable_soft_delete_filter(session_factory)
+    with session_factory() as session:
+        assert len(session.scalars(select(SoftAuthor)).all()) == 2
+
+
+def test_live_index_reuses_deleted_unique_values(session_factory: sessionmaker[Session]) -> None:
+    with session_factory() as session:
+        session.add(SoftAuthor(email="deleted@example.com"))
+        session.commit()
+
+
+def test_live_index_ddl() -> None:
+    index = next(iter(SoftAuthor.__table__.indexes))
+    event_index = next(iter(SoftEvent.__table__.indexes))
+
+    assert index.name == "ix_soft_delete_authors_email_live"
+    assert event_index.name == "ix_soft_delete_events_live_name"
+    assert str(CreateIndex(index).compile(dialect=postgres_dialect())) == (
+        "CREATE UNIQUE INDEX ix_soft_delete_authors_email_live ON soft_delete_authors (email) WHERE deleted_at IS NULL"
+    )
+    assert str(CreateIndex(index).compile(dialect=sqlite_dialect())).endswith("WHERE deleted_at IS NULL")
+
+
+def test_live_index_requires_columns() -> None:
+    with pytest.raises(ValueError, match="at least one column"):
+        live_index()
+
+
+def test_filter_on_session_instance() -> None:
+    engine: Engine = create_engine("sqlite:///:memory:")
+    DataclassBase.metadata.create_all(engine)
+    with Session(engine) as session:
+        event = SoftEvent(name="gone")
+        session.add(event)
+        session.flush()
+        event.mark_deleted()
+        session.commit()
+
+        enable_soft_delete_filter(session)
+        assert session.scalars(select(SoftEvent)).all() == []
+    engine.dispose()
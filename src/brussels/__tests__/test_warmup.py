@@ -0,0 +1,123 @@
+import asyncio
+import enum
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from sqlalchemy import Engine, Enum, create_engine, func, select
+from sqlalchemy.orm import DeclarativeBase, Mapped, MappedAsDataclass, Session, mapped_column, validates
+from sqlalchemy.pool import StaticPool
+
+from brussels.engine import async_engine_from_preset
+from brussels.mixins import PrimaryKeyMixin, TimestampMixin
+from brussels.types import Json
+from brussels.warmup import async_warm_up, warm_up
+
+
+class Colour(enum.Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+class WarmBase(DeclarativeBase):
+    pass
+
+
+class WarmDataclassBase(MappedAsDataclass, DeclarativeBase):
+    pass
+
+
+class WarmArticle(WarmDataclassBase, PrimaryKeyMixin, TimestampMixin):
+    __tablename__ = "warm_articles"
+
+    title: Mapped[str] = mapped_column()
+    body: Mapped[str | None] = mapped_column(default=None)
+
+
+class WarmSetting(WarmBase):
+    __tablename__ = "warm_settings"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    colour: Mapped[Colour] = mapped_column(Enum(Colour))
+    options: Mapped[dict[str, Any]] = mapped_column(Json)
+
+
+class WarmStrict(WarmBase):
+    __tablename__ = "warm_stricts"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    code: Mapped[str] = mapped_column()
+
+    @validates("code")
+    def _validate_code(self, _key: str, value: str) -> str:
+        if not value:
+            msg = "code is required"
+            raise ValueError(msg)
+        return value
+
+
+@pytest.fixture
+def engine() -> Iterator[Engine]:
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    WarmBase.metadata.create_all(engine)
+    WarmDataclassBase.metadata.create_all(engine)
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
+def test_warm_up_reports_each_step(engine: Engine) -> None:
+    report = warm_up(WarmBase, engine)
+
+    assert [step.name for step in report.steps] == ["configure_mappers", "connect", "WarmSetting", "WarmStrict"]
+    assert report.steps[2].statements == 4
+    assert report.total_seconds == pytest.approx(sum(step.seconds for step in report.steps))
+
+
+def test_warm_up_skips_failing_operations(engine: Engine) -> None:
+    report = warm_up(WarmBase, engine)
+
+    strict = next(step for step in report.steps if step.name == "WarmStrict")
+    # The validator rejects the placeholder code, so only get() and the delete run.
+    assert strict.statements == 2
+
+
+def test_warm_up_fills_caches_without_writing(engine: Engine) -> None:
+    mapper = WarmArticle.__mapper__
+    warm_up(WarmDataclassBase, engine)
+    engine_cache = len(engine._compiled_cache)  # type: ignore[arg-type]
+    mapper_cache = len(mapper._compiled_cache)
+
+    with Session(engine) as session:
+        assert session.scalar(select(func.count()).select_from(WarmArticle)) == 0
+        engine_cache += 1
+        assert len(engine._compiled_cache) == engine_cache  # type: ignore[arg-type]
+
+        article = WarmArticle(title="hello")
+        session.add(article)
+        session.flush()
+        session.delete(article)
+        session.flush()
+        session.expunge_all()
+        assert session.get(WarmArticle, article.id) is None
+
+        assert len(mapper._compiled_cache) == mapper_cache
+        assert len(engine._compiled_cache) == engine_cache  # type: ignore[arg-type]
+
+
+def test_async_warm_up(tmp_path: Path) -> None:
+    pytest.importorskip("aiosqlite")
+
+    async def run() -> list[tuple[str, int]]:
+        engine = async_engine_from_preset(f"sqlite:///{tmp_path / 'warm.db'}", "test")
+        try:
+            async with engine.begin() as connection:
+                await connection.run_sync(WarmBase.metadata.create_all)
+            report = await async_warm_up(WarmBase, engine)
+        finally:
+            await engine.dispose()
+        return [(step.name, step.statements) for step in report.steps]
+
+    assert asyncio.run(run()) == [("configure_mappers", 0), ("connect", 0), ("WarmSetting", 4), ("WarmStrict", 2)]
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import zlib
+from typing import Any
+
+import pytest
+from sqlalchemy import JSON, LargeBinary, create_engine, text
+from sqlalchemy.dialects.postgresql import dialect as postgres_dialect
+from sqlalchemy.orm import Mapped, Session, mapped_column
+
+from brussels.base import Base
+from brussels.types import CompressedJson
+from brussels.types.compressed_json import FORMAT_RAW, FORMAT_ZLIB, FORMAT_ZSTD, CompressionInfo
+
+LARGE_DOCUMENT = {"items": [{"id": index, "name": f"item-{index}", "tags": ["a", "b"]} for index in range(100)]}
+
+
+class CompressedDocument(Base):
+    __tablename__ = "compressed_json_documents"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    payload: Mapped[Any] = mapped_column(CompressedJson(threshold=64))
+
+
+def test_impl_is_binary() -> None:
+    assert CompressedJson.cache_ok is True
+    assert isinstance(CompressedJson().impl_instance, LargeBinary)
+    assert CompressedJson().compile(dialect=postgres_dialect()) == "BYTEA"
+
+
+def test_none_round_trips_as_null() -> None:
+    compressed = CompressedJson()
+
+    assert compressed.process_bind_param(None, None) is None
+    assert compressed.process_result_value(None, None) is None
+
+
+def test_json_null_is_stored_as_json_null() -> None:
+    compressed = CompressedJson()
+
+    stored = compressed.process_bind_param(JSON.NULL, None)
+    assert stored == bytes([FORMAT_RAW]) + b"null"
+    assert compressed.process_result_value(stored, None) is None
+
+
+def test_small_documents_are_stored_raw() -> None:
+    compressed = CompressedJson(threshold=1024)
+
+    stored = compressed.process_bind_param({"a": 1}, None)
+
+    assert stored == bytes([FORMAT_RAW]) + b'{"a": 1}'
+    assert compressed.process_result_value(stored, None) == {"a": 1}
+
+
+@pytest.mark.parametrize(("algorithm", "header"), [("zlib", FORMAT_ZLIB), ("zstd", FORMAT_ZSTD)])
+def test_large_documents_are_compressed(algorithm: str, header: int) -> None:
+    if algorithm == "zstd":
+        pytest.importorskip("zstandard")
+    compressed = CompressedJson(algorithm=algorithm, threshold=64)  # type: ignore[arg-type]
+
+    stored = compressed.process_bind_param(LARGE_DOCUMENT, None)
+
+    assert stored is not None
+    assert stored[0] == header
+    assert compressed.process_result_value(stored, None) == LARGE_DOCUMENT
+
+
+def test_incompressible_documents_are_stored_raw() -> None:
+    compressed = CompressedJson(threshold=0)
+
+    stored = compressed.process_bind_param("x", None)
+
+    assert stored == bytes([FORMAT_RAW]) + b'"x"'
+    assert compressed.compression_info().compressed == 0
+
+
+def test_reads_all_formats_regardless_of_configured_algorithm() -> None:
+    reader = CompressedJson(algorithm="zlib")
+    plain = b'{"plain": true}'
+
+    assert reader.process_result_value(bytes([FORMAT_RAW]) + plain, None) == {"plain": True}
+    assert reader.process_result_value(bytes([FORMAT_ZLIB]) + zlib.compress(plain), None) == {"plain": True}
+    assert reader.process_result_value(plain, None) == {"plain": True}
+    assert reader.process_result_value(memoryview(plain), None) == {"plain": True}
+    assert reader.process_result_value(plain.decode(), None) == {"plain": True}
+
+
+def test_raises_on_corrupt_compressed_value() -> None:
+    with pytest.raises(ValueError, match="failed to decompress zlib value"):
+        CompressedJson().process_result_value(bytes([FORMAT_ZLIB]) + b"not zlib", None)
+
+
+def test_rejects_invalid_settings() -> None:
+    with pytest.raises(ValueError, match="algorithm must be one of"):
+        CompressedJson(algorithm="lz4")  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="threshold must be zero or positive"):
+        CompressedJson(threshold=-1)
+
+
+def test_compression_info_reports_ratio() -> None:
+    compressed = CompressedJson(threshold=64)
+
+    assert compressed.compression_info() == CompressionInfo(0, 0, 0, 0)
+    assert compressed.compression_info().ratio == 1.0
+
+    compressed.process_bind_param(LARGE_DOCUMENT, None)
+    compressed.process_bind_param({"a": 1}, None)
+    info = compressed.compression_info()
+
+    assert info.values == 2
+    assert info.compressed == 1
+    assert info.raw_bytes > info.stored_bytes
+    assert info.ratio > 5
+
+    compressed.reset_compression_info()
+    assert compressed.compression_info() == CompressionInfo(0, 0, 0, 0)
+
+
+def test_orm_round_trip_stores_compressed_bytes() -> None:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    try:
+        with Session(engine) as session:
+            session.add(CompressedDocument(id=1, payload=LARGE_DOCUMENT))
+            session.commit()
+            session.expunge_all()
+
+            assert session.get_one(CompressedDocument, 1).payload == LARGE_DOCUMENT
+            raw_value = session.execute(text("SELECT payload FROM compressed_json_documents")).scalar_one()
+            assert raw_value[0] == FORMAT_ZLIB
+    finally:
+        engine.dispose()
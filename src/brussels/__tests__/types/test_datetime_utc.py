@@ -3,10 +3,14 @@ from __future__ import annotations
 from datetime import UTC, date, datetime, timedelta, timezone
 
 import pytest
-from sqlalchemy import DateTime
+from sqlalchemy import BigInteger, DateTime
+from sqlalchemy.dialects.postgresql import dialect as postgres_dialect
+from sqlalchemy.dialects.postgresql.asyncpg import dialect as asyncpg_dialect
+from sqlalchemy.dialects.postgresql.psycopg import dialect as psycopg_dialect
 from sqlalchemy.dialects.sqlite import dialect as sqlite_dialect
 
-from brussels.types import DateTimeUTC
+from brussels.types import DateTimeUTC, EpochDateTimeUTC
+from brussels.types.datetime_utc import TIMESTAMPTZ_OID
 
 
 def test_process_bind_param_returns_none() -> None:
@@ -92,3 +96,100 @@ def test_static_attributes() -> None:
     assert DateTimeUTC.cache_ok is True
     assert isinstance(DateTimeUTC.impl, DateTime)
     assert DateTimeUTC.impl.timezone is True
+
+
+def test_processors_return_utc_values_unchanged() -> None:
+    value = datetime(2024, 1, 1, 12, 0, tzinfo=UTC)
+    bind = DateTimeUTC().bind_processor(postgres_dialect())
+    result = DateTimeUTC().result_processor(psycopg_dialect(), None)
+
+    assert bind is not None
+    assert result is not None
+    assert bind(value) is value
+    assert result(value) is value
+    assert result(None) is None
+
+
+def test_asyncpg_skips_result_processing_for_timestamptz_only() -> None:
+    dialect = asyncpg_dialect()
+    impl = DateTimeUTC().dialect_impl(dialect)
+
+    assert impl.result_processor(dialect, TIMESTAMPTZ_OID) is None
+    naive = impl.result_processor(dialect, 1114)
+    assert naive is not None
+    assert naive(datetime(2024, 1, 1, 12, 0)) == datetime(2024, 1, 1, 12, 0, tzinfo=UTC)
+    assert naive(datetime(2024, 1, 1, 12, 0)).tzinfo is UTC
+
+
+def test_sqlite_processors_compose_with_string_storage() -> None:
+    dialect = sqlite_dialect()
+    impl = DateTimeUTC().dialect_impl(dialect)
+    bind = impl.bind_processor(dialect)
+    result = impl.result_processor(dialect, None)
+
+    assert bind is not None
+    assert result is not None
+    stored = bind(datetime(2024, 1, 1, 12, 0, tzinfo=timezone(timedelta(hours=2))))
+    assert stored == "2024-01-01 10:00:00.000000"
+    assert result(stored) == datetime(2024, 1, 1, 10, 0, tzinfo=UTC)
+    assert result(stored).tzinfo is UTC
+
+
+def test_bind_processor_rejects_non_datetime() -> None:
+    bind = DateTimeUTC().bind_processor(sqlite_dialect())
+
+    assert bind is not None
+    with pytest.raises(TypeError, match="DateTimeUTC requires datetime object"):
+        bind(date(2024, 1, 1))
+
+
+def test_epoch_storage_uses_bigint() -> None:
+    assert isinstance(EpochDateTimeUTC().dialect_impl(sqlite_dialect()).impl_instance, BigInteger)
+    assert EpochDateTimeUTC().python_type is datetime
+
+
+@pytest.mark.parametrize(
+    ("value", "stored"),
+    [
+        (datetime(1970, 1, 1, tzinfo=UTC), 0),
+        (datetime(2024, 1, 1, 12, 0, 0, 123456, tzinfo=UTC), 1_704_110_400_123_456),
+        (datetime(2024, 1, 1, 14, 0, tzinfo=timezone(timedelta(hours=2))), 1_704_110_400_000_000),
+        (datetime(2024, 1, 1, 12, 0), 1_704_110_400_000_000),  # noqa: DTZ001
+        (datetime(1969, 12, 31, 23, 59, 59, 999999, tzinfo=UTC), -1),
+        (datetime(9999, 12, 31, 23, 59, 59, 999999, tzinfo=UTC), 253_402_300_799_999_999),
+    ],
+)
+def test_epoch_round_trip_is_exact(value: datetime, stored: int) -> None:
+    dialect = sqlite_dialect()
+    impl = EpochDateTimeUTC().dialect_impl(dialect)
+    bind = impl.bind_processor(dialect)
+    result = impl.result_processor(dialect, None)
+
+    assert bind is not None
+    assert result is not None
+    assert bind(value) == stored
+    loaded = result(stored)
+    assert loaded == value.replace(tzinfo=value.tzinfo or UTC)
+    assert loaded.tzinfo is UTC
+
+
+def test_epoch_passes_none_through() -> None:
+    assert EpochDateTimeUTC().process_bind_param(None, None) is None
+    assert EpochDateTimeUTC().process_result_value(None, None) is None
+
+
+def test_epoch_rejects_non_datetime() -> None:
+    with pytest.raises(TypeError, match="DateTimeUTC requires datetime object"):
+        EpochDateTimeUTC().process_bind_param(date(2024, 1, 1), None)  # type: ignore[arg-type]
+
+
+def test_epoch_preserves_ordering() -> None:
+    values = [
+        datetime(1960, 5, 1, tzinfo=UTC),
+        datetime(2024, 1, 1, tzinfo=UTC),
+        datetime(2024, 1, 1, 0, 0, 0, 1, tzinfo=UTC),
+        datetime(2038, 1, 19, 3, 14, 8, tzinfo=UTC),
+    ]
+    stored = [EpochDateTimeUTC().process_bind_param(value, None) for value in values]
+
+    assert stored == sorted(stored)  # type: ignore[type-var]
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import Engine, LargeBinary, create_engine, select, text
+from sqlalchemy.dialects.postgresql import dialect as postgres_dialect
+from sqlalchemy.orm import Mapped, Session, mapped_column
+
+from brussels.base import Base
+
+try:
+    from brussels.types import EncryptedBinaryString, EncryptedString, LazyEncryptedBinaryString, LazySecret
+    from brussels.types.encrypted_binary import FORMAT_AES_GCM, FORMAT_CHACHA20_POLY1305, FORMAT_FERNET
+except ImportError:
+    pytest.skip("cryptography optional dependency not installed", allow_module_level=True)
+
+MODEL_KEY = "MDEyMzQ1Njc4OWFiY2RlZjAxMjM0NTY3ODlhYmNkZWY="
+ROTATED_KEY = "FC-c_21-lM4W6v8kWngjNjVj8T0ohgYVgSS_6G1iD2M="
+
+
+class EncryptedBinaryRecord(Base):
+    __tablename__ = "encrypted_binary_records"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    secret: Mapped[str] = mapped_column(EncryptedBinaryString(key=MODEL_KEY))
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite:///:memory:")
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
+def test_impl_is_binary() -> None:
+    assert isinstance(EncryptedBinaryString.impl, LargeBinary)
+    assert EncryptedBinaryString(key=MODEL_KEY).compile(dialect=postgres_dialect()) == "BYTEA"
+
+
+@pytest.mark.parametrize(
+    ("algorithm", "header"),
+    [("fernet", FORMAT_FERNET), ("aes-gcm", FORMAT_AES_GCM), ("chacha20-poly1305", FORMAT_CHACHA20_POLY1305)],
+)
+def test_round_trip_writes_versioned_header(algorithm: str, header: int) -> None:
+    encrypted = EncryptedBinaryString(key=MODEL_KEY, algorithm=algorithm)  # type: ignore[arg-type]
+
+    ciphertext = encrypted.process_bind_param("top-secret", None)
+
+    assert isinstance(ciphertext, bytes)
+    assert ciphertext[0] == header
+    assert encrypted.process_result_value(ciphertext, None) == "top-secret"
+
+
+def test_binary_ciphertext_is_smaller_than_fernet_text() -> None:
+    text_type = EncryptedString(key=MODEL_KEY)
+    fernet_binary = EncryptedBinaryString(key=MODEL_KEY, algorithm="fernet")
+    aead_binary = EncryptedBinaryString(key=MODEL_KEY)
+    plaintext = "x" * 100
+
+    text_size = len(text_type.process_bind_param(plaintext, None) or "")
+    fernet_size = len(fernet_binary.process_bind_param(plaintext, None) or b"")
+    aead_size = len(aead_binary.process_bind_param(plaintext, None) or b"")
+
+    assert aead_size < fernet_size < text_size
+
+
+def test_reads_every_format_and_legacy_fernet_tokens() -> None:
+    reader = EncryptedBinaryString(key=MODEL_KEY, algorithm="chacha20-poly1305")
+    legacy = EncryptedString(key=MODEL_KEY).process_bind_param("legacy", None)
+    assert legacy is not None
+
+    assert reader.process_result_value(legacy.encode("ascii"), None) == "legacy"
+    assert reader.process_result_value(legacy, None) == "legacy"
+    for algorithm in ("fernet", "aes-gcm"):
+        writer = EncryptedBinaryString(key=MODEL_KEY, algorithm=algorithm)  # type: ignore[arg-type]
+        assert reader.process_result_value(writer.process_bind_param(algorithm, None), None) == algorithm
+
+
+def test_lazy_binary_values_reveal_on_use() -> None:
+    encrypted = LazyEncryptedBinaryString(key=MODEL_KEY, algorithm="chacha20-poly1305")
+    ciphertext = encrypted.process_bind_param("secret", None)
+
+    assert isinstance(encrypted.impl_instance, LargeBinary)
+    assert ciphertext is not None
+    assert ciphertext[0] == FORMAT_CHACHA20_POLY1305
+    lazy_value = encrypted.process_result_value(ciphertext, None)
+    assert isinstance(lazy_value, LazySecret)
+    assert lazy_value.reveal() == "secret"
+    assert EncryptedBinaryString(key=MODEL_KEY).process_bind_param(lazy_value, None) == ciphertext  # type: ignore[arg-type]
+
+
+def test_rejects_unknown_algorithm() -> None:
+    with pytest.raises(ValueError, match="algorithm must be one of"):
+        EncryptedBinaryString(key=MODEL_KEY, algorithm="rot13")  # type: ignore[arg-type]
+
+
+def test_rejects_non_bytes_ciphertext() -> None:
+    with pytest.raises(TypeError, match="expected bytes ciphertext"):
+        EncryptedBinaryString(key=MODEL_KEY).process_result_value(1, None)
+
+
+@pytest.mark.parametrize("ciphertext", [b"", b"\x7fjunk", b"\x02" + b"\x00" * 40])
+def test_raises_on_malformed_ciphertext(ciphertext: bytes) -> None:
+    with pytest.raises(ValueError, match="failed to decrypt value"):
+        EncryptedBinaryString(key=MODEL_KEY).process_result_value(ciphertext, None)
+
+
+def test_raises_with_wrong_key() -> None:
+    ciphertext = EncryptedBinaryString(key=MODEL_KEY).process_bind_param("secret", None)
+
+    with pytest.raises(ValueError, match="failed to decrypt value"):
+        EncryptedBinaryString(key=ROTATED_KEY).process_result_value(ciphertext, None)
+
+
+def test_rotation_upgrades_format_and_key() -> None:
+    old_aead = EncryptedBinaryString(key=MODEL_KEY).process_bind_param("aead", None)
+    legacy = (EncryptedString(key=MODEL_KEY).process_bind_param("legacy", None) or "").encode("ascii")
+    rotated = EncryptedBinaryString(key=[ROTATED_KEY, MODEL_KEY])
+    new_only = EncryptedBinaryString(key=ROTATED_KEY)
+
+    assert old_aead is not None
+    for ciphertext, plaintext in ((old_aead, "aead"), (legacy, "legacy")):
+        assert rotated.needs_rotation(ciphertext) is True
+        upgraded = rotated.rotate(ciphertext)
+        assert rotated.needs_rotation(upgraded) is False
+        assert new_only.process_result_value(upgraded, None) == plaintext
+
+
+def test_orm_round_trip_stores_bytes_at_rest(engine: Engine) -> None:
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.add(EncryptedBinaryRecord(id=1, secret="db-value"))
+        session.commit()
+
+        assert session.scalar(select(EncryptedBinaryRecord.secret)) == "db-value"
+        raw_value = session.execute(text("SELECT secret FROM encrypted_binary_records")).scalar_one()
+        assert isinstance(raw_value, bytes)
+        assert raw_value[0] == FORMAT_AES_GCM
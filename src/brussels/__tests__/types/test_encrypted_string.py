@@ -1,14 +1,37 @@
 from __future__ import annotations
 
 import pytest
-from sqlalchemy import Engine, create_engine, text
+from sqlalchemy import (
+    Column,
+    ColumnElement,
+    Engine,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Text,
+    bindparam,
+    create_engine,
+    insert,
+    select,
+    text,
+    type_coerce,
+    update,
+)
 from sqlalchemy.dialects.sqlite import dialect as sqlite_dialect
 from sqlalchemy.orm import Mapped, Session, mapped_column
 
-from brussels.base import Base
+from brussels.base import Base, DataclassBase
 
 try:
-    from brussels.types import EncryptedString
+    from brussels.types import EncryptedString, blind_index_column, encrypted_string as encrypted_string_module
+    from brussels.types.encrypted_string import (
+        BLIND_INDEX_INFO_KEY,
+        CacheInfo,
+        LazyEncryptedString,
+        LazySecret,
+        decrypt_rows,
+    )
 except ImportError:
     pytest.skip("cryptography optional dependency not installed", allow_module_level=True)
 
@@ -160,3 +183,472 @@ def test_orm_round_trip_stores_ciphertext_at_rest(engine: Engine) -> None:
         ).scalar_one()
         assert isinstance(raw_value, str)
         assert raw_value != plaintext
+
+
+def test_cache_is_disabled_by_default() -> None:
+    encrypted = EncryptedString(key=MODEL_KEY)
+    ciphertext = encrypted.process_bind_param("secret", None)
+
+    assert encrypted.process_result_value(ciphertext, None) == "secret"
+    assert encrypted.cache_info() == CacheInfo(0, 0, 0, 0)
+
+
+def test_cache_counts_hits_and_misses() -> None:
+    encrypted = EncryptedString(key=MODEL_KEY, cache_size=4)
+    ciphertext = encrypted.process_bind_param("secret", None)
+
+    assert encrypted.process_result_value(ciphertext, None) == "secret"
+    assert encrypted.process_result_value(ciphertext, None) == "secret"
+    assert encrypted.cache_info() == CacheInfo(hits=1, misses=1, maxsize=4, currsize=1)
+
+
+def test_cache_skips_decryption_on_hit(monkeypatch: pytest.MonkeyPatch) -> None:
+    encrypted = EncryptedString(key=MODEL_KEY, cache_size=4)
+    ciphertext = encrypted.process_bind_param("secret", None)
+    encrypted.process_result_value(ciphertext, None)
+
+    def fail(_value: str) -> str:
+        raise AssertionError
+
+    monkeypatch.setattr(encrypted, "_decrypt", fail)
+    assert encrypted.process_result_value(ciphertext, None) == "secret"
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    encrypted = EncryptedString(key=MODEL_KEY, cache_size=2)
+    first, second, third = (encrypted.process_bind_param(value, None) for value in ("a", "b", "c"))
+
+    encrypted.process_result_value(first, None)
+    encrypted.process_result_value(second, None)
+    encrypted.process_result_value(first, None)
+    encrypted.process_result_value(third, None)
+    encrypted.process_result_value(second, None)
+
+    assert encrypted.cache_info() == CacheInfo(hits=1, misses=4, maxsize=2, currsize=2)
+
+
+def test_cache_expires_entries_after_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr(encrypted_string_module.time, "monotonic", lambda: now[0])
+    encrypted = EncryptedString(key=MODEL_KEY, cache_size=2, cache_ttl=10)
+    ciphertext = encrypted.process_bind_param("secret", None)
+
+    encrypted.process_result_value(ciphertext, None)
+    now[0] += 5
+    encrypted.process_result_value(ciphertext, None)
+    now[0] += 10
+    encrypted.process_result_value(ciphertext, None)
+
+    assert encrypted.cache_info() == CacheInfo(hits=1, misses=2, maxsize=2, currsize=1)
+
+
+def test_cache_clear_resets_entries_and_counters() -> None:
+    encrypted = EncryptedString(key=MODEL_KEY, cache_size=2)
+    ciphertext = encrypted.process_bind_param("secret", None)
+    encrypted.process_result_value(ciphertext, None)
+
+    encrypted.cache_clear()
+
+    assert encrypted.cache_info() == CacheInfo(hits=0, misses=0, maxsize=2, currsize=0)
+
+
+@pytest.mark.parametrize(("cache_size", "cache_ttl", "message"), [(-1, None, "cache_size"), (1, 0, "cache_ttl")])
+def test_constructor_rejects_invalid_cache_settings(cache_size: int, cache_ttl: float | None, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        EncryptedString(key=MODEL_KEY, cache_size=cache_size, cache_ttl=cache_ttl)
+
+
+def test_cache_is_shared_with_dialect_result_processor() -> None:
+    encrypted = EncryptedString(key=MODEL_KEY, cache_size=2)
+    processor = encrypted.dialect_impl(sqlite_dialect()).result_processor(sqlite_dialect(), None)
+    ciphertext = encrypted.process_bind_param("secret", None)
+
+    assert processor is not None
+    processor(ciphertext)
+    processor(ciphertext)
+
+    assert encrypted.cache_info().hits == 1
+
+
+def test_decrypt_many_preserves_order_across_chunks() -> None:
+    encrypted = EncryptedString(key=MODEL_KEY)
+    plaintexts = [f"secret-{index}" if index % 7 else None for index in range(50)]
+    ciphertexts = [encrypted.process_bind_param(value, None) for value in plaintexts]
+
+    assert encrypted.decrypt_many(ciphertexts, chunk_size=4, max_workers=3) == plaintexts
+
+
+def test_decrypt_many_raises_first_error_in_input_order() -> None:
+    encrypted = EncryptedString(key=MODEL_KEY)
+    ciphertexts: list[str | None] = [encrypted.process_bind_param("ok", None) for _ in range(10)]
+    ciphertexts[3] = "not-a-valid-token"
+    ciphertexts[8] = 1  # type: ignore[call-overload]
+
+    with pytest.raises(ValueError, match="failed to decrypt value"):
+        encrypted.decrypt_many(ciphertexts, chunk_size=2)
+
+
+def test_decrypt_many_rejects_invalid_chunk_size() -> None:
+    encrypted = EncryptedString(key=MODEL_KEY)
+    with pytest.raises(ValueError, match="chunk_size"):
+        encrypted.decrypt_many([], chunk_size=0)
+
+
+def test_decrypt_rows_streams_raw_ciphertext_result(engine: Engine) -> None:
+    Base.metadata.create_all(engine)
+    encrypted_type = EncryptedRecord.__table__.c.secret.type
+
+    with Session(engine) as session:
+        session.add_all([EncryptedRecord(id=index, secret=f"secret-{index}") for index in range(1, 26)])
+        session.commit()
+
+        statement = select(EncryptedRecord.id, type_coerce(EncryptedRecord.secret, Text())).order_by(EncryptedRecord.id)
+        rows = session.execute(statement).yield_per(10)
+        decrypted = list(decrypt_rows(rows, {1: encrypted_type}, batch_size=10, chunk_size=3))
+
+    assert decrypted == [(index, f"secret-{index}") for index in range(1, 26)]
+
+
+ROTATED_KEY = "FC-c_21-lM4W6v8kWngjNjVj8T0ohgYVgSS_6G1iD2M="
+
+
+def test_key_list_encrypts_with_primary_and_decrypts_with_any() -> None:
+    old = EncryptedString(key=MODEL_KEY)
+    rotated = EncryptedString(key=[ROTATED_KEY, MODEL_KEY])
+    new_only = EncryptedString(key=ROTATED_KEY)
+
+    old_ciphertext = old.process_bind_param("secret", None)
+    new_ciphertext = rotated.process_bind_param("secret", None)
+
+    assert rotated.process_result_value(old_ciphertext, None) == "secret"
+    assert new_only.process_result_value(new_ciphertext, None) == "secret"
+
+
+def test_constructor_rejects_empty_key_list() -> None:
+    with pytest.raises(ValueError, match="at least one key"):
+        EncryptedString(key=[])
+
+
+def test_constructor_rejects_malformed_key_in_list() -> None:
+    with pytest.raises(ValueError, match="valid Fernet key"):
+        EncryptedString(key=[MODEL_KEY, "bad-key"])
+
+
+def test_needs_rotation_and_rotate() -> None:
+    old = EncryptedString(key=MODEL_KEY)
+    rotated = EncryptedString(key=[ROTATED_KEY, MODEL_KEY])
+    old_ciphertext = old.process_bind_param("secret", None)
+    assert old_ciphertext is not None
+
+    assert rotated.needs_rotation(old_ciphertext) is True
+    new_ciphertext = rotated.rotate(old_ciphertext)
+    assert rotated.needs_rotation(new_ciphertext) is False
+    assert EncryptedString(key=ROTATED_KEY).process_result_value(new_ciphertext, None) == "secret"
+
+
+def test_rotate_raises_on_unknown_key() -> None:
+    rotated = EncryptedString(key=[ROTATED_KEY])
+    ciphertext = EncryptedString(key=MODEL_KEY).process_bind_param("secret", None)
+    assert ciphertext is not None
+
+    with pytest.raises(ValueError, match="failed to decrypt value"):
+        rotated.rotate(ciphertext)
+
+
+BLIND_INDEX_KEY = "blind-index-key"
+
+
+class BlindIndexedRecord(Base):
+    __tablename__ = "blind_indexed_records"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    email: Mapped[str | None] = mapped_column(EncryptedString(key=MODEL_KEY, blind_index_key=BLIND_INDEX_KEY))
+    email_bidx: Mapped[str | None] = blind_index_column("email")
+
+
+def test_blind_index_is_keyed_and_deterministic() -> None:
+    encrypted = EncryptedString(key=MODEL_KEY, blind_index_key=BLIND_INDEX_KEY)
+    other_key = EncryptedString(key=MODEL_KEY, blind_index_key="other-key")
+
+    assert encrypted.blind_index("a@example.com") == encrypted.blind_index("a@example.com")
+    assert encrypted.blind_index("a@example.com") != other_key.blind_index("a@example.com")
+    assert len(encrypted.blind_index("a@example.com")) == 64
+
+
+def test_blind_index_requires_key() -> None:
+    with pytest.raises(ValueError, match="requires blind_index_key"):
+        EncryptedString(key=MODEL_KEY).blind_index("value")
+
+
+def test_blind_index_column_definition() -> None:
+    column = BlindIndexedRecord.__table__.c.email_bidx
+
+    assert column.nullable is True
+    assert any("email_bidx" in index.columns for index in BlindIndexedRecord.__table__.indexes)
+
+
+def test_blind_index_column_tracks_assignment() -> None:
+    record = BlindIndexedRecord(id=1, email="a@example.com")
+    encrypted = BlindIndexedRecord.__table__.c.email.type
+    assert record.email_bidx == encrypted.blind_index("a@example.com")
+
+    record.email = None
+    assert record.email_bidx is None
+
+
+def test_equality_compiles_to_blind_index_lookup() -> None:
+    encrypted = BlindIndexedRecord.__table__.c.email.type
+    statement = select(BlindIndexedRecord.id).where(BlindIndexedRecord.email == "a@example.com")
+    compiled = statement.compile(dialect=sqlite_dialect())
+
+    assert "blind_indexed_records.email_bidx = ?" in str(compiled)
+    assert list(compiled.params.values()) == [encrypted.blind_index("a@example.com")]
+
+
+def test_comparison_without_companion_column_raises() -> None:
+    encrypted = EncryptedString(key=MODEL_KEY, blind_index_key=BLIND_INDEX_KEY)
+    orphan = Table("orphan_secrets", MetaData(), Column("payload", encrypted))
+
+    with pytest.raises(ValueError, match="no blind_index_column"):
+        orphan.c.payload == "value"  # noqa: B015
+
+
+def test_blind_index_queries_round_trip(engine: Engine) -> None:
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.add_all(
+            [
+                BlindIndexedRecord(id=1, email="a@example.com"),
+                BlindIndexedRecord(id=2, email="b@example.com"),
+                BlindIndexedRecord(id=3, email=None),
+            ],
+        )
+        session.commit()
+
+        def ids(*criteria: ColumnElement[bool]) -> list[int]:
+            return list(session.scalars(select(BlindIndexedRecord.id).where(*criteria).order_by(BlindIndexedRecord.id)))
+
+        assert ids(BlindIndexedRecord.email == "b@example.com") == [2]
+        assert ids(BlindIndexedRecord.email != "b@example.com") == [1]
+        assert ids(BlindIndexedRecord.email.in_(["a@example.com", "b@example.com"])) == [1, 2]
+        assert ids(BlindIndexedRecord.email.is_(None)) == [3]
+
+
+class BlindIndexedAccount(DataclassBase):
+    __tablename__ = "blind_indexed_accounts"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    email: Mapped[str | None] = mapped_column(EncryptedString(key=MODEL_KEY, blind_index_key=BLIND_INDEX_KEY))
+    name: Mapped[str] = mapped_column(default="")
+    email_bidx: Mapped[str | None] = blind_index_column("email", init=False, default=None)
+
+
+def _stored_digests(session: Session, model: type[Base]) -> dict[int, str | None]:
+    table = model.__table__
+    return {row.id: row.email_bidx for row in session.execute(select(table.c.id, table.c.email_bidx))}
+
+
+def _digest(value: str) -> str:
+    return EncryptedString(key=MODEL_KEY, blind_index_key=BLIND_INDEX_KEY).blind_index(value)
+
+
+def test_blind_index_column_rejects_default() -> None:
+    with pytest.raises(ValueError, match="do not pass default, insert_default"):
+        blind_index_column("email", default="x", insert_default="y")
+
+
+def test_blind_index_computed_for_bulk_and_core_inserts(engine: Engine) -> None:
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        BlindIndexedRecord.bulk_insert(session, [{"id": 1, "email": "a@example.com"}, {"id": 2, "email": None}])
+        session.execute(insert(BlindIndexedRecord.__table__).values(id=3, email="c@example.com"))
+        session.execute(
+            insert(BlindIndexedRecord.__table__).values(
+                [{"id": 4, "email": "d@example.com"}, {"id": 5, "email": "e@example.com"}],
+            ),
+        )
+
+        assert _stored_digests(session, BlindIndexedRecord) == {
+            1: _digest("a@example.com"),
+            2: None,
+            3: _digest("c@example.com"),
+            4: _digest("d@example.com"),
+            5: _digest("e@example.com"),
+        }
+        matches = session.scalars(select(BlindIndexedRecord.id).where(BlindIndexedRecord.email == "c@example.com"))
+        assert matches.all() == [3]
+
+
+def test_blind_index_follows_bulk_upsert(engine: Engine) -> None:
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        BlindIndexedRecord.bulk_upsert(session, [{"id": 1, "email": "a@example.com"}])
+        BlindIndexedRecord.bulk_upsert(session, [{"id": 1, "email": "b@example.com"}])
+
+        assert _stored_digests(session, BlindIndexedRecord) == {1: _digest("b@example.com")}
+
+
+def test_blind_index_follows_update_statements(engine: Engine) -> None:
+    Base.metadata.create_all(engine)
+    table = BlindIndexedRecord.__table__
+
+    with Session(engine) as session:
+        session.add_all([BlindIndexedRecord(id=1, email="a@example.com"), BlindIndexedRecord(id=2, email="b@")])
+        session.flush()
+
+        session.execute(update(BlindIndexedRecord).where(BlindIndexedRecord.id == 1).values(email="c@example.com"))
+        session.connection().execute(update(table).where(table.c.id == 2).values(email="d@example.com"))
+        assert _stored_digests(session, BlindIndexedRecord) == {
+            1: _digest("c@example.com"),
+            2: _digest("d@example.com"),
+        }
+
+        session.execute(update(BlindIndexedRecord), [{"id": 1, "email": "e@example.com"}, {"id": 2, "email": None}])
+        assert _stored_digests(session, BlindIndexedRecord) == {1: _digest("e@example.com"), 2: None}
+
+        with pytest.raises(ValueError, match="from a SQL expression"):
+            session.execute(update(BlindIndexedRecord).values(email=BlindIndexedRecord.email))
+
+
+def test_blind_index_follows_executemany_bindparams(engine: Engine) -> None:
+    Base.metadata.create_all(engine)
+    table = BlindIndexedRecord.__table__
+    statement = update(table).where(table.c.id == bindparam("_id")).values(email=bindparam("_email"))
+
+    with Session(engine) as session:
+        session.add_all([BlindIndexedRecord(id=1, email="a@example.com"), BlindIndexedRecord(id=2, email="b@")])
+        session.flush()
+
+        connection = session.connection()
+        connection.execute(statement, [{"_id": 1, "_email": "c@example.com"}, {"_id": 2, "_email": None}])
+        assert _stored_digests(session, BlindIndexedRecord) == {1: _digest("c@example.com"), 2: None}
+
+        connection.execute(statement, {"_id": 2, "_email": "d@example.com"})
+        assert _stored_digests(session, BlindIndexedRecord) == {
+            1: _digest("c@example.com"),
+            2: _digest("d@example.com"),
+        }
+
+        with pytest.raises(ValueError, match="no value was passed for '_email'"):
+            connection.execute(statement, {"_id": 1})
+
+
+def test_blind_index_follows_core_updates_without_mappers(engine: Engine) -> None:
+    encrypted = EncryptedString(key=MODEL_KEY, blind_index_key=BLIND_INDEX_KEY)
+    table = Table(
+        "core_blind_indexed",
+        MetaData(),
+        Column("id", Integer, primary_key=True),
+        Column("email", encrypted),
+        Column("email_bidx", String(64), info={BLIND_INDEX_INFO_KEY: "email"}),
+    )
+    table.create(engine)
+
+    with engine.begin() as connection:
+        connection.execute(insert(table).values(id=1, email="a@example.com", email_bidx=_digest("a@example.com")))
+        connection.execute(update(table).values(email="b@example.com"))
+        matches = connection.scalars(select(table.c.id).where(table.c.email == "b@example.com"))
+        assert matches.all() == [1]
+
+
+def test_dataclass_blind_index_set_on_insert_and_kept_on_unrelated_update(engine: Engine) -> None:
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        account = BlindIndexedAccount(id=1, email="a@example.com")
+        session.add(account)
+        session.flush()
+        assert account.email_bidx == _digest("a@example.com")
+
+        account.name = "renamed"
+        session.flush()
+        session.execute(update(BlindIndexedAccount).values(name="again"))
+        assert _stored_digests(session, BlindIndexedAccount) == {1: _digest("a@example.com")}
+
+        account.email = "b@example.com"
+        session.flush()
+        session.expire_all()
+        matches = session.scalars(select(BlindIndexedAccount.id).where(BlindIndexedAccount.email == "b@example.com"))
+        assert matches.all() == [1]
+
+
+class LazyRecord(Base):
+    __tablename__ = "lazy_encrypted_records"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    payload: Mapped[LazySecret | None] = mapped_column(LazyEncryptedString(key=MODEL_KEY))
+    copy: Mapped[LazySecret | None] = mapped_column(LazyEncryptedString(key=MODEL_KEY))
+    plain: Mapped[str | None] = mapped_column(EncryptedString(key=MODEL_KEY), default=None)
+
+
+def test_lazy_result_defers_decryption(monkeypatch: pytest.MonkeyPatch) -> None:
+    encrypted = LazyEncryptedString(key=MODEL_KEY)
+    ciphertext = encrypted.process_bind_param("secret", None)
+    calls: list[str] = []
+    original = EncryptedString._decrypt
+
+    def counting_decrypt(self: EncryptedString, value: str) -> str:
+        calls.append(value)
+        return original(self, value)
+
+    monkeypatch.setattr(EncryptedString, "_decrypt", counting_decrypt)
+    lazy_value = encrypted.process_result_value(ciphertext, None)
+
+    assert isinstance(lazy_value, LazySecret)
+    assert lazy_value.is_revealed is False
+    assert repr(lazy_value) == "<LazySecret encrypted>"
+    assert calls == []
+
+    assert lazy_value.reveal() == "secret"
+    assert str(lazy_value) == "secret"
+    assert lazy_value == "secret"
+    assert len(lazy_value) == len("secret")
+    assert hash(lazy_value) == hash("secret")
+    assert calls == [ciphertext]
+
+
+def test_lazy_decrypt_many_stays_eager() -> None:
+    encrypted = LazyEncryptedString(key=MODEL_KEY)
+    ciphertexts = [encrypted.process_bind_param("a", None), None]
+
+    assert encrypted.decrypt_many(ciphertexts) == ["a", None]
+
+
+def test_lazy_secret_binds_without_reencrypting() -> None:
+    encrypted = LazyEncryptedString(key=MODEL_KEY)
+    ciphertext = encrypted.process_bind_param("secret", None)
+    lazy_value = encrypted.process_result_value(ciphertext, None)
+
+    assert EncryptedString(key=MODEL_KEY).process_bind_param(lazy_value, None) == ciphertext  # type: ignore[arg-type]
+    rebound = EncryptedString(key=ROTATED_KEY).process_bind_param(lazy_value, None)  # type: ignore[arg-type]
+    assert rebound != ciphertext
+    assert EncryptedString(key=ROTATED_KEY).process_result_value(rebound, None) == "secret"
+
+
+def test_lazy_orm_round_trip(engine: Engine) -> None:
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.add(LazyRecord(id=1, payload="db-value", copy=None))
+        session.commit()
+        session.expunge_all()
+
+        record = session.get_one(LazyRecord, 1)
+        assert isinstance(record.payload, LazySecret)
+        assert record.payload.is_revealed is False
+        assert record.payload == "db-value"
+        assert not session.dirty
+
+        record.copy = record.payload
+        record.plain = record.payload
+        session.commit()
+        raw = session.execute(text("SELECT payload, copy, plain FROM lazy_encrypted_records")).one()
+        assert raw.payload == raw.copy == raw.plain
+
+        session.expunge_all()
+        plain = session.get_one(LazyRecord, 1).plain
+        assert isinstance(plain, str)
+        assert plain.upper() == "DB-VALUE"
@@ -0,0 +1,26 @@
+from datetime import datetime
+
+from sqlalchemy import JSON, Integer, LargeBinary, String
+from sqlalchemy.types import NullType
+
+from brussels.types import CompressedJson, DateTimeUTC, EpochDateTimeUTC, Json
+from brussels.types.introspection import is_json, python_type, stored_type
+
+
+def test_stored_type_unwraps_type_decorators() -> None:
+    assert isinstance(stored_type(CompressedJson()), LargeBinary)
+    assert isinstance(stored_type(String()), String)
+
+
+def test_python_type_falls_back_to_stored_type() -> None:
+    assert python_type(Integer()) is int
+    assert python_type(DateTimeUTC()) is datetime
+    assert python_type(EpochDateTimeUTC()) is datetime
+    assert python_type(NullType()) is object
+
+
+def test_is_json() -> None:
+    assert is_json(JSON())
+    assert is_json(Json)
+    assert is_json(CompressedJson())
+    assert not is_json(String())
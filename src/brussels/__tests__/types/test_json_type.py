@@ -1,10 +1,17 @@
 from __future__ import annotations
 
-from sqlalchemy import JSON
+import json
+import sys
+from typing import Any
+
+import pytest
+from sqlalchemy import JSON, create_engine, select
 from sqlalchemy.dialects.postgresql import dialect as postgres_dialect
 from sqlalchemy.dialects.sqlite import dialect as sqlite_dialect
+from sqlalchemy.orm import Mapped, Session, mapped_column
 
-from brussels.types import Json
+from brussels.base import Base
+from brussels.types import Json, JsonCodec, json_codec, json_engine_options, json_type
 
 
 def test_sqlite_variant_is_json() -> None:
@@ -20,3 +27,93 @@ def test_postgres_variant_is_jsonb() -> None:
 def test_sqlite_compile_uses_json() -> None:
     compiled = Json.compile(dialect=sqlite_dialect())
     assert "JSON" in compiled
+
+
+def counting_codec(calls: list[str]) -> JsonCodec:
+    def dumps(value: object) -> str:
+        calls.append("dumps")
+        return json.dumps(value, separators=(",", ":"))
+
+    def loads(value: str | bytes) -> object:
+        calls.append("loads")
+        return json.loads(value)
+
+    return JsonCodec("counting", dumps, loads)
+
+
+class CodecDocument(Base):
+    __tablename__ = "codec_json_documents"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    payload: Mapped[Any] = mapped_column(json_type("json"))
+
+
+def test_json_codec_falls_back_to_stdlib(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    monkeypatch.setitem(sys.modules, "msgspec", None)
+    json_codec.cache_clear()
+    try:
+        assert json_codec().name == "json"
+        with pytest.raises(ModuleNotFoundError):
+            json_codec("orjson")
+    finally:
+        json_codec.cache_clear()
+
+
+def test_json_codec_rejects_unknown_name() -> None:
+    with pytest.raises(ValueError, match="Unknown JSON codec 'yaml'"):
+        json_codec("yaml")
+
+
+def test_json_type_compiles_per_dialect() -> None:
+    assert json_type("json").compile(dialect=postgres_dialect()) == "JSONB"
+    assert json_type("json").compile(dialect=sqlite_dialect()) == "JSON"
+
+
+def test_json_type_processors_use_codec() -> None:
+    calls: list[str] = []
+    codec_type = json_type(counting_codec(calls))
+    dialect = sqlite_dialect()
+
+    bind = codec_type.dialect_impl(dialect).bind_processor(dialect)
+    result = codec_type.dialect_impl(dialect).result_processor(dialect, None)
+
+    assert bind is not None
+    assert result is not None
+    assert bind({"a": [1, 2]}) == '{"a":[1,2]}'
+    assert result('{"a":[1,2]}') == {"a": [1, 2]}
+    assert result(None) is None
+    assert calls == ["dumps", "loads"]
+
+
+def test_json_type_keeps_null_semantics() -> None:
+    dialect = sqlite_dialect()
+    bind = json_type("json").dialect_impl(dialect).bind_processor(dialect)
+    bind_as_null = json_type("json", none_as_null=True).dialect_impl(dialect).bind_processor(dialect)
+
+    assert bind is not None
+    assert bind_as_null is not None
+    assert bind(None) == "null"
+    assert bind(JSON.NULL) == "null"
+    assert bind_as_null(None) is None
+
+
+def test_json_engine_options_expose_codec() -> None:
+    codec = json_codec("json")
+
+    assert json_engine_options(codec) == {"json_serializer": codec.dumps, "json_deserializer": codec.loads}
+
+
+def test_json_type_orm_round_trip() -> None:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    try:
+        with Session(engine) as session:
+            session.add(CodecDocument(id=1, payload={"name": "doc", "tags": ["a", "b"], "size": 2}))
+            session.commit()
+            session.expunge_all()
+
+            assert session.get_one(CodecDocument, 1).payload == {"name": "doc", "tags": ["a", "b"], "size": 2}
+            assert session.scalar(select(CodecDocument.payload["name"].as_string())) == "doc"
+    finally:
+        engine.dispose()
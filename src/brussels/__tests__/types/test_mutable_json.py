@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import pickle
+from typing import Any
+
+import pytest
+from sqlalchemy import Column, Engine, Integer, MetaData, Table, create_engine, event, update
+from sqlalchemy.dialects.postgresql import dialect as postgres_dialect
+from sqlalchemy.orm import Mapped, Session, configure_mappers, mapped_column
+
+from brussels.base import Base
+from brussels.types import MutableJson, TrackedDict, TrackedJson, TrackedList
+from brussels.types.mutable_json import MAX_PATH_UPDATES, _compile_path_updates, path_update_expression
+
+
+class TrackedDocument(Base):
+    __tablename__ = "tracked_json_documents"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    body: Mapped[Any] = mapped_column(MutableJson, nullable=True)
+
+
+class UntrackedDocument(Base):
+    __tablename__ = "untracked_json_documents"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
+def capture_statements(engine: Engine) -> list[tuple[str, Any]]:
+    statements: list[tuple[str, Any]] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def capture(_conn, _cursor, statement, parameters, _context, _executemany) -> None:
+        statements.append((statement, parameters))
+
+    return statements
+
+
+def test_coerce_wraps_nested_containers() -> None:
+    document = TrackedJson.coerce("body", {"a": {"b": [1, {"c": 2}]}})
+
+    assert isinstance(document, TrackedDict)
+    assert isinstance(document["a"], TrackedDict)
+    assert isinstance(document["a"]["b"], TrackedList)
+    assert isinstance(document["a"]["b"][1], TrackedDict)
+    assert isinstance(TrackedJson.coerce("body", [1, 2]), TrackedList)
+    with pytest.raises(ValueError, match="body"):
+        TrackedJson.coerce("body", 1)
+
+
+def test_records_nested_paths() -> None:
+    document = TrackedDict({"a": {"b": 1}, "items": [{"x": 1}], "gone": 1})
+
+    document["a"]["b"] = 2
+    document["items"][0]["x"] = 2
+    del document["gone"]
+    document["items"].append(3)
+
+    assert document.changed_paths == (("a", "b"), ("items", 0, "x"), ("gone",), ("items", 1))
+
+
+def test_structural_list_changes_record_the_list() -> None:
+    document = TrackedDict({"items": [1, 2, 3]})
+
+    document["items"].append(4)
+    document["items"].pop(0)
+
+    assert document.changed_paths == (("items",),)
+
+
+def test_ancestor_paths_absorb_descendants() -> None:
+    document = TrackedDict({"a": {"b": 1, "c": 1}})
+
+    document["a"]["b"] = 2
+    document["a"] = {"fresh": True}
+    document["a"]["fresh"] = False
+
+    assert document.changed_paths == (("a",),)
+
+
+def test_detached_children_are_not_recorded() -> None:
+    document = TrackedDict({"a": {"b": 1}})
+    child = document.pop("a")
+
+    child["b"] = 2
+
+    assert document.changed_paths == (("a",),)
+
+
+def test_assigned_containers_are_copied() -> None:
+    source = {"b": 1}
+    document = TrackedDict()
+
+    document["a"] = source
+    source["b"] = 2
+
+    assert document["a"] == {"b": 1}
+
+
+def test_many_paths_collapse_to_full_rewrite() -> None:
+    document = TrackedDict()
+
+    for index in range(MAX_PATH_UPDATES + 1):
+        document[f"key-{index}"] = index
+
+    assert document.changed_paths == ((),)
+
+
+def test_pickle_round_trips_plain_values() -> None:
+    document = TrackedDict({"a": [1, {"b": 2}]})
+
+    restored = pickle.loads(pickle.dumps(document))  # noqa: S301
+
+    assert restored == document
+    assert isinstance(restored["a"], TrackedList)
+
+
+def test_postgres_compiles_to_jsonb_set_and_delete() -> None:
+    table = Table("docs", MetaData(), Column("id", Integer, primary_key=True), Column("body", MutableJson))
+    document = {"a": {"b": 2}}
+
+    expression = path_update_expression(table.c.body, document, [("a", "b"), ("gone",)], "postgresql")
+    compiled = str(update(table).values(body=expression).compile(dialect=postgres_dialect()))
+
+    assert "jsonb_set(docs.body" in compiled
+    assert "#-" in compiled
+
+
+def test_unsupported_dialect_or_root_path_falls_back() -> None:
+    table = Table("docs", MetaData(), Column("id", Integer, primary_key=True), Column("body", MutableJson))
+
+    assert path_update_expression(table.c.body, {}, [("a",)], "mysql") is None
+    assert path_update_expression(table.c.body, {}, [()], "postgresql") is None
+
+
+def test_sqlite_flush_sends_only_changed_paths(engine: Engine) -> None:
+    with Session(engine) as session:
+        session.add(TrackedDocument(id=1, body={"a": {"b": 1}, "items": [1], "big": "x" * 1000}))
+        session.commit()
+        document = session.get_one(TrackedDocument, 1)
+
+        document.body["a"]["b"] = 2
+        document.body["items"].append({"k": 1})
+        del document.body["big"]
+        statements = capture_statements(engine)
+        session.flush()
+
+        assert len(statements) == 1
+        statement, parameters = statements[0]
+        assert "json_remove(json_set(json_set(tracked_json_documents.body" in statement
+        assert "x" * 1000 not in str(parameters)
+        assert document.body == {"a": {"b": 2}, "items": [1, {"k": 1}]}
+        assert isinstance(document.body, TrackedDict)
+        assert document.body.changed_paths == ()
+        # The document was restored in memory rather than expired and reloaded.
+        assert len(statements) == 1
+
+        session.commit()
+        session.expire_all()
+        assert session.get_one(TrackedDocument, 1).body == {"a": {"b": 2}, "items": [1, {"k": 1}]}
+
+
+def test_reassigned_document_is_written_in_full(engine: Engine) -> None:
+    with Session(engine) as session:
+        session.add(TrackedDocument(id=1, body={"a": 1}))
+        session.commit()
+        document = session.get_one(TrackedDocument, 1)
+
+        document.body = {"b": 2}
+        document.body["c"] = 3
+        statements = capture_statements(engine)
+        session.commit()
+
+        assert "json_set" not in statements[0][0]
+        session.expire_all()
+        assert session.get_one(TrackedDocument, 1).body == {"b": 2, "c": 3}
+
+
+def test_sqlite_keys_with_quotes_fall_back_to_full_rewrite() -> None:
+    table = Table("docs", MetaData(), Column("id", Integer, primary_key=True), Column("body", MutableJson))
+
+    assert path_update_expression(table.c.body, {'say "hi"': 1}, [('say "hi"',)], "sqlite") is None
+    assert path_update_expression(table.c.body, {'say "hi"': 1}, [('say "hi"',)], "postgresql") is not None
+
+
+def test_flush_hooks_only_on_mappers_with_tracked_columns() -> None:
+    configure_mappers()
+
+    assert event.contains(TrackedDocument.__mapper__, "before_update", _compile_path_updates)
+    assert not event.contains(UntrackedDocument.__mapper__, "before_update", _compile_path_updates)
+    assert not event.contains(Session, "before_flush", _compile_path_updates)
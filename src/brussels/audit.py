@@ -0,0 +1,146 @@
+"""Report redundant and overlapping indexes declared on a MetaData.
+
+Usage:
+    python -m brussels.audit mypkg.models [mypkg.other_models ...]
+
+The listed modules are imported so their models register on Base.metadata
+(override with --metadata module:attribute), then every table is checked for:
+
+- indexes or unique constraints that duplicate the primary key or another index
+- plain indexes whose columns are a leading prefix of another index
+- index or constraint names that collide once NAMING_CONVENTION is applied
+
+The command exits with status 1 when anything is reported, so it can run in CI.
+"""
+
+import argparse
+import sys
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from importlib import import_module
+from operator import attrgetter
+
+from sqlalchemy import Column, Index, MetaData, PrimaryKeyConstraint, Table, UniqueConstraint
+
+
+@dataclass(frozen=True, slots=True)
+class IndexFinding:
+    table: str
+    index: str
+    covered_by: str
+    reason: str
+
+    def __str__(self) -> str:
+        return f"{self.table}: {self.index} is redundant with {self.covered_by} ({self.reason})"
+
+
+@dataclass(frozen=True, slots=True)
+class _IndexEntry:
+    name: str
+    columns: tuple[str, ...]
+    unique: bool
+    options: tuple[tuple[str, str], ...]
+
+
+def _entry_name(item: Index | PrimaryKeyConstraint | UniqueConstraint, table: Table) -> str:
+    name = item.name
+    if isinstance(name, str):
+        return name
+    columns = "_".join(column.name for column in item.columns)
+    return f"<unnamed {type(item).__name__} on {table.name}({columns})>"
+
+
+def _index_like(table: Table) -> list[Index | PrimaryKeyConstraint | UniqueConstraint]:
+    unique_constraints = [constraint for constraint in table.constraints if isinstance(constraint, UniqueConstraint)]
+    items: list[Index | PrimaryKeyConstraint | UniqueConstraint] = []
+    if table.primary_key.columns:
+        items.append(table.primary_key)
+    items.extend(sorted(unique_constraints, key=lambda item: _entry_name(item, table)))
+    items.extend(sorted(table.indexes, key=lambda item: _entry_name(item, table)))
+    return items
+
+
+def _table_entries(table: Table) -> Iterator[_IndexEntry]:
+    for item in _index_like(table):
+        if isinstance(item, Index):
+            if not all(isinstance(expression, Column) for expression in item.expressions):
+                continue
+            options = tuple(sorted((key, str(value)) for key, value in item.dialect_kwargs.items()))
+            unique = bool(item.unique)
+        else:
+            options = ()
+            unique = True
+        columns = tuple(item.columns.keys())
+        yield _IndexEntry(name=_entry_name(item, table), columns=columns, unique=unique, options=options)
+
+
+def _redundancy(candidate: _IndexEntry, other: _IndexEntry) -> str | None:
+    if candidate.options != other.options:
+        return None
+    if candidate.columns == other.columns:
+        if candidate.unique and not other.unique:
+            return None
+        return "same columns"
+    if not candidate.unique and other.columns[: len(candidate.columns)] == candidate.columns:
+        return "leading columns"
+    return None
+
+
+def audit_table(table: Table) -> list[IndexFinding]:
+    entries = list(_table_entries(table))
+    findings: list[IndexFinding] = []
+    for position, candidate in enumerate(entries):
+        for other_position, other in enumerate(entries):
+            if other_position == position:
+                continue
+            reason = _redundancy(candidate, other)
+            # Identical entries are reported once: the later one is redundant.
+            if reason == "same columns" and candidate.unique == other.unique and other_position > position:
+                continue
+            if reason is not None:
+                findings.append(IndexFinding(table.name, candidate.name, other.name, reason))
+                break
+    return findings
+
+
+def audit_indexes(metadata: MetaData) -> list[IndexFinding]:
+    """Return redundant indexes and colliding index names across all tables."""
+    findings: list[IndexFinding] = []
+    owners: dict[str, str] = {}
+    for table in metadata.sorted_tables:
+        findings.extend(audit_table(table))
+        for item in _index_like(table):
+            name = _entry_name(item, table)
+            if name in owners:
+                findings.append(IndexFinding(table.name, name, f"{owners[name]}.{name}", "duplicate name"))
+            else:
+                owners[name] = table.name
+    return findings
+
+
+def _load_metadata(path: str) -> MetaData:
+    module_name, _, attribute = path.partition(":")
+    metadata = attrgetter(attribute)(import_module(module_name))
+    if not isinstance(metadata, MetaData):
+        msg = f"{path} is not a sqlalchemy MetaData, got {type(metadata).__name__}."
+        raise TypeError(msg)
+    return metadata
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m brussels.audit", description="Report redundant indexes.")
+    parser.add_argument("modules", nargs="*", help="modules to import so their models are registered")
+    parser.add_argument("--metadata", default="brussels.base:Base.metadata", help="module:attribute of the MetaData")
+    args = parser.parse_args(argv)
+
+    for module in args.modules:
+        import_module(module)
+
+    findings = audit_indexes(_load_metadata(args.metadata))
+    for finding in findings:
+        sys.stdout.write(f"{finding}\n")
+    return 1 if findings else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,13 @@
 import re
+from collections.abc import Iterable
 from datetime import datetime
-from typing import Any, Final
+from typing import Any, ClassVar, Final
 
-from sqlalchemy import MetaData
-from sqlalchemy.orm import DeclarativeBase, MappedAsDataclass, declared_attr
+from sqlalchemy import Connection, MetaData
+from sqlalchemy.orm import DeclarativeBase, MappedAsDataclass, Session, declared_attr
 
+from brussels.bulk import Row, bulk_insert, bulk_upsert
+from brussels.json_index import JsonGinIndex, JsonIndex, apply_json_indexes
 from brussels.types import DateTimeUTC
 
 NAMING_CONVENTION: Final[dict[str, str]] = {
@@ -29,6 +32,24 @@ class Base(DeclarativeBase):
     metadata = MetaData(naming_convention=NAMING_CONVENTION)
     type_annotation_map = TYPE_ANNOTATION_MAP
 
+    __json_indexes__: ClassVar[tuple[JsonIndex | JsonGinIndex, ...]] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:  # noqa: ANN401
+        super().__init_subclass__(**kwargs)
+        declarations = cls.__dict__.get("__json_indexes__")
+        if declarations and not cls.__dict__.get("__abstract__", False):
+            apply_json_indexes(cls, declarations)
+
+    @classmethod
+    def bulk_insert(cls, bind: Session | Connection, rows: Iterable[Row], **options: Any) -> list[Any] | int:  # noqa: ANN401
+        """Insert rows without the unit of work; see brussels.bulk.bulk_insert()."""
+        return bulk_insert(bind, cls, rows, **options)
+
+    @classmethod
+    def bulk_upsert(cls, bind: Session | Connection, rows: Iterable[Row], **options: Any) -> list[Any] | int:  # noqa: ANN401
+        """Insert or update rows without the unit of work; see brussels.bulk.bulk_upsert()."""
+        return bulk_upsert(bind, cls, rows, **options)
+
     @declared_attr.directive
     def __tablename__(self) -> str:
         name = TABLENAME_CAPITAL_RUN_PATTERN.sub(r"_\1", self.__name__)
@@ -0,0 +1,239 @@
+"""High-throughput INSERT and upsert for mapped models, bypassing the unit of work.
+
+session.add() builds a full ORM instance per row and tracks it until flush.
+For ingestion, bulk_insert() and bulk_upsert() take plain dicts (keyed by
+attribute name) or tuples (with columns naming their positions) and send
+them as chunked executemany INSERTs, which SQLAlchemy batches into multi-row
+INSERT ... VALUES statements. Every row in a call must supply the same
+attributes:
+
+    bulk_insert(session, Event, ({"name": name, "payload": payload} for name, payload in feed))
+    bulk_upsert(session, Product, rows, columns=("sku", "price"), conflict=("sku",))
+
+Attributes missing from the rows get their defaults: dataclass
+default_factory values (such as PrimaryKeyMixin's uuid4 id) and Python
+column defaults are generated per row, and SQL defaults such as
+TimestampMixin's NOW() are rendered into the statement. ORM events,
+validators and relationships are bypassed, and nothing is added to the
+session. Run inside session.run_sync() to use an AsyncSession.
+"""
+
+import dataclasses
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from importlib import import_module
+from itertools import chain, islice
+from types import ModuleType
+from typing import Any, Final
+
+from sqlalchemy import Column, Connection, Insert, Table, insert, inspect
+from sqlalchemy.orm import Session
+
+BULK_CHUNK_SIZE: Final[int] = 10_000
+
+Row = Mapping[str, Any] | Sequence[Any]
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _BulkTarget:
+    table: Table
+    column_keys: dict[str, str]
+    factories: dict[str, Callable[[], Any]]
+
+
+def _target(model: type) -> _BulkTarget:
+    mapper = inspect(model, raiseerr=False)
+    if mapper is None or not isinstance(mapper.local_table, Table):
+        msg = f"Bulk operations require a mapped class with its own table, got {model!r}."
+        raise TypeError(msg)
+
+    column_keys: dict[str, str] = {}
+    for prop in mapper.column_attrs:
+        column = prop.columns[0]
+        if isinstance(column, Column) and column.table is mapper.local_table:
+            column_keys[prop.key] = column.key
+
+    factories: dict[str, Callable[[], Any]] = {}
+    for column in mapper.local_table.c:
+        default = column.default
+        # Context-free Python defaults are wrapped by SQLAlchemy; call the original directly.
+        factory = getattr(default.arg, "__wrapped__", None) if default is not None and default.is_callable else None
+        if factory is not None:
+            factories[column.key] = factory
+    # default_factory values (PrimaryKeyMixin's uuid4) only exist on the dataclass, not the Column.
+    for field in dataclasses.fields(model) if dataclasses.is_dataclass(model) else ():
+        key = column_keys.get(field.name)
+        if key is None or key in factories or field.default_factory is dataclasses.MISSING:
+            continue
+        if mapper.local_table.c[key].default is None:
+            factories[key] = field.default_factory
+
+    return _BulkTarget(mapper.local_table, column_keys, factories)
+
+
+def _derives_from_row(column: Column[Any]) -> bool:
+    default = column.default
+    # Context-free callables are wrapped by SQLAlchemy; the rest receive the execution context and its parameters.
+    return default is not None and default.is_callable and not hasattr(default.arg, "__wrapped__")
+
+
+def _chunks(
+    target: _BulkTarget,
+    rows: Iterable[Row],
+    columns: Sequence[str] | None,
+    chunk_size: int,
+) -> Iterator[list[dict[str, Any]]]:
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, chunk_size)):
+        if columns is not None:
+            records = [dict(zip(columns, row, strict=True)) for row in chunk]
+        else:
+            records = [dict(row) for row in chunk]  # type: ignore[arg-type]
+
+        unknown = records[0].keys() - target.column_keys.keys()
+        if unknown:
+            msg = f"Unknown attributes for {target.table.name}: {', '.join(sorted(unknown))}."
+            raise ValueError(msg)
+        renamed = {key: column for key, column in target.column_keys.items() if key != column}
+        if renamed:
+            records = [{renamed.get(key, key): value for key, value in record.items()} for record in records]
+        yield records
+
+
+def _fill_defaults(target: _BulkTarget, records: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    for column, factory in target.factories.items():
+        if column not in records[0]:
+            for record in records:
+                record[column] = factory()
+    return records
+
+
+def _execute(
+    bind: Session | Connection,
+    target: _BulkTarget,
+    statement: Insert,
+    chunks: Iterable[list[dict[str, Any]]],
+    *,
+    returning: bool,
+) -> list[Any] | int:
+    count = 0
+    keys: list[Any] = []
+    for records in chunks:
+        result = bind.execute(statement, _fill_defaults(target, records))
+        if returning:
+            keys.extend(row[0] if len(row) == 1 else tuple(row) for row in result)
+        else:
+            count += result.rowcount if result.rowcount >= 0 else len(records)  # type: ignore[attr-defined]
+    return keys if returning else count
+
+
+def _returning(statement: Insert, table: Table, *, ordered: bool) -> Insert:
+    return statement.returning(*table.primary_key.columns, sort_by_parameter_order=ordered)
+
+
+def _dialect(name: str) -> ModuleType:
+    # Dialect packages are imported on first use to keep `import brussels.base` cheap.
+    return import_module(f"sqlalchemy.dialects.{name}")
+
+
+def _dialect_name(bind: Session | Connection) -> str:
+    return (bind.get_bind() if isinstance(bind, Session) else bind).dialect.name
+
+
+def bulk_insert(  # noqa: PLR0913
+    bind: Session | Connection,
+    model: type,
+    rows: Iterable[Row],
+    *,
+    columns: Sequence[str] | None = None,
+    chunk_size: int = BULK_CHUNK_SIZE,
+    ignore_conflicts: bool = False,
+    returning: bool = False,
+) -> list[Any] | int:
+    """Insert rows into model's table; returns the rows written, or their primary keys with returning=True.
+
+    With ignore_conflicts, rows that violate a unique constraint are skipped
+    (ON CONFLICT DO NOTHING, INSERT IGNORE on MySQL); returned keys then only
+    cover inserted rows and are not guaranteed to follow input order.
+    """
+    target = _target(model)
+    statement: Insert = insert(target.table)
+    if ignore_conflicts:
+        dialect_name = _dialect_name(bind)
+        if dialect_name in ("postgresql", "sqlite"):
+            statement = _dialect(dialect_name).insert(target.table).on_conflict_do_nothing()
+        else:
+            statement = statement.prefix_with("IGNORE", dialect=("mysql", "mariadb"))
+    if returning:
+        statement = _returning(statement, target.table, ordered=not ignore_conflicts)
+    return _execute(bind, target, statement, _chunks(target, rows, columns, chunk_size), returning=returning)
+
+
+def bulk_upsert(  # noqa: PLR0913
+    bind: Session | Connection,
+    model: type,
+    rows: Iterable[Row],
+    *,
+    columns: Sequence[str] | None = None,
+    conflict: Sequence[str] | None = None,
+    update: Sequence[str] | None = None,
+    chunk_size: int = BULK_CHUNK_SIZE,
+    returning: bool = False,
+) -> list[Any] | int:
+    """Insert rows, updating existing rows that collide on the conflict attributes.
+
+    conflict defaults to the primary key and must match a unique constraint
+    or index (MySQL uses whichever unique key collides). update lists the
+    attributes to overwrite; by default every attribute supplied in the rows
+    except the conflict ones, plus columns with an onupdate default such as
+    updated_at and columns whose Python default is computed from the row
+    (such as a blind index digest). created_at and other unsupplied columns
+    keep their stored values.
+    """
+    target = _target(model)
+    table = target.table
+    chunks = _chunks(target, rows, columns, chunk_size)
+    first = next(chunks, None)
+    if first is None:
+        return [] if returning else 0
+
+    conflict_columns = (
+        list(table.primary_key.columns.keys()) if conflict is None else [target.column_keys[key] for key in conflict]
+    )
+    if update is None:
+        updated = [key for key in first[0] if key not in conflict_columns and key not in table.primary_key.columns]
+        updated += [
+            column.key
+            for column in table.c
+            if (column.onupdate is not None or _derives_from_row(column))
+            and column.key not in updated
+            and column.key not in conflict_columns
+        ]
+    else:
+        updated = [target.column_keys[key] for key in update]
+
+    dialect_name = _dialect_name(bind)
+    statement: Insert
+    if dialect_name in ("postgresql", "sqlite"):
+        dialect_insert = _dialect(dialect_name).insert(table)
+        excluded = dialect_insert.excluded
+        if updated:
+            statement = dialect_insert.on_conflict_do_update(
+                index_elements=conflict_columns,
+                set_={key: excluded[key] for key in updated},
+            )
+        else:
+            statement = dialect_insert.on_conflict_do_nothing(index_elements=conflict_columns)
+    elif dialect_name in ("mysql", "mariadb"):
+        mysql_insert = _dialect("mysql").insert(table)
+        if updated:
+            statement = mysql_insert.on_duplicate_key_update({key: mysql_insert.inserted[key] for key in updated})
+        else:
+            statement = mysql_insert.prefix_with("IGNORE")
+    else:
+        msg = f"bulk_upsert() does not support the {dialect_name} dialect."
+        raise NotImplementedError(msg)
+
+    if returning:
+        statement = _returning(statement, table, ordered=bool(updated))
+
+    return _execute(bind, target, statement, chain([first], chunks), returning=returning)
@@ -0,0 +1,242 @@
+"""Engine and session factories with tuned presets for common workloads.
+
+Each preset bundles the pool sizing, pre-ping, statement cache size,
+insertmanyvalues page size and SQLite pragmas that suit one kind of process:
+
+    engine = engine_from_preset("postgresql://app@db/app", "web")
+    SessionLocal = session_factory(engine)
+
+    engine = async_engine_from_preset("postgresql://app@db/app", "worker")
+    SessionLocal = async_session_factory(engine)
+
+web
+    Many short requests: a pool sized for concurrent handlers, pre-ping so
+    connections dropped by the server are replaced transparently, and a
+    large statement cache for the wide variety of queries a web app runs.
+worker
+    Background jobs with a few concurrent tasks: a small pool and a longer
+    checkout timeout, since jobs would rather wait than fail.
+batch
+    Long-running imports and exports: one or two connections without
+    pre-ping and a large insertmanyvalues page, so bulk_insert() sends fewer
+    round trips.
+test
+    Test suites: in-memory SQLite shares a single connection (StaticPool)
+    and file databases skip fsync.
+
+On SQLite, every preset except test switches to WAL journaling with
+synchronous=NORMAL, which is durable across application crashes and avoids
+an fsync per commit, and sets a busy timeout so concurrent writers wait
+instead of failing with "database is locked".
+
+async_engine_from_preset() swaps a synchronous driver for its asyncio
+counterpart (postgresql -> asyncpg, sqlite -> aiosqlite, mysql -> aiomysql).
+Keyword arguments override any create_engine() option, for example
+**json_engine_options(). Pass an EnginePreset to tune a preset:
+
+    engine_from_preset(url, dataclasses.replace(ENGINE_PRESETS["web"], pool_size=20))
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, Final, Literal
+
+from sqlalchemy import URL, Engine, MetaData, create_engine, event, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool, StaticPool
+
+from brussels.base import Base
+
+PresetName = Literal["web", "worker", "batch", "test"]
+
+
+@dataclass(frozen=True, slots=True)
+class EnginePreset:
+    """Engine options for one workload; see ENGINE_PRESETS."""
+
+    pool_size: int
+    max_overflow: int
+    pool_timeout: float
+    pool_recycle: int
+    pool_pre_ping: bool
+    query_cache_size: int
+    insertmanyvalues_page_size: int
+    sqlite_pragmas: Mapping[str, str | int]
+
+
+ENGINE_PRESETS: Final[dict[str, EnginePreset]] = {
+    "web": EnginePreset(
+        pool_size=10,
+        max_overflow=20,
+        pool_timeout=10,
+        pool_recycle=1800,
+        pool_pre_ping=True,
+        query_cache_size=1200,
+        insertmanyvalues_page_size=1000,
+        sqlite_pragmas={"journal_mode": "WAL", "synchronous": "NORMAL", "busy_timeout": 5000},
+    ),
+    "worker": EnginePreset(
+        pool_size=4,
+        max_overflow=4,
+        pool_timeout=60,
+        pool_recycle=1800,
+        pool_pre_ping=True,
+        query_cache_size=500,
+        insertmanyvalues_page_size=1000,
+        sqlite_pragmas={"journal_mode": "WAL", "synchronous": "NORMAL", "busy_timeout": 30000},
+    ),
+    "batch": EnginePreset(
+        pool_size=2,
+        max_overflow=0,
+        pool_timeout=300,
+        pool_recycle=3600,
+        pool_pre_ping=False,
+        query_cache_size=200,
+        insertmanyvalues_page_size=10_000,
+        sqlite_pragmas={
+            "journal_mode": "WAL",
+            "synchronous": "NORMAL",
+            "busy_timeout": 60000,
+            "cache_size": -65536,
+            "temp_store": "MEMORY",
+        },
+    ),
+    "test": EnginePreset(
+        pool_size=5,
+        max_overflow=10,
+        pool_timeout=5,
+        pool_recycle=-1,
+        pool_pre_ping=False,
+        query_cache_size=500,
+        insertmanyvalues_page_size=1000,
+        sqlite_pragmas={"journal_mode": "MEMORY", "synchronous": "OFF"},
+    ),
+}
+
+ASYNC_DRIVERS: Final[dict[str, str]] = {
+    "postgresql": "asyncpg",
+    "sqlite": "aiosqlite",
+    "mysql": "aiomysql",
+    "mariadb": "aiomysql",
+}
+# Drivers create_async_engine() accepts as they are; psycopg picks its async dialect itself.
+ASYNC_CAPABLE_DRIVERS: Final[frozenset[str]] = frozenset({"asyncpg", "psycopg", "aiosqlite", "aiomysql", "asyncmy"})
+
+
+def _resolve_preset(preset: PresetName | EnginePreset) -> EnginePreset:
+    if isinstance(preset, EnginePreset):
+        return preset
+    if preset not in ENGINE_PRESETS:
+        msg = f"Unknown engine preset {preset!r}; expected one of {', '.join(ENGINE_PRESETS)}."
+        raise ValueError(msg)
+    return ENGINE_PRESETS[preset]
+
+
+def _is_memory_sqlite(url: URL) -> bool:
+    database = url.database or ""
+    return database in ("", ":memory:") or url.query.get("mode") == "memory"
+
+
+def _engine_options(url: URL, preset: EnginePreset, overrides: Mapping[str, Any]) -> dict[str, Any]:
+    options: dict[str, Any] = {
+        "pool_pre_ping": preset.pool_pre_ping,
+        "query_cache_size": preset.query_cache_size,
+        "insertmanyvalues_page_size": preset.insertmanyvalues_page_size,
+    }
+    if url.get_backend_name() == "sqlite" and _is_memory_sqlite(url):
+        # Every connection to an in-memory database would otherwise get its own empty database.
+        options["poolclass"] = StaticPool
+    poolclass = overrides.get("poolclass", options.get("poolclass"))
+    if poolclass is None or issubclass(poolclass, QueuePool):
+        options.update(
+            pool_size=preset.pool_size,
+            max_overflow=preset.max_overflow,
+            pool_timeout=preset.pool_timeout,
+            pool_recycle=preset.pool_recycle,
+        )
+    options.update(overrides)
+    return options
+
+
+def _install_sqlite_pragmas(engine: Engine, pragmas: Mapping[str, str | int]) -> None:
+    if engine.dialect.name != "sqlite" or not pragmas:
+        return
+    statements = [f"PRAGMA {name} = {value}" for name, value in pragmas.items()]
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection: Any, _connection_record: object) -> None:  # noqa: ANN401
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+
+
+def _async_url(url: URL) -> URL:
+    if url.get_driver_name() in ASYNC_CAPABLE_DRIVERS:
+        return url
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        msg = f"No asyncio driver known for {url.drivername}; name one in the URL, e.g. {backend}+<driver>."
+        raise ValueError(msg)
+    return url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}")
+
+
+def engine_from_preset(
+    url: str | URL,
+    preset: PresetName | EnginePreset = "web",
+    **overrides: Any,  # noqa: ANN401
+) -> Engine:
+    """Create an Engine for url tuned with preset; overrides are passed on to create_engine()."""
+    url = make_url(url)
+    resolved = _resolve_preset(preset)
+    engine = create_engine(url, **_engine_options(url, resolved, overrides))
+    _install_sqlite_pragmas(engine, resolved.sqlite_pragmas)
+    return engine
+
+
+def async_engine_from_preset(
+    url: str | URL,
+    preset: PresetName | EnginePreset = "web",
+    **overrides: Any,  # noqa: ANN401
+) -> AsyncEngine:
+    """Create an AsyncEngine for url tuned with preset, switching to an asyncio driver if needed."""
+    url = _async_url(make_url(url))
+    resolved = _resolve_preset(preset)
+    engine = create_async_engine(url, **_engine_options(url, resolved, overrides))
+    _install_sqlite_pragmas(engine.sync_engine, resolved.sqlite_pragmas)
+    return engine
+
+
+def session_factory(
+    engine: Engine,
+    *,
+    metadata: MetaData = Base.metadata,
+    create_all: bool = False,
+    **options: Any,  # noqa: ANN401
+) -> sessionmaker[Session]:
+    """Return a sessionmaker bound to engine for models on metadata (Base.metadata by default).
+
+    With create_all, missing tables are created first, which is what the
+    test preset usually wants. options are passed on to sessionmaker().
+    """
+    if create_all:
+        metadata.create_all(engine)
+    return sessionmaker(engine, **options)
+
+
+def async_session_factory(
+    engine: AsyncEngine,
+    *,
+    expire_on_commit: bool = False,
+    **options: Any,  # noqa: ANN401
+) -> async_sessionmaker[AsyncSession]:
+    """Return an async_sessionmaker bound to engine.
+
+    Attributes are not expired on commit by default, since reloading them
+    would need an await. Create tables with
+    await connection.run_sync(Base.metadata.create_all).
+    """
+    return async_sessionmaker(engine, expire_on_commit=expire_on_commit, **options)
@@ -0,0 +1,258 @@
+"""Stream a model's table to NDJSON, CSV or Arrow with bounded memory.
+
+Loading a table through session.scalars(select(Model)).all() builds every
+ORM instance before the first byte is written. export_model() instead runs a
+yield_per select over the mapped columns, which streams through a server-side
+cursor where the driver supports one, and writes each batch of rows as it
+arrives, so memory depends on batch_size rather than on the table:
+
+    with Session(engine) as session:
+        export_model(session, User, "users.ndjson")
+        export_model(session, User, "users.csv", file_format="csv", columns=("id", "email"))
+        export_model(engine, User, "users.arrow", file_format="arrow", decrypt=True)
+
+Values are converted one column of a batch at a time. In NDJSON and CSV,
+datetimes (DateTimeUTC, EpochDateTimeUTC) become ISO 8601 strings, UUIDs and
+Decimals strings, and bytes base64; Json and CompressedJson documents are
+nested objects in NDJSON and JSON text in CSV and Arrow. Arrow output is an
+IPC file of record batches with a schema derived from the column types, so
+timestamps stay native and EpochDateTimeUTC is not decoded at all. It needs
+pyarrow.
+
+EncryptedString columns are exported as ciphertext unless decrypt is set,
+in which case each batch is decrypted across a thread pool. Rows are read
+through the ORM, so a soft-delete filter enabled on the session applies.
+"""
+
+import base64
+import csv
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from importlib import import_module
+from os import PathLike
+from types import ModuleType
+from typing import IO, Any, Final, Literal
+
+from sqlalchemy import BigInteger, ColumnElement, Connection, Engine, Table, inspect, select, type_coerce
+from sqlalchemy.orm import Session
+from sqlalchemy.types import DateTime, TypeEngine
+
+from brussels.types import EpochDateTimeUTC, json_codec
+from brussels.types.introspection import is_json, python_type, stored_type
+
+EXPORT_BATCH_SIZE: Final[int] = 10_000
+
+ExportFormat = Literal["ndjson", "csv", "arrow"]
+Destination = str | PathLike[str] | IO[Any]
+Converter = Callable[[Sequence[Any]], Sequence[Any]]
+
+EXPORT_FORMATS: Final[tuple[str, ...]] = ("ndjson", "csv", "arrow")
+
+
+@dataclass(frozen=True, slots=True)
+class _ExportColumn:
+    name: str
+    expression: ColumnElement[Any]
+    convert: Converter | None
+    arrow_type: Callable[[ModuleType], Any]
+
+
+def _pyarrow() -> ModuleType:
+    return import_module("pyarrow")
+
+
+def _map(function: Callable[[Any], Any]) -> Converter:
+    def convert(values: Sequence[Any]) -> list[Any]:
+        return [None if value is None else function(value) for value in values]
+
+    return convert
+
+
+def _isoformat(value: date | time) -> str:
+    return value.isoformat()
+
+
+def _base64(value: bytes) -> str:
+    return base64.b64encode(value).decode("ascii")
+
+
+def _decrypting(encrypted: Any, executor: Executor) -> Converter:  # noqa: ANN401
+    def convert(values: Sequence[Any]) -> list[Any]:
+        return encrypted.decrypt_many(values, executor=executor)
+
+    return convert
+
+
+def _is_utc(column_type: TypeEngine[Any]) -> bool:
+    stored = stored_type(column_type)
+    return isinstance(stored, DateTime) and bool(stored.timezone)
+
+
+def _plan(  # noqa: C901, PLR0911
+    name: str,
+    attribute: ColumnElement[Any],
+    file_format: ExportFormat,
+    executor: Executor | None,
+) -> _ExportColumn:
+    column_type = attribute.type
+    text = file_format != "arrow"
+    dumps = json_codec().dumps
+
+    if hasattr(column_type, "decrypt_many"):
+        # Read the ciphertext so decryption happens per batch, not in the result processor.
+        raw = type_coerce(attribute, column_type.impl_instance)
+        if executor is not None:
+            return _ExportColumn(name, raw, _decrypting(column_type, executor), lambda pa: pa.string())
+        if python_type(column_type.impl_instance) is bytes:
+            return _ExportColumn(name, raw, _map(_base64) if text else None, lambda pa: pa.binary())
+        return _ExportColumn(name, raw, None, lambda pa: pa.string())
+
+    if is_json(column_type):
+        convert = None if file_format == "ndjson" else _map(dumps)
+        return _ExportColumn(name, attribute, convert, lambda pa: pa.string())
+
+    if isinstance(column_type, EpochDateTimeUTC) and not text:
+        # Stored microseconds since the epoch are already Arrow's timestamp representation.
+        raw = type_coerce(attribute, BigInteger())
+        return _ExportColumn(name, raw, None, lambda pa: pa.timestamp("us", tz="UTC"))
+
+    value_type = python_type(column_type)
+    if issubclass(value_type, datetime):
+        tz = "UTC" if isinstance(column_type, EpochDateTimeUTC) or _is_utc(column_type) else None
+        return _ExportColumn(name, attribute, _map(_isoformat) if text else None, lambda pa: pa.timestamp("us", tz=tz))
+    if issubclass(value_type, date | time):
+        arrow_type = (lambda pa: pa.date32()) if issubclass(value_type, date) else (lambda pa: pa.time64("us"))
+        return _ExportColumn(name, attribute, _map(_isoformat) if text else None, arrow_type)
+    if issubclass(value_type, bytes):
+        return _ExportColumn(name, attribute, _map(_base64) if text else None, lambda pa: pa.binary())
+    if issubclass(value_type, bool):
+        return _ExportColumn(name, attribute, None, lambda pa: pa.bool_())
+    if issubclass(value_type, int):
+        return _ExportColumn(name, attribute, None, lambda pa: pa.int64())
+    if issubclass(value_type, float):
+        return _ExportColumn(name, attribute, None, lambda pa: pa.float64())
+    if issubclass(value_type, str):
+        return _ExportColumn(name, attribute, None, lambda pa: pa.string())
+    # UUID, Decimal and anything else without a portable representation is exported as text.
+    return _ExportColumn(name, attribute, _map(str), lambda pa: pa.string())
+
+
+def _export_columns(
+    model: type,
+    columns: Sequence[str] | None,
+    file_format: ExportFormat,
+    executor: Executor | None,
+) -> list[_ExportColumn]:
+    mapper = inspect(model, raiseerr=False)
+    if mapper is None or not isinstance(mapper.local_table, Table):
+        msg = f"export_model() requires a mapped class with its own table, got {model!r}."
+        raise TypeError(msg)
+
+    attributes = {prop.key: getattr(model, prop.key) for prop in mapper.column_attrs}
+    names = list(attributes) if columns is None else list(columns)
+    if not names:
+        msg = "export_model() requires at least one column."
+        raise ValueError(msg)
+    unknown = set(names) - attributes.keys()
+    if unknown:
+        msg = f"Unknown attributes for {mapper.local_table.name}: {', '.join(sorted(unknown))}."
+        raise ValueError(msg)
+    return [_plan(name, attributes[name], file_format, executor) for name in names]
+
+
+def _batches(
+    bind: Engine | Connection | Session,
+    plans: Sequence[_ExportColumn],
+    where: Sequence[ColumnElement[bool]],
+    batch_size: int,
+) -> Iterator[list[Sequence[Any]]]:
+    statement = select(*(plan.expression for plan in plans)).where(*where).execution_options(yield_per=batch_size)
+    with ExitStack() as stack:
+        connection = stack.enter_context(bind.connect()) if isinstance(bind, Engine) else bind
+        result = connection.execute(statement)
+        for rows in result.partitions():
+            values = list(zip(*rows, strict=True))
+            yield [
+                column if plan.convert is None else plan.convert(column)
+                for column, plan in zip(values, plans, strict=True)
+            ]
+
+
+def _write_ndjson(stream: IO[str], plans: Sequence[_ExportColumn], batches: Iterator[list[Sequence[Any]]]) -> int:
+    dumps = json_codec().dumps
+    names = [plan.name for plan in plans]
+    count = 0
+    for values in batches:
+        lines = [dumps(dict(zip(names, row, strict=True))) for row in zip(*values, strict=True)]
+        stream.write("\n".join(lines) + "\n")
+        count += len(lines)
+    return count
+
+
+def _write_csv(stream: IO[str], plans: Sequence[_ExportColumn], batches: Iterator[list[Sequence[Any]]]) -> int:
+    writer = csv.writer(stream)
+    writer.writerow([plan.name for plan in plans])
+    count = 0
+    for values in batches:
+        writer.writerows(zip(*values, strict=True))
+        count += len(values[0])
+    return count
+
+
+def _write_arrow(stream: IO[bytes], plans: Sequence[_ExportColumn], batches: Iterator[list[Sequence[Any]]]) -> int:
+    pa = _pyarrow()
+    schema = pa.schema([(plan.name, plan.arrow_type(pa)) for plan in plans])
+    count = 0
+    with pa.ipc.new_file(stream, schema) as writer:
+        for values in batches:
+            arrays = [pa.array(column, type=field.type) for column, field in zip(values, schema, strict=True)]
+            writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+            count += len(values[0])
+    return count
+
+
+def export_model(  # noqa: PLR0913
+    bind: Engine | Connection | Session,
+    model: type,
+    destination: Destination,
+    *,
+    file_format: ExportFormat = "ndjson",
+    columns: Sequence[str] | None = None,
+    where: Sequence[ColumnElement[bool]] = (),
+    decrypt: bool = False,
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> int:
+    """Write model's rows to destination in file_format and return how many were written.
+
+    destination is a path or an open file: text for NDJSON and CSV, binary for
+    Arrow. columns selects and orders the exported attributes (all mapped
+    columns by default) and where filters the rows. An empty CSV export still
+    has its header row.
+    """
+    if file_format not in EXPORT_FORMATS:
+        msg = f"Unknown export format {file_format!r}; expected one of {', '.join(EXPORT_FORMATS)}."
+        raise ValueError(msg)
+    if batch_size < 1:
+        msg = "Export batch_size must be at least 1."
+        raise ValueError(msg)
+    if file_format == "arrow":
+        _pyarrow()
+
+    with ExitStack() as stack:
+        executor = stack.enter_context(ThreadPoolExecutor()) if decrypt else None
+        plans = _export_columns(model, columns, file_format, executor)
+        if isinstance(destination, str | PathLike):
+            if file_format == "arrow":
+                destination = stack.enter_context(open(destination, "wb"))  # noqa: PTH123
+            else:
+                destination = stack.enter_context(open(destination, "w", encoding="utf-8", newline=""))  # noqa: PTH123
+
+        batches = _batches(bind, plans, where, batch_size)
+        if file_format == "ndjson":
+            return _write_ndjson(destination, plans, batches)
+        if file_format == "csv":
+            return _write_csv(destination, plans, batches)
+        return _write_arrow(destination, plans, batches)
@@ -0,0 +1,145 @@
+"""Resumable maintenance jobs that walk a table in bounded primary-key batches.
+
+Each batch runs in its own short transaction, so jobs never hold table-wide
+locks and can be stopped at any point. Every job yields a BatchProgress after
+each committed batch; pass its last_key as start_after to resume.
+"""
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any, Final
+
+from sqlalchemy import Column, Engine, Table, bindparam, delete, insert, select, type_coerce, update
+from sqlalchemy.orm import InstrumentedAttribute
+
+if TYPE_CHECKING:
+    from brussels.types.encrypted_string import EncryptedString
+
+JOB_BATCH_SIZE: Final[int] = 1000
+
+
+@dataclass(frozen=True, slots=True)
+class BatchProgress:
+    batches: int
+    scanned: int
+    changed: int
+    last_key: Any
+
+
+def _resolve_column(column: InstrumentedAttribute[Any] | Column[Any]) -> tuple[Table, Column[Any], Column[Any]]:
+    expression = column.expression
+    table = expression.table
+    if not isinstance(table, Table):
+        msg = f"Expected a table column, got {expression!r}."
+        raise TypeError(msg)
+    primary_key = list(table.primary_key.columns)
+    if len(primary_key) != 1:
+        msg = f"Batched jobs require a single-column primary key, {table.name} has {len(primary_key)}."
+        raise ValueError(msg)
+    return table, table.c[expression.key], primary_key[0]
+
+
+def reencrypt_column(
+    engine: Engine,
+    column: InstrumentedAttribute[Any] | Column[Any],
+    *,
+    batch_size: int = JOB_BATCH_SIZE,
+    start_after: Any = None,  # noqa: ANN401
+) -> Iterator[BatchProgress]:
+    """Rewrite EncryptedString values that are not encrypted with the primary key.
+
+    Rows already on the primary key are skipped after a signature check, and a
+    row is only rewritten if its ciphertext has not changed since it was read,
+    so the job is safe to run while the application is writing.
+
+        for progress in reencrypt_column(engine, User.email):
+            logger.info("rotated %s of %s rows", progress.changed, progress.scanned)
+    """
+    table, target, primary_key = _resolve_column(column)
+    encrypted: EncryptedString = target.type  # type: ignore[assignment]
+    if not hasattr(encrypted, "rotate"):
+        msg = f"reencrypt_column requires an EncryptedString column, got {type(encrypted).__name__}."
+        raise TypeError(msg)
+
+    stored_type = encrypted.impl_instance
+    raw = type_coerce(target, stored_type)
+    statement = (
+        update(table)
+        .where(primary_key == bindparam("_pk"), raw == bindparam("_old", type_=stored_type))
+        .values({target.key: bindparam("_new", type_=stored_type)})
+    )
+
+    batches = scanned = changed = 0
+    last_key = start_after
+    while True:
+        with engine.begin() as connection:
+            page = select(primary_key, raw).order_by(primary_key).limit(batch_size)
+            if last_key is not None:
+                page = page.where(primary_key > last_key)
+            rows = connection.execute(page).all()
+            if not rows:
+                return
+
+            parameters = [
+                {"_pk": key, "_old": ciphertext, "_new": encrypted.rotate(ciphertext)}
+                for key, ciphertext in rows
+                if ciphertext is not None and encrypted.needs_rotation(ciphertext)
+            ]
+            if parameters:
+                rowcount = connection.execute(statement, parameters).rowcount
+                changed += rowcount if rowcount >= 0 else len(parameters)
+
+        batches += 1
+        scanned += len(rows)
+        last_key = rows[-1][0]
+        yield BatchProgress(batches=batches, scanned=scanned, changed=changed, last_key=last_key)
+
+
+def purge_deleted(  # noqa: PLR0913
+    engine: Engine,
+    column: InstrumentedAttribute[Any] | Column[Any],
+    *,
+    older_than: timedelta | datetime,
+    archive: Table | None = None,
+    batch_size: int = JOB_BATCH_SIZE,
+    start_after: Any = None,  # noqa: ANN401
+) -> Iterator[BatchProgress]:
+    """Hard-delete rows whose soft-delete column is older than a cutoff.
+
+    column is the soft-delete timestamp, usually a TimestampMixin model's
+    deleted_at; older_than is either an age or an absolute cutoff. With an
+    archive table, each batch is first copied there (every column the two
+    tables share) in the same transaction as the delete:
+
+        for progress in purge_deleted(engine, User.deleted_at, older_than=timedelta(days=30)):
+            logger.info("purged %s users", progress.changed)
+    """
+    table, deleted_at, primary_key = _resolve_column(column)
+    cutoff = datetime.now(UTC) - older_than if isinstance(older_than, timedelta) else older_than
+    expired = deleted_at < cutoff
+    archived = [] if archive is None else [column for column in table.c if column.name in archive.c]
+
+    batches = scanned = changed = 0
+    last_key = start_after
+    while True:
+        with engine.begin() as connection:
+            page = select(primary_key).where(expired).order_by(primary_key).limit(batch_size)
+            if last_key is not None:
+                page = page.where(primary_key > last_key)
+            keys = connection.execute(page).scalars().all()
+            if not keys:
+                return
+
+            # Re-check the cutoff so rows restored since the page was read are kept.
+            selected = primary_key.in_(keys) & expired
+            if archive is not None:
+                rows = select(*archived).where(selected)
+                connection.execute(insert(archive).from_select([column.name for column in archived], rows))
+            rowcount = connection.execute(delete(table).where(selected)).rowcount
+            changed += rowcount if rowcount >= 0 else len(keys)
+
+        batches += 1
+        scanned += len(keys)
+        last_key = keys[-1]
+        yield BatchProgress(batches=batches, scanned=scanned, changed=changed, last_key=last_key)
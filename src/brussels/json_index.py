@@ -0,0 +1,188 @@
+"""Declarative JSON-path indexes and generated columns.
+
+List the JSON paths a model filters on in __json_indexes__:
+
+    class Event(Base):
+        id: Mapped[int] = mapped_column(primary_key=True)
+        payload: Mapped[dict[str, Any]] = mapped_column(Json)
+
+        __json_indexes__ = (
+            JsonIndex("payload", "customer.id"),
+            JsonIndex("payload", "status", generated=True),
+            JsonGinIndex("payload"),
+        )
+
+Each JsonIndex adds an attribute named <column>_<path> (payload_customer_id,
+payload_status) that compiles to the indexed expression, so
+
+    select(Event).where(Event.payload_customer_id == "42")
+
+can use the index. By default the attribute is a deferred SQL expression
+backed by a functional index; with generated=True it is a stored generated
+column with a plain index instead. JsonGinIndex adds a GIN index on PostgreSQL
+(jsonb_path_ops by default, for @> containment queries) and is skipped
+elsewhere. Index names follow NAMING_CONVENTION's ix_ prefix, and everything
+is attached to the model's Table, so Alembic autogenerate sees it.
+"""
+
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any, Final
+
+from sqlalchemy import Column, Computed, Index, Table, Text, cast
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import column_property
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.sql.naming import conv
+from sqlalchemy.sql.visitors import InternalTraversal
+from sqlalchemy.types import String, TypeEngine
+
+PATH_SEGMENT_PATTERN: Final[re.Pattern] = re.compile(r"^[A-Za-z0-9_\-]+$")
+
+PathSegment = str | int
+
+
+def _parse_path(path: str | Sequence[PathSegment]) -> tuple[PathSegment, ...]:
+    segments: tuple[PathSegment, ...] = tuple(path.split(".")) if isinstance(path, str) else tuple(path)
+    if not segments:
+        msg = "JSON path must contain at least one segment."
+        raise ValueError(msg)
+    for segment in segments:
+        if isinstance(segment, bool) or not isinstance(segment, (str, int)):
+            msg = f"JSON path segments must be str or int, got {type(segment).__name__}."
+            raise TypeError(msg)
+        # Segments are rendered inline so index and query expressions match exactly.
+        if isinstance(segment, str) and not PATH_SEGMENT_PATTERN.match(segment):
+            msg = f"JSON path segment {segment!r} may only contain letters, digits, '_' and '-'."
+            raise ValueError(msg)
+    return segments
+
+
+class JsonPathElement(FunctionElement[str]):
+    """Text value at a JSON path, rendered with literal path segments."""
+
+    name = "json_path"
+    type = Text()
+    inherit_cache = True
+    _traverse_internals = [  # noqa: RUF012
+        *FunctionElement._traverse_internals,  # noqa: SLF001
+        ("segments", InternalTraversal.dp_plain_obj),
+    ]
+
+    def __init__(self, column: ColumnElement[Any], segments: tuple[PathSegment, ...]) -> None:
+        self.segments = segments
+        super().__init__(column)
+
+
+def _column(element: JsonPathElement) -> ColumnElement[Any]:
+    return next(iter(element.clauses))  # type: ignore[return-value]
+
+
+def _json_extract(element: JsonPathElement, compiler: SQLCompiler, **kw: Any) -> str:  # noqa: ANN401
+    # Keys are quoted so segments such as customer-id form a valid path.
+    parts = "".join(f"[{segment}]" if isinstance(segment, int) else f'."{segment}"' for segment in element.segments)
+    return f"json_extract({compiler.process(_column(element), **kw)}, '${parts}')"
+
+
+@compiles(JsonPathElement)
+def _compile_json_path(element: JsonPathElement, compiler: SQLCompiler, **kw: Any) -> str:  # noqa: ANN401
+    # SQLite's json_extract() returns native INTEGER/REAL values; cast so every dialect yields text.
+    return f"CAST({_json_extract(element, compiler, **kw)} AS TEXT)"
+
+
+@compiles(JsonPathElement, "postgresql")
+def _compile_json_path_postgresql(element: JsonPathElement, compiler: SQLCompiler, **kw: Any) -> str:  # noqa: ANN401
+    path = ",".join(str(segment) for segment in element.segments)
+    return f"({compiler.process(_column(element), **kw)} #>> '{{{path}}}')"
+
+
+@compiles(JsonPathElement, "mysql")
+@compiles(JsonPathElement, "mariadb")
+def _compile_json_path_mysql(element: JsonPathElement, compiler: SQLCompiler, **kw: Any) -> str:  # noqa: ANN401
+    return f"json_unquote({_json_extract(element, compiler, **kw)})"
+
+
+def json_path(
+    column: ColumnElement[Any],
+    path: str | Sequence[PathSegment],
+    type_: TypeEngine[Any] | None = None,
+) -> ColumnElement[Any]:
+    """Return the value at path ("a.b" or ("a", 0, "b")) inside a JSON column.
+
+    The value is text on every dialect, so json_path(...) == "42" matches a
+    stored 42 or "42" alike (SQLite renders JSON booleans as 1 and 0); pass
+    type_ to cast it, e.g. Integer() for numeric comparisons.
+    """
+    element = JsonPathElement(column, _parse_path(path))
+    if type_ is None or isinstance(type_, String):
+        return element
+    return cast(element, type_)
+
+
+@dataclass(frozen=True, slots=True)
+class JsonIndex:
+    """Index the value at path inside the JSON attribute column."""
+
+    column: str
+    path: str | Sequence[PathSegment]
+    type_: TypeEngine[Any] | None = None
+    generated: bool = False
+    unique: bool = False
+    name: str | None = None
+
+    @property
+    def attribute_name(self) -> str:
+        if self.name is not None:
+            return self.name
+        slug = "_".join(str(segment) for segment in _parse_path(self.path)).replace("-", "_").lower()
+        return f"{self.column}_{slug}"
+
+
+@dataclass(frozen=True, slots=True)
+class JsonGinIndex:
+    """GIN index on a JSONB attribute (PostgreSQL only)."""
+
+    column: str
+    path_ops: bool = True
+
+
+def apply_json_indexes(cls: type, declarations: Sequence[JsonIndex | JsonGinIndex]) -> None:
+    """Attach the indexes and attributes declared in __json_indexes__ to a mapped class."""
+    table = getattr(cls, "__table__", None)
+    mapper = getattr(cls, "__mapper__", None)
+    if not isinstance(table, Table) or mapper is None:
+        msg = f"{cls.__name__}.__json_indexes__ requires a mapped class with its own table."
+        raise TypeError(msg)
+
+    for declaration in declarations:
+        column = mapper.get_property(declaration.column).columns[0]
+        if isinstance(declaration, JsonGinIndex):
+            options = {column.name: "jsonb_path_ops"} if declaration.path_ops else {}
+            index = Index(
+                conv(f"ix_{table.name}_{column.name}_gin"),
+                column,
+                postgresql_using="gin",
+                postgresql_ops=options,
+            )
+            index.ddl_if(dialect="postgresql")
+            table.append_constraint(index)
+            continue
+
+        expression = json_path(column, declaration.path, declaration.type_)
+        name = declaration.attribute_name
+        if declaration.generated:
+            generated = Column(
+                name,
+                declaration.type_ or Text(),
+                Computed(expression, persisted=True),
+                index=True,
+                unique=declaration.unique,
+            )
+            table.append_column(generated)
+            mapper.add_property(name, generated)
+        else:
+            table.append_constraint(Index(conv(f"ix_{table.name}_{name}"), expression, unique=declaration.unique))
+            mapper.add_property(name, column_property(expression, deferred=True))
@@ -1,5 +1,13 @@
-from brussels.mixins.ordered import OrderedMixin
-from brussels.mixins.primary_key import PrimaryKeyMixin
-from brussels.mixins.timestamp import TimestampMixin
+from brussels.mixins.ordered import OrderedMixin, SparseOrderedMixin
+from brussels.mixins.primary_key import PrimaryKeyMixin, UUIDv7PrimaryKeyMixin
+from brussels.mixins.timestamp import EpochTimestampMixin, ServerTimestampMixin, TimestampMixin
 
-__all__ = ["OrderedMixin", "PrimaryKeyMixin", "TimestampMixin"]
+__all__ = [
+    "EpochTimestampMixin",
+    "OrderedMixin",
+    "PrimaryKeyMixin",
+    "ServerTimestampMixin",
+    "SparseOrderedMixin",
+    "TimestampMixin",
+    "UUIDv7PrimaryKeyMixin",
+]
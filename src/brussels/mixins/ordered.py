@@ -1,7 +1,198 @@
-from sqlalchemy import Integer
-from sqlalchemy.orm import Mapped, MappedAsDataclass, declarative_mixin, mapped_column
+from typing import Any, ClassVar, Final, Self
+
+from sqlalchemy import BigInteger, ColumnElement, Integer, func, inspect, or_, select, update
+from sqlalchemy.orm import Mapped, MappedAsDataclass, Session, declarative_mixin, mapped_column
+
+POSITION_GAP: Final[int] = 1024
+REBALANCE_WINDOW: Final[int] = 16
+
+
+def _scope_criteria(item: Any) -> list[ColumnElement[bool]]:  # noqa: ANN401
+    cls = type(item)
+    return [getattr(cls, name) == getattr(item, name) for name in cls.__ordering_scope__]
+
+
+def _exclude_criteria(item: Any) -> list[ColumnElement[bool]]:  # noqa: ANN401
+    identity = inspect(item).identity
+    if identity is None:
+        return []
+    primary_key = inspect(type(item)).primary_key
+    return [or_(*(column != value for column, value in zip(primary_key, identity, strict=True)))]
 
 
 @declarative_mixin
 class OrderedMixin(MappedAsDataclass):
+    """Mixin that orders rows by a dense, zero-based integer position.
+
+    Positions are usually maintained by ordering_list("position") on the parent
+    relationship, which loads the whole collection and flushes one UPDATE per
+    shifted row. For large lists, the class-level operations below shift
+    siblings with a single set-based UPDATE instead and never load the
+    collection:
+
+        OrderedItem.insert_at(session, item, 0)
+        OrderedItem.move(session, item, to=3)
+        OrderedItem.remove_and_compact(session, item)
+
+    Set __ordering_scope__ to the attribute names that partition rows into
+    separate lists (typically the parent foreign key); they must be populated
+    on the item. Loaded sibling instances are kept in sync through the ORM's
+    synchronize_session handling, but an already loaded ordering_list
+    collection is not reordered; expire it if it is still in use.
+    """
+
+    __ordering_scope__: ClassVar[tuple[str, ...]] = ()
+
     position: Mapped[int] = mapped_column(Integer, nullable=False, index=True, init=False)
+
+    @classmethod
+    def insert_at(cls, session: Session, item: Self, index: int) -> None:
+        """Insert a new item at index, shifting later siblings up by one.
+
+        Like list.insert(), an index past the end appends the item.
+        """
+        with session.no_autoflush:
+            index = min(max(index, 0), cls._list_length(session, item))
+            session.execute(
+                update(cls).where(*_scope_criteria(item), cls.position >= index).values(position=cls.position + 1),
+            )
+        item.position = index
+        session.add(item)
+
+    @classmethod
+    def move(cls, session: Session, item: Self, *, to: int) -> None:
+        """Move an item to index to, shifting the siblings in between by one."""
+        current = item.position
+        target = min(max(to, 0), cls._list_length(session, item) - 1)
+        if target > current:
+            statement = (
+                update(cls)
+                .where(*_scope_criteria(item), cls.position > current, cls.position <= target)
+                .values(position=cls.position - 1)
+            )
+        elif target < current:
+            statement = (
+                update(cls)
+                .where(*_scope_criteria(item), cls.position >= target, cls.position < current)
+                .values(position=cls.position + 1)
+            )
+        else:
+            return
+        session.execute(statement)
+        item.position = target
+
+    @classmethod
+    def remove_and_compact(cls, session: Session, item: Self) -> None:
+        """Delete an item and close the gap by shifting later siblings down by one."""
+        criteria = [*_scope_criteria(item), cls.position > item.position]
+        session.delete(item)
+        session.execute(update(cls).where(*criteria).values(position=cls.position - 1))
+
+    @classmethod
+    def _list_length(cls, session: Session, item: Self) -> int:
+        statement = select(func.count()).select_from(cls).where(*_scope_criteria(item))
+        return session.scalar(statement) or 0
+
+
+@declarative_mixin
+class SparseOrderedMixin(MappedAsDataclass):
+    """Mixin that orders rows by sparse integer positions.
+
+    Unlike OrderedMixin, positions are spaced __position_gap__ apart so an item
+    can be placed between two neighbours by taking the midpoint, without
+    renumbering the rest of the list. When two neighbours are adjacent, only a
+    local window of following siblings is respaced (REBALANCE_WINDOW rows,
+    doubling until enough room is found).
+
+    Set __ordering_scope__ to the attribute names that partition rows into
+    separate lists (typically the parent foreign key). Scope attributes must be
+    populated before calling place().
+
+    Usage:
+        class Item(DataclassBase, PrimaryKeyMixin, SparseOrderedMixin):
+            __ordering_scope__ = ("list_id",)
+            list_id: Mapped[UUID] = mapped_column(ForeignKey("lists.id"))
+
+        item.place(session)  # append to the end of the list
+        item.place(session, before=first)  # move in front of first
+        item.place(session, after=first)  # move directly behind first
+
+    Positions of loaded siblings are updated in the identity map; flush any
+    pending position changes before placing so the database view is current.
+    """
+
+    __ordering_scope__: ClassVar[tuple[str, ...]] = ()
+    __position_gap__: ClassVar[int] = POSITION_GAP
+
+    position: Mapped[int] = mapped_column(BigInteger, nullable=False, index=True, init=False)
+
+    def place(self, session: Session, *, before: Self | None = None, after: Self | None = None) -> None:
+        """Assign a position relative to a sibling, or at the end of the list.
+
+        Touches only this row in the common case, plus a small window of
+        following siblings when the gap between neighbours is exhausted.
+        """
+        if before is not None and after is not None:
+            msg = "SparseOrderedMixin.place() accepts either before or after, not both."
+            raise ValueError(msg)
+
+        with session.no_autoflush:
+            if after is not None:
+                lower: int | None = after.position
+                upper = self._neighbour_position(session, after.position, following=True)
+            elif before is not None:
+                lower = self._neighbour_position(session, before.position, following=False)
+                upper = before.position
+            else:
+                lower = self._neighbour_position(session, None, following=False)
+                upper = None
+            self.position = self._position_between(session, lower, upper)
+
+        session.add(self)
+
+    def _neighbour_position(self, session: Session, position: int | None, *, following: bool) -> int | None:
+        cls = type(self)
+        statement = select(cls.position).where(*_scope_criteria(self), *_exclude_criteria(self))
+        if following:
+            statement = statement.where(cls.position > position).order_by(cls.position)
+        else:
+            if position is not None:
+                statement = statement.where(cls.position < position)
+            statement = statement.order_by(cls.position.desc())
+        return session.scalars(statement.limit(1)).first()
+
+    def _position_between(self, session: Session, lower: int | None, upper: int | None) -> int:
+        gap = self.__position_gap__
+        if lower is None:
+            return 0 if upper is None else upper - gap
+        if upper is None:
+            return lower + gap
+        if upper - lower > 1:
+            return (lower + upper) // 2
+        return self._rebalance_after(session, lower)
+
+    def _rebalance_after(self, session: Session, lower: int) -> int:
+        cls = type(self)
+        gap = self.__position_gap__
+        size = REBALANCE_WINDOW
+        while True:
+            statement = (
+                select(cls)
+                .where(*_scope_criteria(self), *_exclude_criteria(self), cls.position > lower)
+                .order_by(cls.position)
+                .limit(size + 1)
+            )
+            window = session.scalars(statement).all()
+
+            if len(window) <= size:
+                for offset, sibling in enumerate(window, start=2):
+                    sibling.position = lower + offset * gap
+                return lower + gap
+
+            step = (window[size].position - lower) // (size + 2)
+            if step > 1:
+                for offset, sibling in enumerate(window[:size], start=2):
+                    sibling.position = lower + offset * step
+                return lower + step
+
+            size *= 2
@@ -1,8 +1,48 @@
+import os
+import sys
+import threading
+import time
+from typing import Final
 from uuid import UUID, uuid4
 
 from sqlalchemy import func
 from sqlalchemy.orm import Mapped, MappedAsDataclass, declarative_mixin, mapped_column
 
+if sys.version_info >= (3, 14):
+    from uuid import uuid7
+else:
+    UUID7_COUNTER_MAX: Final[int] = 0xFFF
+
+    _uuid7_lock = threading.Lock()
+    _uuid7_last_timestamp_ms = 0
+    _uuid7_last_counter = 0
+
+    def uuid7() -> UUID:
+        """Generate a monotonic, time-ordered UUID version 7 (RFC 9562).
+
+        The 12-bit rand_a field holds a counter seeded randomly each millisecond,
+        so ids generated by this process always sort in creation order. If the
+        counter overflows within a millisecond, the timestamp is advanced.
+        """
+        global _uuid7_last_timestamp_ms, _uuid7_last_counter  # noqa: PLW0603
+
+        with _uuid7_lock:
+            timestamp_ms = time.time_ns() // 1_000_000
+            if timestamp_ms > _uuid7_last_timestamp_ms:
+                counter = int.from_bytes(os.urandom(2)) & 0x7FF
+            else:
+                timestamp_ms = _uuid7_last_timestamp_ms
+                counter = _uuid7_last_counter + 1
+                if counter > UUID7_COUNTER_MAX:
+                    timestamp_ms += 1
+                    counter = int.from_bytes(os.urandom(2)) & 0x7FF
+            _uuid7_last_timestamp_ms = timestamp_ms
+            _uuid7_last_counter = counter
+
+        rand_b = int.from_bytes(os.urandom(8)) & 0x3FFF_FFFF_FFFF_FFFF
+        value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | 0x7 << 76 | counter << 64 | 0b10 << 62 | rand_b
+        return UUID(int=value)
+
 
 @declarative_mixin
 class PrimaryKeyMixin(MappedAsDataclass):
@@ -24,14 +64,40 @@ class PrimaryKeyMixin(MappedAsDataclass):
     The UUID is:
     - Generated client-side by default (uuid4)
     - Has server-side fallback (gen_random_uuid() for PostgreSQL)
-    - Indexed and unique for efficient lookups
+    - Indexed only by the primary key (no redundant unique or plain index)
     """
 
     id: Mapped[UUID] = mapped_column(
         primary_key=True,
         default_factory=uuid4,
         server_default=func.gen_random_uuid(),
-        index=True,
-        unique=True,
+        init=False,
+    )
+
+
+@declarative_mixin
+class UUIDv7PrimaryKeyMixin(MappedAsDataclass):
+    """Mixin that adds a time-ordered UUIDv7 primary key column.
+
+    A drop-in alternative to PrimaryKeyMixin for high-write tables. UUIDv7
+    values start with a millisecond timestamp, so new rows land at the right
+    edge of the primary key B-tree instead of at random pages, which reduces
+    page splits, WAL volume and cache misses.
+
+    The UUID is:
+    - Generated client-side by default (monotonic uuid7)
+    - Has server-side fallback (uuidv7() on PostgreSQL 18+)
+    - Indexed only by the primary key (no redundant unique or plain index)
+
+    Usage:
+        class Event(DataclassBase, UUIDv7PrimaryKeyMixin, TimestampMixin):
+            __tablename__ = "events"
+            name: Mapped[str]
+    """
+
+    id: Mapped[UUID] = mapped_column(
+        primary_key=True,
+        default_factory=uuid7,
+        server_default=func.uuidv7(),
         init=False,
     )
@@ -1,9 +1,37 @@
-from datetime import datetime
+from datetime import UTC, datetime
+from typing import Any, Final
 
-from sqlalchemy import func
-from sqlalchemy.orm import Mapped, MappedAsDataclass, declarative_mixin, mapped_column
+from sqlalchemy import DDL, ColumnElement, FetchedValue, Table, Update, event, update
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Mapped, MappedAsDataclass, Mapper, declarative_mixin, declared_attr, mapped_column
+from sqlalchemy.sql import functions
+from sqlalchemy.sql.compiler import SQLCompiler
 
-from brussels.types import DateTimeUTC
+from brussels.types import DateTimeUTC, EpochDateTimeUTC
+
+# CURRENT_TIMESTAMP has whole-second precision on SQLite and is stored without
+# the fractional part that bound datetimes always have, so the two sort
+# inconsistently as text. This renders the same layout as bound values.
+SQLITE_NOW: Final[str] = "STRFTIME('%Y-%m-%d %H:%M:%f000', 'now')"
+
+
+class _now(functions.now):  # noqa: N801
+    """NOW() that keeps fractional seconds on SQLite (see SQLITE_NOW)."""
+
+    name = "now"
+    inherit_cache = True
+    _register = False
+
+
+@compiles(_now, "sqlite")
+def _compile_sqlite_now(_element: _now, _compiler: SQLCompiler, **_kwargs: Any) -> str:  # noqa: ANN401
+    return SQLITE_NOW
+
+
+def _soft_delete_update(cls: type, criteria: tuple[ColumnElement[bool], ...], deleted_at: Any) -> Update:  # noqa: ANN401
+    column = cls.deleted_at  # type: ignore[attr-defined]
+    condition = column.is_(None) if deleted_at is not None else column.is_not(None)
+    return update(cls).where(condition, *criteria).values(deleted_at=deleted_at)
 
 
 @declarative_mixin
@@ -30,10 +58,13 @@ class TimestampMixin(MappedAsDataclass):
     Soft Deletion:
         Use mark_deleted() to mark an entity as deleted without removing it
         from the database. Remember to commit the session after calling.
+        bulk_mark_deleted() and bulk_restore() do the same for every row
+        matching a filter in a single UPDATE, and brussels.jobs.purge_deleted()
+        removes rows that have been deleted for long enough.
     """
 
-    created_at: Mapped[datetime] = mapped_column(DateTimeUTC, default=func.now(), init=False)
-    updated_at: Mapped[datetime] = mapped_column(DateTimeUTC, default=func.now(), onupdate=func.now(), init=False)
+    created_at: Mapped[datetime] = mapped_column(DateTimeUTC, default=_now(), init=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTimeUTC, default=_now(), onupdate=_now(), init=False)
     deleted_at: Mapped[datetime | None] = mapped_column(DateTimeUTC, nullable=True, default=None, init=False)
 
     def mark_deleted(self) -> None:
@@ -46,4 +77,160 @@ class TimestampMixin(MappedAsDataclass):
             user.mark_deleted()
             await session.commit()  # Persist the soft delete
         """
-        self.deleted_at = func.now()
+        self.deleted_at = _now()
+
+    @classmethod
+    def bulk_mark_deleted(cls, *criteria: ColumnElement[bool]) -> Update:
+        """Return an UPDATE that soft-deletes every live row matching criteria.
+
+        Rows that are already deleted keep their original deleted_at, and
+        updated_at is refreshed by its onupdate default. Execute it with the
+        session; the result's rowcount is the number of rows deleted:
+
+            result = await session.execute(User.bulk_mark_deleted(User.org_id == org_id))
+        """
+        return _soft_delete_update(cls, criteria, _now())
+
+    @classmethod
+    def bulk_restore(cls, *criteria: ColumnElement[bool]) -> Update:
+        """Return an UPDATE that clears deleted_at on every deleted row matching criteria."""
+        return _soft_delete_update(cls, criteria, None)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC)
+
+
+@declarative_mixin
+class EpochTimestampMixin(MappedAsDataclass):
+    """TimestampMixin with columns stored as EpochDateTimeUTC integers.
+
+    Same fields and behaviour as TimestampMixin, for SQLite and high-volume
+    tables where integer storage makes loads and range scans cheaper. The
+    database cannot produce epoch microseconds portably, so the timestamps are
+    taken from the Python clock when the row is flushed rather than with NOW().
+
+    Usage:
+        class Event(DataclassBase, PrimaryKeyMixin, EpochTimestampMixin):
+            __tablename__ = "events"
+            name: Mapped[str]
+
+        select(Event).where(Event.created_at >= datetime(2024, 1, 1, tzinfo=UTC))
+    """
+
+    created_at: Mapped[datetime] = mapped_column(EpochDateTimeUTC, insert_default=_utcnow, init=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        EpochDateTimeUTC,
+        insert_default=_utcnow,
+        onupdate=_utcnow,
+        init=False,
+    )
+    deleted_at: Mapped[datetime | None] = mapped_column(EpochDateTimeUTC, nullable=True, default=None, init=False)
+
+    def mark_deleted(self) -> None:
+        """Mark this entity as deleted by setting deleted_at to the current time.
+
+        Note: This only sets the field, it does not persist to the database.
+        You must commit the session to save the change.
+        """
+        self.deleted_at = _utcnow()
+
+    @classmethod
+    def bulk_mark_deleted(cls, *criteria: ColumnElement[bool]) -> Update:
+        """Return an UPDATE that soft-deletes every live row matching criteria (see TimestampMixin)."""
+        return _soft_delete_update(cls, criteria, _utcnow())
+
+    @classmethod
+    def bulk_restore(cls, *criteria: ColumnElement[bool]) -> Update:
+        """Return an UPDATE that clears deleted_at on every deleted row matching criteria."""
+        return _soft_delete_update(cls, criteria, None)
+
+
+UPDATED_AT_FUNCTION: Final[str] = "brussels_touch_updated_at"
+
+POSTGRESQL_UPDATED_AT_FUNCTION: Final[str] = f"""
+CREATE OR REPLACE FUNCTION {UPDATED_AT_FUNCTION}() RETURNS trigger AS $$
+BEGIN
+    NEW.updated_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def updated_at_triggers(table: Table, dialect_name: str) -> list[DDL]:
+    """Return the DDL installing table's updated_at trigger on a dialect (empty if unsupported).
+
+    ServerTimestampMixin runs it on metadata.create_all(); pass it to
+    op.execute() to install the trigger from a migration instead.
+    """
+    trigger = f"trg_{table.name}_updated_at"
+    if dialect_name == "postgresql":
+        return [
+            DDL(POSTGRESQL_UPDATED_AT_FUNCTION),
+            DDL(
+                f"CREATE TRIGGER {trigger} BEFORE UPDATE ON %(fullname)s FOR EACH ROW "
+                f"WHEN (NEW.updated_at IS NOT DISTINCT FROM OLD.updated_at) "
+                f"EXECUTE FUNCTION {UPDATED_AT_FUNCTION}()",
+            ),
+        ]
+    if dialect_name == "sqlite":
+        # SQLite triggers cannot assign NEW, so the row is touched again after the update.
+        match = " AND ".join(f"{column.name} = NEW.{column.name}" for column in table.primary_key.columns)
+        return [
+            DDL(
+                f"CREATE TRIGGER {trigger} AFTER UPDATE ON %(fullname)s FOR EACH ROW "  # noqa: S608
+                f"WHEN NEW.updated_at IS OLD.updated_at "
+                f"BEGIN UPDATE %(fullname)s SET updated_at = {SQLITE_NOW.replace('%', '%%')} WHERE {match}; END",
+            ),
+        ]
+    return []
+
+
+@declarative_mixin
+class ServerTimestampMixin(TimestampMixin):
+    """TimestampMixin whose timestamps are maintained by the database.
+
+    created_at and updated_at get NOW() server defaults, and creating the
+    table also installs a trigger (PostgreSQL and SQLite) that refreshes
+    updated_at on every UPDATE that does not set it, so raw SQL and updates
+    from other applications keep it current too. The mapper uses
+    eager_defaults, so the ORM reads the generated values back with RETURNING
+    in the same INSERT or UPDATE instead of expiring them and issuing another
+    SELECT on next access.
+
+    ORM updates still set updated_at themselves: SQLite applies its trigger
+    after the statement, too late for RETURNING to see it. Databases without
+    the trigger (or tables created by migrations; see updated_at_triggers())
+    behave like TimestampMixin with eager loading of the timestamps.
+    """
+
+    created_at: Mapped[datetime] = mapped_column(DateTimeUTC, server_default=_now(), init=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTimeUTC,
+        server_default=_now(),
+        onupdate=_now(),
+        server_onupdate=FetchedValue(),
+        init=False,
+    )
+    # Fetched so the NOW() assigned by mark_deleted() is returned by the UPDATE.
+    deleted_at: Mapped[datetime | None] = mapped_column(
+        DateTimeUTC,
+        nullable=True,
+        default=None,
+        server_onupdate=FetchedValue(),
+        init=False,
+    )
+
+    @declared_attr.directive
+    def __mapper_args__(cls) -> dict[str, Any]:  # noqa: N805
+        return {"eager_defaults": True}
+
+
+@event.listens_for(ServerTimestampMixin, "after_mapper_constructed", propagate=True)
+def _install_updated_at_triggers(mapper: Mapper[Any], _cls: type) -> None:
+    table = mapper.local_table
+    if isinstance(table, Table) and mapper.inherits is None:
+        for dialect_name in ("postgresql", "sqlite"):
+            for ddl in updated_at_triggers(table, dialect_name):
+                event.listen(table, "after_create", ddl.execute_if(dialect=dialect_name))
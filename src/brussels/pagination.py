@@ -0,0 +1,194 @@
+"""Keyset (seek) pagination over a stable ordering such as (created_at, id).
+
+OFFSET pagination reads and discards every skipped row, so deep pages get
+linearly slower. Keyset pagination instead filters on the last row already
+seen, (created_at, id) > (:created_at, :id), which an index on those columns
+answers in constant time at any depth:
+
+    page = paginate(session, select(User).where(User.org_id == org_id), cursor=request.cursor)
+    return {"items": page.items, "next": page.next_cursor, "previous": page.previous_cursor}
+
+Cursors are opaque URL-safe strings; pass next_cursor or previous_cursor back
+to move forward or backward. keys defaults to (created_at, id) of the
+selected model (TimestampMixin plus PrimaryKeyMixin) and must identify rows
+uniquely. For AsyncSession, build the query with keyset_select() and turn the
+rows into a page with keyset_page().
+
+Declare the matching index with keyset_index() in __table_args__, or check an
+existing table with recommend_keyset_index().
+"""
+
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Final, Literal
+from uuid import UUID
+
+from sqlalchemy import Index, Select, Table, event, literal, tuple_
+from sqlalchemy.orm import InstrumentedAttribute, Session
+from sqlalchemy.sql.naming import conv
+
+PAGE_LIMIT: Final[int] = 50
+KEYSET_COLUMNS: Final[tuple[str, ...]] = ("created_at", "id")
+
+Direction = Literal["next", "previous"]
+KeysetKeys = Sequence[InstrumentedAttribute[Any]]
+
+
+@dataclass(frozen=True, slots=True)
+class Page[T]:
+    items: list[T]
+    next_cursor: str | None
+    previous_cursor: str | None
+
+
+def _encode_value(value: Any) -> Any:  # noqa: ANN401
+    if isinstance(value, datetime):
+        return {"datetime": value.isoformat()}
+    if isinstance(value, UUID):
+        return {"uuid": value.hex}
+    return value
+
+
+def _decode_value(value: Any) -> Any:  # noqa: ANN401
+    if isinstance(value, dict):
+        if "datetime" in value:
+            return datetime.fromisoformat(value["datetime"])
+        if "uuid" in value:
+            return UUID(hex=value["uuid"])
+    return value
+
+
+def encode_cursor(values: Sequence[Any], direction: Direction = "next") -> str:
+    """Encode key values as an opaque cursor that pages in direction from them."""
+    payload = json.dumps([direction[0], [_encode_value(value) for value in values]], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> tuple[Direction, tuple[Any, ...]]:
+    """Return the direction and key values of a cursor made by encode_cursor()."""
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        marker, values = json.loads(payload)
+        direction: Direction = {"n": "next", "p": "previous"}[marker]
+        return direction, tuple(_decode_value(value) for value in values)
+    except (binascii.Error, KeyError, TypeError, ValueError) as exc:
+        msg = "Invalid pagination cursor."
+        raise ValueError(msg) from exc
+
+
+def _default_keys(statement: Select[Any]) -> KeysetKeys:
+    description = statement.column_descriptions[0]
+    entity = description["entity"]
+    if entity is None or description["expr"] is not entity or not all(hasattr(entity, name) for name in KEYSET_COLUMNS):
+        msg = f"Keyset pagination needs keys, or a selected model with {' and '.join(KEYSET_COLUMNS)}."
+        raise TypeError(msg)
+    return tuple(getattr(entity, name) for name in KEYSET_COLUMNS)
+
+
+def keyset_select(
+    statement: Select[Any],
+    keys: KeysetKeys,
+    *,
+    limit: int = PAGE_LIMIT,
+    cursor: str | None = None,
+    descending: bool = False,
+) -> Select[Any]:
+    """Restrict statement to the page after (or before) cursor.
+
+    One row more than limit is selected so keyset_page() can tell whether
+    another page follows. statement must not have its own ORDER BY.
+    """
+    if limit < 1:
+        msg = "Page limit must be at least 1."
+        raise ValueError(msg)
+    direction: Direction = "next"
+    if cursor is not None:
+        direction, values = decode_cursor(cursor)
+        if len(values) != len(keys):
+            msg = "Invalid pagination cursor."
+            raise ValueError(msg)
+        row = tuple_(*keys)
+        # Bind with each key's type so types such as EpochDateTimeUTC convert the value like the column does.
+        seen = tuple_(*(literal(value, key.type) for key, value in zip(keys, values, strict=True)))
+        # Paging backward walks the same index in the opposite direction.
+        after = (direction == "next") != descending
+        statement = statement.where(row > seen if after else row < seen)
+
+    reverse = (direction == "previous") != descending
+    return statement.order_by(*(key.desc() if reverse else key.asc() for key in keys)).limit(limit + 1)
+
+
+def keyset_page[T](
+    rows: Sequence[T],
+    keys: KeysetKeys,
+    *,
+    limit: int = PAGE_LIMIT,
+    cursor: str | None = None,
+) -> Page[T]:
+    """Build a Page from the rows returned by a keyset_select() statement."""
+    direction: Direction = "next" if cursor is None else decode_cursor(cursor)[0]
+    items = list(rows[:limit])
+    has_more = len(rows) > limit
+    if direction == "previous":
+        items.reverse()
+    if not items:
+        return Page(items, None, None)
+
+    def cursor_at(item: T, towards: Direction) -> str:
+        return encode_cursor([getattr(item, key.key) for key in keys], towards)
+
+    has_next = has_more if direction == "next" else cursor is not None
+    has_previous = has_more if direction == "previous" else cursor is not None
+    return Page(
+        items,
+        cursor_at(items[-1], "next") if has_next else None,
+        cursor_at(items[0], "previous") if has_previous else None,
+    )
+
+
+def paginate(  # noqa: PLR0913
+    session: Session,
+    statement: Select[Any],
+    *,
+    keys: KeysetKeys | None = None,
+    limit: int = PAGE_LIMIT,
+    cursor: str | None = None,
+    descending: bool = False,
+) -> Page[Any]:
+    """Run statement one keyset page at a time and return the page at cursor."""
+    keys = _default_keys(statement) if keys is None else keys
+    paged = keyset_select(statement, keys, limit=limit, cursor=cursor, descending=descending)
+    rows = session.scalars(paged).all() if len(statement.column_descriptions) == 1 else session.execute(paged).all()
+    return keyset_page(rows, keys, limit=limit, cursor=cursor)
+
+
+def keyset_index(*columns: str, name: str | None = None) -> Index:
+    """Return the composite index that keyset pagination over columns seeks on.
+
+    Use it in __table_args__; columns defaults to (created_at, id) and the
+    index is named ix_<table>_<columns> unless name is given. A B-tree index
+    serves both directions, so descending pages need no separate index.
+    """
+    columns = columns or KEYSET_COLUMNS
+    index = Index(None if name is None else conv(name), *columns)
+    if name is None:
+
+        @event.listens_for(index, "after_parent_attach")
+        def _name_index(index: Index, table: Table) -> None:
+            index.name = conv(f"ix_{table.name}_{'_'.join(columns)}")
+
+    return index
+
+
+def recommend_keyset_index(table: Table, columns: Sequence[str] = KEYSET_COLUMNS) -> str | None:
+    """Return a CREATE INDEX statement for keyset paging on table, or None if an index already covers it."""
+    wanted = list(columns)
+    candidates = [list(table.primary_key.columns.keys())]
+    candidates.extend(list(index.columns.keys()) for index in table.indexes)
+    if any(candidate[: len(wanted)] == wanted for candidate in candidates):
+        return None
+    return f"CREATE INDEX ix_{table.name}_{'_'.join(wanted)} ON {table.fullname} ({', '.join(wanted)})"
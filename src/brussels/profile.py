@@ -0,0 +1,190 @@
+"""Profile how long a model package spends declaring and configuring its classes.
+
+Run it against the module that defines your models:
+
+    python -m brussels.profile mypkg.models
+    python -m brussels.profile mypkg.models --sort configure --limit 50
+
+or from code with profile_import("mypkg.models"). The module is imported
+with timers around each declarative class: "declare" is the whole
+declarative scan, including copying mixin columns and building the mapper,
+"dataclass" the part of it spent in the MappedAsDataclass transform (the
+only work done for a dataclass mixin), and "tablename" the derivation of
+Base.__tablename__. After the import, configure_mappers() runs and the time
+each mapper spends configuring is recorded as "configure". sqlalchemy and
+brussels are imported before timing starts, so the import time reported is
+the package's own.
+
+The timers wrap private SQLAlchemy 2.0 hooks and are only installed while
+profiling.
+"""
+
+import argparse
+import sys
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass
+from importlib import import_module
+from typing import Any, Final, Literal
+
+from sqlalchemy import event
+from sqlalchemy.orm import Mapper, configure_mappers, decl_api, decl_base
+
+from brussels.base import Base
+
+SortKey = Literal["total", "declare", "dataclass", "tablename", "configure"]
+
+SORT_KEYS: Final[tuple[str, ...]] = ("total", "declare", "dataclass", "tablename", "configure")
+PROFILE_LIMIT: Final[int] = 25
+PRELOADED_MODULES: Final[tuple[str, ...]] = ("brussels.base", "brussels.mixins", "brussels.types")
+
+
+@dataclass(frozen=True, slots=True)
+class ClassTiming:
+    name: str
+    declare: float
+    dataclass: float
+    tablename: float
+    configure: float
+
+    @property
+    def total(self) -> float:
+        return self.declare + self.configure
+
+
+@dataclass(frozen=True, slots=True)
+class ImportProfile:
+    modules: tuple[str, ...]
+    import_seconds: float
+    configure_seconds: float
+    classes: tuple[ClassTiming, ...]
+
+
+def _class_name(cls: type) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def _timed(timings: dict[type, float], function: Callable[..., Any], cls_argument: int) -> Callable[..., Any]:
+    def wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        started = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            timings[args[cls_argument]] += time.perf_counter() - started
+
+    return wrapper
+
+
+@contextmanager
+def _instrument(timings: dict[str, dict[type, float]]) -> Iterator[None]:
+    as_declarative = decl_api._as_declarative  # noqa: SLF001
+    scan = decl_base._ClassScanMapperConfig  # noqa: SLF001
+    apply_dataclass = scan.__dict__["_apply_dataclasses_to_any_class"]
+    tablename = Base.__dict__["__tablename__"]
+    derive_tablename = tablename.fget
+    configuring: dict[Mapper[Any], float] = {}
+
+    def before_configured(mapper: Mapper[Any], _cls: type) -> None:
+        configuring[mapper] = time.perf_counter()
+
+    def configured(mapper: Mapper[Any], cls: type) -> None:
+        started = configuring.pop(mapper, None)
+        if started is not None:
+            timings["configure"][cls] += time.perf_counter() - started
+
+    decl_api._as_declarative = _timed(timings["declare"], as_declarative, 1)  # noqa: SLF001
+    scan._apply_dataclasses_to_any_class = classmethod(  # noqa: SLF001
+        _timed(timings["dataclass"], apply_dataclass.__func__, 2),
+    )
+    tablename.fget = _timed(timings["tablename"], derive_tablename, 0)
+    event.listen(Mapper, "before_mapper_configured", before_configured)
+    event.listen(Mapper, "mapper_configured", configured)
+    try:
+        yield
+    finally:
+        event.remove(Mapper, "mapper_configured", configured)
+        event.remove(Mapper, "before_mapper_configured", before_configured)
+        tablename.fget = derive_tablename
+        scan._apply_dataclasses_to_any_class = apply_dataclass  # noqa: SLF001
+        decl_api._as_declarative = as_declarative  # noqa: SLF001
+
+
+def profile_import(*modules: str) -> ImportProfile:
+    """Import modules with declaration timers installed, then configure mappers; see the module docstring."""
+    loaded = [module for module in modules if module in sys.modules]
+    if loaded:
+        msg = f"Cannot profile modules that are already imported: {', '.join(loaded)}."
+        raise ValueError(msg)
+
+    for module in PRELOADED_MODULES:
+        import_module(module)
+    timings: dict[str, dict[type, float]] = defaultdict(lambda: defaultdict(float))
+    with _instrument(timings):
+        started = time.perf_counter()
+        for module in modules:
+            import_module(module)
+        imported = time.perf_counter()
+        configure_mappers()
+        configured = time.perf_counter()
+
+    # configure_mappers() also configures mappers declared earlier elsewhere; only report the profiled classes.
+    classes = sorted(timings["declare"].keys() | timings["dataclass"].keys(), key=_class_name)
+    return ImportProfile(
+        modules=tuple(modules),
+        import_seconds=imported - started,
+        configure_seconds=configured - imported,
+        classes=tuple(
+            ClassTiming(
+                _class_name(cls),
+                # Mixins are only dataclass-transformed; for models the transform is part of the scan.
+                max(timings["declare"][cls], timings["dataclass"][cls]),
+                timings["dataclass"][cls],
+                timings["tablename"][cls],
+                timings["configure"][cls],
+            )
+            for cls in classes
+        ),
+    )
+
+
+def format_profile(profile: ImportProfile, *, sort: SortKey = "total", limit: int | None = PROFILE_LIMIT) -> str:
+    """Render profile as a text table of the slowest classes by sort."""
+    ranked = sorted(profile.classes, key=lambda timing: getattr(timing, sort), reverse=True)
+    shown = ranked if limit is None else ranked[:limit]
+    width = max([len("class"), *(len(timing.name) for timing in shown)])
+    configured = sum(timing.configure > 0 for timing in profile.classes)
+
+    lines = [
+        f"Imported {', '.join(profile.modules)} in {profile.import_seconds * 1000:.1f} ms "
+        f"({len(profile.classes)} classes); "
+        f"configured {configured} mappers in {profile.configure_seconds * 1000:.1f} ms",
+        "",
+        f"{'class':<{width}}  {'total ms':>9}  {'declare ms':>10}  {'dataclass ms':>12}  "
+        f"{'tablename ms':>12}  {'configure ms':>12}",
+    ]
+    lines.extend(
+        f"{timing.name:<{width}}  {timing.total * 1000:9.2f}  {timing.declare * 1000:10.2f}  "
+        f"{timing.dataclass * 1000:12.2f}  {timing.tablename * 1000:12.2f}  {timing.configure * 1000:12.2f}"
+        for timing in shown
+    )
+    if len(ranked) > len(shown):
+        lines.append(f"... {len(ranked) - len(shown)} more")
+    return "\n".join(lines)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m brussels.profile", description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="+", help="modules that declare the models, e.g. mypkg.models")
+    parser.add_argument("--sort", choices=SORT_KEYS, default="total")
+    parser.add_argument("--limit", type=int, default=PROFILE_LIMIT, help="rows to show; 0 shows every class")
+    args = parser.parse_args(argv)
+
+    profile = profile_import(*args.modules)
+    sys.stdout.write(f"{format_profile(profile, sort=args.sort, limit=args.limit or None)}\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,118 @@
+"""Opt-in filtering of soft-deleted rows and partial indexes over live rows.
+
+Models using TimestampMixin or EpochTimestampMixin are soft-deleted by
+setting deleted_at. Enable filtering on a Session, sessionmaker or Session
+subclass and every ORM SELECT it runs, including relationship and eager
+loads, only sees rows where deleted_at IS NULL:
+
+    SessionLocal = sessionmaker(engine)
+    enable_soft_delete_filter(SessionLocal)
+
+Deleted rows stay reachable through the include_deleted execution option:
+
+    session.scalars(select(User).execution_options(include_deleted=True))
+
+or for a whole session with session.info["include_deleted"] = True. For an
+AsyncSession, enable the filter on its sync_session (or sync_session_class).
+
+live_index() declares an index restricted to live rows on PostgreSQL and
+SQLite, so lookups stay small as deleted rows accumulate and unique values
+can be reused once a row is deleted:
+
+    __table_args__ = (live_index("email", unique=True),)
+"""
+
+from typing import Any, Final
+from weakref import WeakSet
+
+from sqlalchemy import Index, Table, event, text
+from sqlalchemy.orm import (
+    ORMExecuteState,
+    Session,
+    UserDefinedOption,
+    scoped_session,
+    sessionmaker,
+    with_loader_criteria,
+)
+from sqlalchemy.sql.naming import conv
+
+from brussels.mixins import EpochTimestampMixin, TimestampMixin
+
+INCLUDE_DELETED: Final[str] = "include_deleted"
+LIVE_ROWS_CLAUSE: Final[str] = "deleted_at IS NULL"
+
+SoftDeleteTarget = Session | sessionmaker[Any] | scoped_session[Any] | type[Session]
+
+# event.contains() can report listeners of an earlier, garbage-collected
+# target whose id was reused, so enabled targets are tracked here instead.
+_filtered_targets: WeakSet[Any] = WeakSet()
+
+
+def _includes_deleted(execute_state: ORMExecuteState) -> bool:
+    return bool(execute_state.execution_options.get(INCLUDE_DELETED) or execute_state.session.info.get(INCLUDE_DELETED))
+
+
+class _Filtered(UserDefinedOption):
+    """Marks a statement the filter has handled; lazy and eager loads of its rows inherit the mark."""
+
+    propagate_to_loaders = True
+
+
+def _filter_deleted(execute_state: ORMExecuteState) -> None:
+    # Refreshes must still find rows deleted in the meantime.
+    if not execute_state.is_select or execute_state.is_column_load:
+        return
+    # Loads for rows of a handled statement already carry its criteria, or its
+    # include_deleted; objects created or merged in the session have neither.
+    if execute_state.is_relationship_load and any(
+        isinstance(option, _Filtered) for option in execute_state.user_defined_options
+    ):
+        return
+    options: list[Any] = [_Filtered()]
+    if not _includes_deleted(execute_state):
+        options += [
+            with_loader_criteria(TimestampMixin, lambda cls: cls.deleted_at.is_(None), include_aliases=True),
+            with_loader_criteria(EpochTimestampMixin, lambda cls: cls.deleted_at.is_(None), include_aliases=True),
+        ]
+    execute_state.statement = execute_state.statement.options(*options)
+
+
+def enable_soft_delete_filter(target: SoftDeleteTarget) -> None:
+    """Hide soft-deleted rows from ORM queries run by target."""
+    if target not in _filtered_targets:
+        event.listen(target, "do_orm_execute", _filter_deleted)
+        _filtered_targets.add(target)
+
+
+def disable_soft_delete_filter(target: SoftDeleteTarget) -> None:
+    """Undo enable_soft_delete_filter() for target."""
+    if target in _filtered_targets:
+        event.remove(target, "do_orm_execute", _filter_deleted)
+        _filtered_targets.discard(target)
+
+
+def live_index(*columns: str, unique: bool = False, name: str | None = None) -> Index:
+    """Return an index over columns covering only rows where deleted_at IS NULL.
+
+    Use it in __table_args__. The index is partial on PostgreSQL and SQLite
+    and a plain index elsewhere. Unless name is given it is named
+    ix_<table>_<columns>_live, so it can sit next to a full index on the same
+    columns.
+    """
+    if not columns:
+        msg = "live_index() requires at least one column."
+        raise ValueError(msg)
+    index = Index(
+        None if name is None else conv(name),
+        *columns,
+        unique=unique,
+        postgresql_where=text(LIVE_ROWS_CLAUSE),
+        sqlite_where=text(LIVE_ROWS_CLAUSE),
+    )
+    if name is None:
+
+        @event.listens_for(index, "after_parent_attach")
+        def _name_index(index: Index, table: Table) -> None:
+            index.name = conv(f"ix_{table.name}_{'_'.join(columns)}_live")
+
+    return index
@@ -1,12 +1,52 @@
-from .datetime_utc import DateTimeUTC
-from .json_type import Json
-
-__all__ = ["DateTimeUTC", "Json"]
-
-try:
-    from .encrypted_string import EncryptedString
-except ModuleNotFoundError as exc:
-    if exc.name != "cryptography":
-        raise
-else:
-    __all__ += ["EncryptedString"]
+from importlib import import_module
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any, Final
+
+from .compressed_json import CompressedJson
+from .datetime_utc import DateTimeUTC, EpochDateTimeUTC
+from .json_type import CodecJson, Json, JsonCodec, json_codec, json_engine_options, json_type
+from .mutable_json import MutableJson, TrackedDict, TrackedJson, TrackedList
+
+if TYPE_CHECKING:
+    from .encrypted_binary import EncryptedBinaryString, LazyEncryptedBinaryString
+    from .encrypted_string import EncryptedString, LazyEncryptedString, LazySecret, blind_index_column
+
+__all__ = [
+    "CodecJson",
+    "CompressedJson",
+    "DateTimeUTC",
+    "EpochDateTimeUTC",
+    "Json",
+    "JsonCodec",
+    "MutableJson",
+    "TrackedDict",
+    "TrackedJson",
+    "TrackedList",
+    "json_codec",
+    "json_engine_options",
+    "json_type",
+]
+
+# The encrypted types import cryptography, which is slow to import and optional,
+# so they are loaded on first access.
+_LAZY_EXPORTS: Final[dict[str, str]] = {
+    "EncryptedBinaryString": ".encrypted_binary",
+    "EncryptedString": ".encrypted_string",
+    "LazyEncryptedBinaryString": ".encrypted_binary",
+    "LazyEncryptedString": ".encrypted_string",
+    "LazySecret": ".encrypted_string",
+    "blind_index_column": ".encrypted_string",
+}
+
+if find_spec("cryptography") is not None:
+    __all__ += list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import threading
+import zlib
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Final, Literal, NamedTuple
+
+from sqlalchemy import JSON, LargeBinary
+from sqlalchemy.types import TypeDecorator
+
+from .json_type import JsonCodec, _resolve_codec
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+CompressionAlgorithm = Literal["zlib", "zstd"]
+
+FORMAT_RAW: Final[int] = 0x00
+FORMAT_ZLIB: Final[int] = 0x01
+FORMAT_ZSTD: Final[int] = 0x02
+COMPRESSION_THRESHOLD: Final[int] = 1024
+ZSTD_DEFAULT_LEVEL: Final[int] = 3
+
+_FORMATS: Final[dict[str, int]] = {"zlib": FORMAT_ZLIB, "zstd": FORMAT_ZSTD}
+
+
+class CompressionInfo(NamedTuple):
+    values: int
+    compressed: int
+    raw_bytes: int
+    stored_bytes: int
+
+    @property
+    def ratio(self) -> float:
+        """Serialized size divided by stored size (1.0 when nothing was written)."""
+        return self.raw_bytes / self.stored_bytes if self.stored_bytes else 1.0
+
+
+class _CompressionStats:
+    """Thread-safe counters for values written through a CompressedJson type."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._values = 0
+        self._compressed = 0
+        self._raw_bytes = 0
+        self._stored_bytes = 0
+
+    def record(self, raw_size: int, stored_size: int, *, compressed: bool) -> None:
+        with self._lock:
+            self._values += 1
+            self._compressed += compressed
+            self._raw_bytes += raw_size
+            self._stored_bytes += stored_size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values = self._compressed = self._raw_bytes = self._stored_bytes = 0
+
+    def info(self) -> CompressionInfo:
+        with self._lock:
+            return CompressionInfo(self._values, self._compressed, self._raw_bytes, self._stored_bytes)
+
+
+def _zstd_module() -> ModuleType:
+    # compression.zstd (3.14+) and zstandard share compress(), decompress() and ZstdError.
+    try:
+        return import_module("compression.zstd")
+    except ModuleNotFoundError:
+        return import_module("zstandard")
+
+
+class CompressedJson(TypeDecorator[Any]):
+    """JSON document stored as optionally compressed bytes in LargeBinary/BYTEA.
+
+    Documents are serialized with the given codec (see json_type()), and those
+    of at least threshold bytes are compressed with zlib or zstd (zstd needs
+    Python 3.14+ or the zstandard package) unless compression would not shrink
+    them. Each value starts with a one-byte
+    header, so rows written raw, with zlib and with zstd coexist and stay
+    readable whatever algorithm is currently configured:
+
+    - 0x00: uncompressed JSON
+    - 0x01: zlib
+    - 0x02: zstd
+
+    Values that do not start with a header byte are read as plain JSON, which
+    lets a column be converted from text in place. None is stored as SQL NULL
+    and JSON.NULL as a JSON null document; both read back as None. compression_info() reports
+    how many values were written and the overall compression ratio; the
+    counters are per type instance and reset with reset_compression_info().
+
+    The document is opaque to the database, so JSON operators and indexes are
+    not available on these columns.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def __init__(
+        self,
+        *,
+        algorithm: CompressionAlgorithm = "zlib",
+        level: int | None = None,
+        threshold: int = COMPRESSION_THRESHOLD,
+        codec: JsonCodec | str | None = None,
+    ) -> None:
+        super().__init__()
+
+        if algorithm not in _FORMATS:
+            msg = f"CompressedJson algorithm must be one of {', '.join(_FORMATS)}, got {algorithm!r}."
+            raise ValueError(msg)
+        if threshold < 0:
+            msg = "CompressedJson threshold must be zero or positive."
+            raise ValueError(msg)
+        self.algorithm = algorithm
+        self.level = level
+        self.threshold = threshold
+        self.codec = _resolve_codec(codec)
+
+        self._format = _FORMATS[algorithm]
+        self._zstd: ModuleType | None = _zstd_module() if algorithm == "zstd" else None
+        self._stats = _CompressionStats()
+
+    def compression_info(self) -> CompressionInfo:
+        return self._stats.info()
+
+    def reset_compression_info(self) -> None:
+        self._stats.clear()
+
+    def process_bind_param(self, value: Any, _dialect: Any) -> bytes | None:  # noqa: ANN401
+        if value is None:
+            return None
+        if value is JSON.NULL:
+            value = None
+
+        serialized = self.codec.dumps(value).encode("utf-8")
+        if len(serialized) >= self.threshold:
+            if self._zstd is None:
+                compressed = zlib.compress(serialized, zlib.Z_DEFAULT_COMPRESSION if self.level is None else self.level)
+            else:
+                compressed = self._zstd.compress(serialized, ZSTD_DEFAULT_LEVEL if self.level is None else self.level)
+            # Incompressible documents are kept raw rather than stored larger.
+            if len(compressed) < len(serialized):
+                stored = bytes([self._format]) + compressed
+                self._stats.record(len(serialized), len(stored), compressed=True)
+                return stored
+
+        stored = bytes([FORMAT_RAW]) + serialized
+        self._stats.record(len(serialized), len(stored), compressed=False)
+        return stored
+
+    def process_result_value(self, value: Any, _dialect: Any) -> Any:  # noqa: ANN401
+        if value is None:
+            return None
+        if isinstance(value, str):
+            return self.codec.loads(value)
+        if isinstance(value, (bytearray, memoryview)):
+            value = bytes(value)
+        if not isinstance(value, bytes):
+            type_name = type(value).__name__
+            msg = f"CompressedJson expected bytes from database, got {type_name}."
+            raise TypeError(msg)
+
+        header = value[:1]
+        if header == bytes([FORMAT_RAW]):
+            return self.codec.loads(value[1:])
+        if header not in (bytes([FORMAT_ZLIB]), bytes([FORMAT_ZSTD])):
+            return self.codec.loads(value)
+
+        if header == bytes([FORMAT_ZLIB]):
+            try:
+                serialized = zlib.decompress(value[1:])
+            except zlib.error as exc:
+                msg = "CompressedJson failed to decompress zlib value."
+                raise ValueError(msg) from exc
+        else:
+            zstd = self._zstd or _zstd_module()
+            try:
+                serialized = zstd.decompress(value[1:])
+            except zstd.ZstdError as exc:
+                msg = "CompressedJson failed to decompress zstd value."
+                raise ValueError(msg) from exc
+        return self.codec.loads(serialized)
@@ -1,32 +1,149 @@
-from datetime import UTC, datetime
-from typing import Any
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any, Final
 
-from sqlalchemy import DateTime
+from sqlalchemy import BigInteger, DateTime
+from sqlalchemy.engine import Dialect
 from sqlalchemy.types import TypeDecorator
 
+# Drivers that always decode timestamptz as datetimes whose tzinfo is UTC.
+UTC_RESULT_DRIVERS: Final[frozenset[str]] = frozenset({"asyncpg"})
+# PostgreSQL type OID of timestamptz, as reported in the cursor description.
+TIMESTAMPTZ_OID: Final[int] = 1184
+
+EPOCH: Final[datetime] = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND: Final[timedelta] = timedelta(microseconds=1)
+
+
+def _bind_to_utc(value: datetime | None) -> datetime | None:
+    if value is None:
+        return None
+    if not isinstance(value, datetime):
+        type_name = type(value).__name__
+        msg = (
+            f"DateTimeUTC requires datetime object, got {type_name}. "
+            f"If using a date, convert to datetime first: "
+            f"datetime.combine(your_date, time())"
+        )
+        raise TypeError(msg)
+    tzinfo = value.tzinfo
+    if tzinfo is UTC:
+        return value
+    if tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
+
+def _result_to_utc(value: datetime | None) -> datetime | None:
+    if value is None:
+        return None
+    tzinfo = value.tzinfo
+    if tzinfo is UTC:
+        return value
+    if tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
 
 class DateTimeUTC(TypeDecorator[datetime]):
+    """Timezone-aware datetime that is always bound and returned in UTC.
+
+    Naive values are taken to be UTC. The processors are built once per
+    dialect and return values whose tzinfo is already UTC unchanged, so with
+    psycopg and a UTC session time zone each row costs one identity check; on
+    asyncpg, which always decodes timestamptz as UTC, no result processor runs
+    for timestamptz columns. Columns that are timestamp without time zone
+    still get UTC attached to their naive values.
+    """
+
     impl = DateTime(timezone=True)
     cache_ok = True
 
     def process_bind_param(self, value: datetime | None, _dialect: Any) -> datetime | None:  # type: ignore[override]  # noqa: ANN401
-        if value is None:
-            return None
-        if not isinstance(value, datetime):
-            type_name = type(value).__name__
-            msg = (
-                f"DateTimeUTC requires datetime object, got {type_name}. "
-                f"If using a date, convert to datetime first: "
-                f"datetime.combine(your_date, time())"
-            )
-            raise TypeError(msg)
-        if value.tzinfo is None:
-            value = value.replace(tzinfo=UTC)
-        return value.astimezone(UTC)
+        return _bind_to_utc(value)
+
+    def process_result_value(self, value: Any, _dialect: Any) -> datetime | None:  # type: ignore[override]  # noqa: ANN401
+        return _result_to_utc(value)
+
+    def bind_processor(self, dialect: Dialect) -> Callable[[Any], Any] | None:
+        impl_processor = self.impl_instance.bind_processor(dialect)
+        if impl_processor is None:
+            return _bind_to_utc
+
+        def process(value: datetime | None) -> Any:  # noqa: ANN401
+            return impl_processor(_bind_to_utc(value))
+
+        return process
+
+    def result_processor(self, dialect: Dialect, coltype: object) -> Callable[[Any], Any] | None:
+        impl_processor = self.impl_instance.result_processor(dialect, coltype)
+        if impl_processor is None:
+            if coltype == TIMESTAMPTZ_OID and dialect.driver in UTC_RESULT_DRIVERS and dialect.name == "postgresql":
+                return None
+            return _result_to_utc
+
+        def process(value: Any) -> datetime | None:  # noqa: ANN401
+            return _result_to_utc(impl_processor(value))
+
+        return process
+
+
+def _bind_to_epoch(value: datetime | None) -> int | None:
+    value = _bind_to_utc(value)
+    if value is None:
+        return None
+    return (value - EPOCH) // _MICROSECOND
+
+
+def _result_from_epoch(value: int | None) -> datetime | None:
+    if value is None:
+        return None
+    return EPOCH + timedelta(microseconds=value)
+
+
+class EpochDateTimeUTC(TypeDecorator[datetime]):
+    """UTC datetime stored as a BIGINT count of microseconds since the Unix epoch.
+
+    Accepts and returns the same values as DateTimeUTC, but the database sees
+    an integer, so SQLite loads skip ISO string parsing and ordering and range
+    scans compare integers. Comparisons against datetimes bind through this
+    type and compile to integer comparisons; SQL-side datetime expressions
+    such as func.now() do not, so defaults have to be computed in Python (see
+    EpochTimestampMixin).
+    """
+
+    impl = BigInteger
+    cache_ok = True
+
+    @property
+    def python_type(self) -> type[datetime]:
+        return datetime
+
+    def process_bind_param(self, value: datetime | None, _dialect: Any) -> int | None:  # type: ignore[override]  # noqa: ANN401
+        return _bind_to_epoch(value)
+
+    def process_literal_param(self, value: datetime | None, _dialect: Any) -> int | None:  # type: ignore[override]  # noqa: ANN401
+        return _bind_to_epoch(value)
 
     def process_result_value(self, value: Any, _dialect: Any) -> datetime | None:  # type: ignore[override]  # noqa: ANN401
-        if value is None:
-            return None
-        if value.tzinfo is None:
-            value = value.replace(tzinfo=UTC)
-        return value.astimezone(UTC)
+        return _result_from_epoch(value)
+
+    def bind_processor(self, dialect: Dialect) -> Callable[[Any], Any] | None:
+        impl_processor = self.impl_instance.bind_processor(dialect)
+        if impl_processor is None:
+            return _bind_to_epoch
+
+        def process(value: datetime | None) -> Any:  # noqa: ANN401
+            return impl_processor(_bind_to_epoch(value))
+
+        return process
+
+    def result_processor(self, dialect: Dialect, coltype: object) -> Callable[[Any], Any] | None:
+        impl_processor = self.impl_instance.result_processor(dialect, coltype)
+        if impl_processor is None:
+            return _result_from_epoch
+
+        def process(value: Any) -> datetime | None:  # noqa: ANN401
+            return _result_from_epoch(impl_processor(value))
+
+        return process
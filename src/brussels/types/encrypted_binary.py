@@ -0,0 +1,147 @@
+import base64
+import os
+from collections.abc import Sequence
+from typing import Final, Literal
+
+from cryptography.exceptions import InvalidTag
+from cryptography.fernet import InvalidToken
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM, ChaCha20Poly1305
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+from sqlalchemy import LargeBinary
+
+from .encrypted_string import EncryptedString, LazyEncryptedString
+
+EncryptionAlgorithm = Literal["fernet", "aes-gcm", "chacha20-poly1305"]
+
+FORMAT_FERNET: Final[int] = 0x01
+FORMAT_AES_GCM: Final[int] = 0x02
+FORMAT_CHACHA20_POLY1305: Final[int] = 0x03
+LEGACY_FERNET_PREFIX: Final[bytes] = b"gAAAAA"
+AEAD_NONCE_SIZE: Final[int] = 12
+AEAD_KEY_INFO: Final[bytes] = b"brussels.EncryptedBinaryString.aead.v1"
+
+_FORMATS: Final[dict[str, int]] = {
+    "fernet": FORMAT_FERNET,
+    "aes-gcm": FORMAT_AES_GCM,
+    "chacha20-poly1305": FORMAT_CHACHA20_POLY1305,
+}
+
+
+def _derive_aead_key(fernet_key: bytes) -> bytes:
+    hkdf = HKDF(algorithm=hashes.SHA256(), length=32, salt=None, info=AEAD_KEY_INFO)
+    return hkdf.derive(base64.urlsafe_b64decode(fernet_key))
+
+
+class EncryptedBinaryString(EncryptedString):
+    """EncryptedString variant that stores raw ciphertext bytes in LargeBinary/BYTEA.
+
+    Every value starts with a one-byte format header, followed by either a raw
+    (not base64) Fernet token or a 12-byte nonce and AEAD ciphertext:
+
+    - 0x01: Fernet (AES-CBC + HMAC-SHA256)
+    - 0x02: AES-256-GCM
+    - 0x03: ChaCha20-Poly1305
+
+    algorithm selects the format used for new values; all formats, plus base64
+    Fernet tokens written by EncryptedString before the column was converted to
+    binary, stay readable. AEAD keys are derived from the configured Fernet keys
+    with HKDF, so the same key list (and rotation via reencrypt_column(), which
+    also upgrades older formats) works for both types.
+    """
+
+    impl = LargeBinary()
+    cache_ok = True
+
+    def __init__(
+        self,
+        *,
+        key: str | bytes | Sequence[str | bytes],
+        algorithm: EncryptionAlgorithm = "aes-gcm",
+        cache_size: int = 0,
+        cache_ttl: float | None = None,
+        blind_index_key: str | bytes | None = None,
+    ) -> None:
+        super().__init__(key=key, cache_size=cache_size, cache_ttl=cache_ttl, blind_index_key=blind_index_key)
+
+        if algorithm not in _FORMATS:
+            msg = f"EncryptedBinaryString algorithm must be one of {', '.join(_FORMATS)}, got {algorithm!r}."
+            raise ValueError(msg)
+        self.algorithm = algorithm
+        self._format = _FORMATS[algorithm]
+
+        aead_keys = [_derive_aead_key(item) for item in self._keys]
+        self._aeads: dict[int, list[AESGCM | ChaCha20Poly1305]] = {
+            FORMAT_AES_GCM: [AESGCM(item) for item in aead_keys],
+            FORMAT_CHACHA20_POLY1305: [ChaCha20Poly1305(item) for item in aead_keys],
+        }
+
+    def needs_rotation(self, ciphertext: bytes) -> bool:  # type: ignore[override]
+        """Return True when ciphertext uses another format or a non-primary key."""
+        ciphertext = self._coerce_ciphertext(ciphertext)
+        if ciphertext[:1] != bytes([self._format]):
+            return True
+        if self._format == FORMAT_FERNET:
+            return super().needs_rotation(base64.urlsafe_b64encode(ciphertext[1:]).decode("ascii"))
+        try:
+            self._aead_decrypt(ciphertext, self._aeads[self._format][:1])
+        except ValueError:
+            return True
+        return False
+
+    def rotate(self, ciphertext: bytes) -> bytes:  # type: ignore[override]
+        """Re-encrypt ciphertext with the primary key and the configured algorithm."""
+        return self._encrypt(self._decrypt(self._coerce_ciphertext(ciphertext)))
+
+    def _coerce_ciphertext(self, value: object) -> bytes:  # type: ignore[override]
+        if isinstance(value, bytes):
+            return value
+        if isinstance(value, (bytearray, memoryview)):
+            return bytes(value)
+        if isinstance(value, str):
+            return value.encode("utf-8")
+        type_name = type(value).__name__
+        msg = f"EncryptedBinaryString expected bytes ciphertext from database, got {type_name}."
+        raise TypeError(msg)
+
+    def _encrypt(self, value: str) -> bytes:  # type: ignore[override]
+        plaintext = value.encode("utf-8")
+        header = bytes([self._format])
+        if self._format == FORMAT_FERNET:
+            return header + base64.urlsafe_b64decode(self._fernet.encrypt(plaintext))
+        nonce = os.urandom(AEAD_NONCE_SIZE)
+        return header + nonce + self._aeads[self._format][0].encrypt(nonce, plaintext, header)
+
+    def _decrypt(self, value: bytes) -> str:  # type: ignore[override]
+        if value.startswith(LEGACY_FERNET_PREFIX):
+            return super()._decrypt(value.decode("latin-1"))
+
+        header = value[:1]
+        if header == bytes([FORMAT_FERNET]):
+            return super()._decrypt(base64.urlsafe_b64encode(value[1:]).decode("ascii"))
+        if header and header[0] in self._aeads:
+            decrypted = self._aead_decrypt(value, self._aeads[header[0]])
+            try:
+                return decrypted.decode("utf-8")
+            except UnicodeDecodeError as exc:
+                msg = "EncryptedString decrypted value is not valid UTF-8 text."
+                raise ValueError(msg) from exc
+
+        msg = "EncryptedString failed to decrypt value. Ciphertext may be invalid or key may be wrong."
+        raise ValueError(msg)
+
+    def _aead_decrypt(self, value: bytes, aeads: Sequence[AESGCM | ChaCha20Poly1305]) -> bytes:
+        header, nonce, ciphertext = value[:1], value[1 : 1 + AEAD_NONCE_SIZE], value[1 + AEAD_NONCE_SIZE :]
+        for aead in aeads:
+            try:
+                return aead.decrypt(nonce, ciphertext, header)
+            except (InvalidTag, InvalidToken, ValueError):
+                continue
+        msg = "EncryptedString failed to decrypt value. Ciphertext may be invalid or key may be wrong."
+        raise ValueError(msg)
+
+
+class LazyEncryptedBinaryString(LazyEncryptedString, EncryptedBinaryString):
+    """EncryptedBinaryString whose loaded values are LazySecret proxies (see LazyEncryptedString)."""
+
+    cache_ok = True
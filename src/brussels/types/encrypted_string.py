@@ -1,49 +1,368 @@
-from typing import Any
+import hashlib
+import hmac
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor
+from itertools import batched
+from typing import Any, Final, NamedTuple
+from weakref import WeakKeyDictionary
 
-from cryptography.fernet import Fernet, InvalidToken
-from sqlalchemy import Text
-from sqlalchemy.types import TypeDecorator
+from cryptography.fernet import Fernet, InvalidToken, MultiFernet
+from sqlalchemy import (
+    BindParameter,
+    Column,
+    ColumnElement,
+    Connection,
+    Engine,
+    FromClause,
+    String,
+    Table,
+    Text,
+    Update,
+    bindparam,
+    event,
+)
+from sqlalchemy.engine.interfaces import ExecutionContext
+from sqlalchemy.orm import MappedColumn, Mapper, mapped_column
+from sqlalchemy.sql import operators
+from sqlalchemy.types import NullType, TypeDecorator
+
+DECRYPT_CHUNK_SIZE: Final[int] = 256
+DECRYPT_BATCH_SIZE: Final[int] = 10_000
+BLIND_INDEX_INFO_KEY: Final[str] = "blind_index_of"
+BLIND_INDEX_LENGTH: Final[int] = 64
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _DecryptionCache:
+    """Bounded LRU mapping of ciphertext to plaintext with optional TTL expiry."""
+
+    def __init__(self, maxsize: int, ttl: float | None) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, ciphertext: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(ciphertext)
+            if entry is not None:
+                plaintext, expires_at = entry
+                if expires_at >= time.monotonic():
+                    self._entries.move_to_end(ciphertext)
+                    self._hits += 1
+                    return plaintext
+                del self._entries[ciphertext]
+            self._misses += 1
+            return None
+
+    def put(self, ciphertext: str, plaintext: str) -> None:
+        expires_at = float("inf") if self._ttl is None else time.monotonic() + self._ttl
+        with self._lock:
+            self._entries[ciphertext] = (plaintext, expires_at)
+            self._entries.move_to_end(ciphertext)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._maxsize, len(self._entries))
+
+
+class LazySecret:
+    """Ciphertext loaded by a LazyEncryptedString column, decrypted on first use.
+
+    reveal() (or str()) decrypts once and memoizes the plaintext on the proxy,
+    which lives in the instance's attribute dict, so the cost is paid at most
+    once per loaded row and never for rows whose secret is not read. Equality
+    and hashing follow the plaintext, so comparisons against str work as
+    expected; repr() never shows the plaintext.
+    """
+
+    __slots__ = ("_ciphertext", "_encrypted", "_plaintext")
+
+    def __init__(self, encrypted: "EncryptedString", ciphertext: str | bytes) -> None:
+        self._encrypted = encrypted
+        self._ciphertext = ciphertext
+        self._plaintext: str | None = None
+
+    @property
+    def ciphertext(self) -> str | bytes:
+        return self._ciphertext
+
+    @property
+    def is_revealed(self) -> bool:
+        return self._plaintext is not None
+
+    def reveal(self) -> str:
+        """Return the plaintext, decrypting it on the first call."""
+        plaintext = self._plaintext
+        if plaintext is None:
+            plaintext = self._plaintext = self._encrypted._decrypt_cached(self._ciphertext)  # noqa: SLF001
+        return plaintext
+
+    def __str__(self) -> str:
+        return self.reveal()
+
+    def __repr__(self) -> str:
+        state = "revealed" if self.is_revealed else "encrypted"
+        return f"<LazySecret {state}>"
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazySecret):
+            return self._ciphertext == other._ciphertext or self.reveal() == other.reveal()
+        if isinstance(other, str):
+            return self.reveal() == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.reveal())
+
+    def __len__(self) -> int:
+        return len(self.reveal())
+
+
+def _make_fernet(key: object) -> tuple[bytes, Fernet]:
+    if isinstance(key, str):
+        key_bytes = key.encode("utf-8")
+    elif isinstance(key, bytes):
+        key_bytes = key
+    else:
+        type_name = type(key).__name__
+        msg = f"EncryptedString key must be str or bytes, got {type_name}."
+        raise TypeError(msg)
+
+    try:
+        return key_bytes, Fernet(key_bytes)
+    except ValueError as exc:
+        msg = "EncryptedString key must be a valid Fernet key."
+        raise ValueError(msg) from exc
 
 
 class EncryptedString(TypeDecorator[str]):
+    """Text column encrypted at rest with Fernet.
+
+    key may be a single Fernet key or an ordered sequence of keys. Values are
+    always encrypted with the first (primary) key and decrypted with any of
+    them, so a new key can be rolled out by prepending it and running
+    brussels.jobs.reencrypt_column() before retiring the old one.
+
+    Pass cache_size to keep up to that many decrypted values in a per-type LRU
+    cache keyed by ciphertext, so hot rows (API tokens, config secrets) skip the
+    HMAC check and AES decrypt on repeated loads. cache_ttl bounds how long, in
+    seconds, a plaintext stays in memory. The cache is off by default; inspect
+    it with cache_info() and drop it with cache_clear().
+
+    Loaded values are always plaintext str; LazyEncryptedString defers
+    decryption until a value is used.
+
+    Fernet ciphertext is randomized, so equality filters cannot use an index.
+    Pass blind_index_key and declare a companion column with
+    blind_index_column() to store a keyed HMAC digest of the plaintext next to
+    it; the digest is computed whenever an INSERT or UPDATE writes the
+    encrypted column, whether through the unit of work, bulk_insert() or a
+    Core/ORM insert() or update(), and ==, != and in_() against the encrypted
+    column compile to lookups on the digest:
+
+        class User(Base):
+            email: Mapped[str] = mapped_column(EncryptedString(key=KEY, blind_index_key=INDEX_KEY))
+            email_bidx: Mapped[str | None] = blind_index_column("email")
+
+        select(User).where(User.email == "a@example.com")  # WHERE email_bidx = :digest
+    """
+
     impl = Text()
     cache_ok = True
 
-    def __init__(self, *, key: str | bytes) -> None:
+    class Comparator(TypeDecorator.Comparator[str]):
+        def operate(self, op: Any, *other: Any, **kwargs: Any) -> ColumnElement[Any]:  # noqa: ANN401
+            encrypted: EncryptedString = self.type  # type: ignore[assignment]
+            value = other[0] if other else None
+            if op not in _BLIND_INDEX_OPERATORS or not encrypted.has_blind_index or isinstance(value, ColumnElement):
+                return super().operate(op, *other, **kwargs)
+
+            companion = _blind_index_companion(self.expr)
+            if op is operators.in_op:
+                digests = [None if item is None else encrypted.blind_index(item) for item in value]
+                return companion.in_(digests)
+            digest = None if value is None else encrypted.blind_index(value)
+            return op(companion, digest, **kwargs)
+
+    comparator_factory = Comparator
+
+    def __init__(
+        self,
+        *,
+        key: str | bytes | Sequence[str | bytes],
+        cache_size: int = 0,
+        cache_ttl: float | None = None,
+        blind_index_key: str | bytes | None = None,
+    ) -> None:
         super().__init__()
 
-        if isinstance(key, str):
-            key_bytes = key.encode("utf-8")
-        elif isinstance(key, bytes):
-            key_bytes = key
-        else:
+        keys = [key] if isinstance(key, (str, bytes)) else key
+        if not isinstance(keys, Sequence):
             type_name = type(key).__name__
-            msg = f"EncryptedString key must be str or bytes, got {type_name}."
+            msg = f"EncryptedString key must be str or bytes, or a sequence of them, got {type_name}."
+            raise TypeError(msg)
+        if not keys:
+            msg = "EncryptedString requires at least one key."
+            raise ValueError(msg)
+
+        self._keys, fernets = zip(*(_make_fernet(item) for item in keys), strict=True)
+        self._primary_fernet = fernets[0]
+        self._fernet = MultiFernet(fernets)
+
+        if cache_size < 0:
+            msg = "EncryptedString cache_size must be zero or positive."
+            raise ValueError(msg)
+        if cache_ttl is not None and cache_ttl <= 0:
+            msg = "EncryptedString cache_ttl must be positive."
+            raise ValueError(msg)
+        self._cache = _DecryptionCache(cache_size, cache_ttl) if cache_size else None
+
+        if isinstance(blind_index_key, str):
+            blind_index_key = blind_index_key.encode("utf-8")
+        if blind_index_key is not None and not blind_index_key:
+            msg = "EncryptedString blind_index_key must not be empty."
+            raise ValueError(msg)
+        self._blind_index_key = blind_index_key
+
+    @property
+    def has_blind_index(self) -> bool:
+        return self._blind_index_key is not None
+
+    def blind_index(self, value: str | LazySecret) -> str:
+        """Return the keyed HMAC-SHA256 digest stored in the blind index column."""
+        if self._blind_index_key is None:
+            msg = "EncryptedString blind_index() requires blind_index_key."
+            raise ValueError(msg)
+        if isinstance(value, LazySecret):
+            value = value.reveal()
+        if not isinstance(value, str):
+            type_name = type(value).__name__
+            msg = f"EncryptedString requires str value, got {type_name}."
             raise TypeError(msg)
+        return hmac.new(self._blind_index_key, value.encode("utf-8"), hashlib.sha256).hexdigest()
 
+    def needs_rotation(self, ciphertext: str) -> bool:
+        """Return True when ciphertext was not encrypted with the primary key.
+
+        Only the token signature is verified; nothing is decrypted.
+        """
+        try:
+            self._primary_fernet.extract_timestamp(ciphertext.encode("ascii"))
+        except (InvalidToken, UnicodeEncodeError):
+            return True
+        return False
+
+    def rotate(self, ciphertext: str) -> str:
+        """Re-encrypt ciphertext produced by any configured key with the primary key."""
         try:
-            self._fernet = Fernet(key_bytes)
-        except ValueError as exc:
-            msg = "EncryptedString key must be a valid Fernet key."
+            return self._fernet.rotate(ciphertext.encode("ascii")).decode("ascii")
+        except (InvalidToken, UnicodeEncodeError) as exc:
+            msg = "EncryptedString failed to decrypt value. Ciphertext may be invalid or key may be wrong."
             raise ValueError(msg) from exc
 
-    def process_bind_param(self, value: str | None, _dialect: Any) -> str | None:  # type: ignore[override]  # noqa: ANN401
+    def cache_info(self) -> CacheInfo:
+        if self._cache is None:
+            return CacheInfo(0, 0, 0, 0)
+        return self._cache.info()
+
+    def cache_clear(self) -> None:
+        if self._cache is not None:
+            self._cache.clear()
+
+    def process_bind_param(self, value: str | LazySecret | None, _dialect: Any) -> str | None:  # type: ignore[override]  # noqa: ANN401
         if value is None:
             return None
+        if isinstance(value, LazySecret):
+            source = value._encrypted  # noqa: SLF001
+            # Same storage and keys: the ciphertext is valid here as it stands.
+            if type(source.impl_instance) is type(self.impl_instance) and source._keys == self._keys:  # noqa: SLF001
+                return value.ciphertext  # type: ignore[return-value]
+            value = value.reveal()
         if not isinstance(value, str):
             type_name = type(value).__name__
             msg = f"EncryptedString requires str value, got {type_name}."
             raise TypeError(msg)
-        return self._fernet.encrypt(value.encode("utf-8")).decode("ascii")
+        return self._encrypt(value)
 
     def process_result_value(self, value: Any, _dialect: Any) -> str | None:  # type: ignore[override]  # noqa: ANN401
         if value is None:
             return None
+        return self._decrypt_cached(self._coerce_ciphertext(value))
+
+    def _decrypt_cached(self, value: Any) -> str:  # noqa: ANN401
+        cache = self._cache
+        if cache is None:
+            return self._decrypt(value)
+
+        plaintext = cache.get(value)
+        if plaintext is None:
+            plaintext = self._decrypt(value)
+            cache.put(value, plaintext)
+        return plaintext
+
+    def decrypt_many(
+        self,
+        ciphertexts: Sequence[str | None],
+        *,
+        chunk_size: int = DECRYPT_CHUNK_SIZE,
+        executor: Executor | None = None,
+        max_workers: int | None = None,
+    ) -> list[str | None]:
+        """Decrypt ciphertexts in chunks across a thread pool, preserving order.
+
+        Values are decrypted eagerly even on LazyEncryptedString. None handling,
+        the cache and error messages match the per-row path; the error raised is
+        the one for the first failing value in input order.
+        """
+        if chunk_size <= 0:
+            msg = "EncryptedString chunk_size must be positive."
+            raise ValueError(msg)
+        if len(ciphertexts) <= chunk_size:
+            return self._decrypt_chunk(ciphertexts)
+        if executor is None:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                return self.decrypt_many(ciphertexts, chunk_size=chunk_size, executor=pool)
+
+        chunks = executor.map(self._decrypt_chunk, batched(ciphertexts, chunk_size))
+        return [plaintext for chunk in chunks for plaintext in chunk]
+
+    def _decrypt_chunk(self, ciphertexts: Sequence[str | None]) -> list[str | None]:
+        return [
+            None if ciphertext is None else self._decrypt_cached(self._coerce_ciphertext(ciphertext))
+            for ciphertext in ciphertexts
+        ]
+
+    def _coerce_ciphertext(self, value: object) -> str:
         if not isinstance(value, str):
             type_name = type(value).__name__
             msg = f"EncryptedString expected str ciphertext from database, got {type_name}."
             raise TypeError(msg)
+        return value
+
+    def _encrypt(self, value: str) -> str:
+        return self._fernet.encrypt(value.encode("utf-8")).decode("ascii")
 
+    def _decrypt(self, value: str) -> str:
         try:
             decrypted = self._fernet.decrypt(value.encode("ascii"))
         except (InvalidToken, UnicodeEncodeError) as exc:
@@ -55,3 +374,206 @@ class EncryptedString(TypeDecorator[str]):
         except UnicodeDecodeError as exc:
             msg = "EncryptedString decrypted value is not valid UTF-8 text."
             raise ValueError(msg) from exc
+
+
+class LazyEncryptedString(EncryptedString):
+    """EncryptedString whose loaded values are LazySecret proxies rather than str.
+
+    The proxy holds the ciphertext; decryption happens on first reveal()/str()
+    and is memoized, so queries that never read the column pay no crypto cost.
+    Declare the attribute as Mapped[LazySecret] and call reveal() where a str
+    is needed. Assigning a LazySecret to another encrypted column with the same
+    storage and key set copies the ciphertext without re-encrypting.
+    """
+
+    cache_ok = True
+
+    def process_result_value(self, value: Any, _dialect: Any) -> LazySecret | None:  # type: ignore[override]  # noqa: ANN401
+        if value is None:
+            return None
+        return LazySecret(self, self._coerce_ciphertext(value))
+
+
+def decrypt_rows(
+    rows: Iterable[Sequence[Any]],
+    columns: Mapping[int, EncryptedString],
+    *,
+    batch_size: int = DECRYPT_BATCH_SIZE,
+    chunk_size: int = DECRYPT_CHUNK_SIZE,
+    max_workers: int | None = None,
+) -> Iterator[tuple[Any, ...]]:
+    """Decrypt the given column positions of a row stream in parallel batches.
+
+    Intended for exports over large result sets: select the encrypted columns
+    as raw ciphertext so the per-row result processor does not run, then let
+    this helper decrypt each batch across a shared thread pool:
+
+        statement = select(User.id, type_coerce(User.email, Text()))
+        rows = session.execute(statement).yield_per(10_000)
+        for user_id, email in decrypt_rows(rows, {1: email_type}):
+            ...
+
+    Rows are yielded as tuples in their original order.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for batch in batched(rows, batch_size):
+            decrypted = {
+                index: encrypted.decrypt_many([row[index] for row in batch], chunk_size=chunk_size, executor=executor)
+                for index, encrypted in columns.items()
+            }
+            for position, row in enumerate(batch):
+                values = list(row)
+                for index, plaintexts in decrypted.items():
+                    values[index] = plaintexts[position]
+                yield tuple(values)
+
+
+_BLIND_INDEX_OPERATORS: Final[frozenset[Any]] = frozenset({operators.eq, operators.ne, operators.in_op})
+
+
+def blind_index_column(source: str, **kwargs: Any) -> MappedColumn[Any]:  # noqa: ANN401
+    """Declare the indexed digest column for the EncryptedString attribute source.
+
+    The digest is computed from source when a statement executes, so the
+    column cannot take its own default; dataclass models usually pass
+    init=False, and default=None is accepted as the dataclass default. Other
+    keyword arguments go to mapped_column().
+    """
+    supplied = sorted(key for key in ("insert_default", "onupdate") if key in kwargs)
+    if kwargs.get("default") is not None:
+        supplied.insert(0, "default")
+    if supplied:
+        msg = f"blind_index_column() computes its own value; do not pass {', '.join(supplied)}."
+        raise ValueError(msg)
+
+    kwargs.setdefault("index", True)
+    kwargs.setdefault("nullable", True)
+    info = {**kwargs.pop("info", {}), BLIND_INDEX_INFO_KEY: source}
+    return mapped_column(String(BLIND_INDEX_LENGTH), info=info, insert_default=_insert_digest, **kwargs)
+
+
+def _blind_index_companion(expression: ColumnElement[Any]) -> ColumnElement[Any]:
+    table = getattr(expression, "table", None)
+    if isinstance(table, Table):
+        for column in table.columns:
+            if column.info.get(BLIND_INDEX_INFO_KEY) == expression.key:
+                return column
+    msg = f"EncryptedString column {expression} has a blind_index_key but no blind_index_column()."
+    raise ValueError(msg)
+
+
+def _digest(source: Column[Any], value: str | LazySecret | None) -> str | None:
+    encrypted: EncryptedString = source.type  # type: ignore[assignment]
+    return None if value is None else encrypted.blind_index(value)
+
+
+def _insert_digest(context: ExecutionContext) -> str | None:
+    # Rows of a multi-VALUES insert() get a proxy column pointing at the real one.
+    column = getattr(context.current_column, "original", context.current_column)
+    source = column.table.c[column.info[BLIND_INDEX_INFO_KEY]]
+    return _digest(source, context.get_current_parameters().get(source.key))  # type: ignore[attr-defined]
+
+
+@event.listens_for(Mapper, "mapper_configured")
+def _install_blind_index_listeners(mapper: Mapper[Any], class_: type) -> None:
+    """Keep the in-memory digest current between assignment and flush."""
+    for column in mapper.columns:
+        # Mapped SQL expressions (column_property) have no info dict.
+        if not isinstance(column, Column):
+            continue
+        source = column.info.get(BLIND_INDEX_INFO_KEY)
+        if source is None:
+            continue
+        source_column = column.table.c[source]
+        source_key = mapper.get_property_by_column(source_column).key
+        target_key = mapper.get_property_by_column(column).key
+        listener = _blind_index_listener(source_column.type, target_key)  # type: ignore[arg-type]
+        event.listen(getattr(class_, source_key), "set", listener)
+
+
+def _blind_index_listener(encrypted: EncryptedString, target_key: str) -> Callable[..., None]:
+    def update_digest(target: object, value: str | None, _oldvalue: object, _initiator: object) -> None:
+        setattr(target, target_key, None if value is None else encrypted.blind_index(value))
+
+    return update_digest
+
+
+# (source, digest) column pairs by table, collected the first time a table is updated.
+_BLIND_INDEXES: WeakKeyDictionary[FromClause, tuple[tuple[Column[Any], Column[Any]], ...]] = WeakKeyDictionary()
+
+
+def _blind_index_pairs(table: FromClause) -> tuple[tuple[Column[Any], Column[Any]], ...]:
+    # ORM statements carry an annotated copy of the table.
+    table = table._deannotate()  # noqa: SLF001
+    pairs = _BLIND_INDEXES.get(table)
+    if pairs is None:
+        pairs = _BLIND_INDEXES[table] = tuple(
+            (table.c[column.info[BLIND_INDEX_INFO_KEY]], column)
+            for column in table.c
+            if BLIND_INDEX_INFO_KEY in column.info
+        )
+    return pairs
+
+
+def _bound_plaintext(source: Column[Any], bind: BindParameter[Any], value: Any) -> str | LazySecret | None:  # noqa: ANN401
+    """Return the plaintext a bound value writes to source.
+
+    Binds typed with the stored type (as reencrypt_column() uses) carry
+    ciphertext rather than plaintext.
+    """
+    if value is None or isinstance(bind.type, (EncryptedString, NullType)):
+        return value
+    encrypted: EncryptedString = source.type  # type: ignore[assignment]
+    return encrypted._decrypt_cached(encrypted._coerce_ciphertext(value))  # noqa: SLF001
+
+
+@event.listens_for(Engine, "before_execute", retval=True)
+def _update_digests(
+    _connection: Connection,
+    statement: Any,  # noqa: ANN401
+    multiparams: list[dict[str, Any]],
+    params: dict[str, Any],
+    _execution_options: Mapping[str, Any],
+) -> tuple[Any, list[dict[str, Any]], dict[str, Any]]:
+    """Set the digest in every UPDATE that writes a blind-indexed column.
+
+    A Python onupdate default cannot do this: it fires for every UPDATE that
+    leaves the digest out, including ones that never touch the source column.
+    The listener is installed at import so Core updates are covered before any
+    mapper is configured.
+    """
+    pairs = _blind_index_pairs(statement.table) if isinstance(statement, Update) else None
+    if not pairs:
+        return statement, multiparams, params
+
+    values = {getattr(key, "key", key): value for key, value in (statement._values or {}).items()}  # noqa: SLF001
+    parameter_sets = multiparams or [params]
+    digests: dict[Column[Any], Any] = {}
+    for source, target in pairs:
+        if source.key in values:
+            bind = values[source.key]
+            if not isinstance(bind, BindParameter) or bind.callable is not None:
+                msg = f"Cannot compute the blind index for {source} from a SQL expression; pass a value."
+                raise ValueError(msg)
+            if not bind.required:
+                digests[target] = _digest(source, _bound_plaintext(source, bind, bind.value))
+                continue
+            if not all(bind.key in parameters for parameters in parameter_sets):
+                msg = f"Cannot compute the blind index for {source}; no value was passed for {bind.key!r}."
+                raise ValueError(msg)
+            # Executemany form: one digest per parameter set, under a bind of its own.
+            digest_key = f"{bind.key}_{target.key}"
+            digests[target] = bindparam(digest_key, type_=target.type)
+            parameter_sets = [
+                {**parameters, digest_key: _digest(source, _bound_plaintext(source, bind, parameters[bind.key]))}
+                for parameters in parameter_sets
+            ]
+        elif source.key in parameter_sets[0]:
+            parameter_sets = [
+                {**parameters, target.key: _digest(source, parameters[source.key])} for parameters in parameter_sets
+            ]
+    if digests:
+        statement = statement.values(digests)
+    if multiparams:
+        return statement, parameter_sets, params
+    return statement, multiparams, parameter_sets[0]
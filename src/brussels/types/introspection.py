@@ -0,0 +1,29 @@
+from typing import Any
+
+from sqlalchemy import JSON
+from sqlalchemy.types import TypeDecorator, TypeEngine
+
+from .compressed_json import CompressedJson
+
+
+def stored_type(column_type: TypeEngine[Any]) -> TypeEngine[Any]:
+    """Return the type a column is stored as: the impl of a TypeDecorator, else the type itself."""
+    return column_type.impl_instance if isinstance(column_type, TypeDecorator) else column_type
+
+
+def python_type(column_type: TypeEngine[Any]) -> type:
+    """Return column_type.python_type, falling back to the stored type, then object.
+
+    TypeDecorators such as DateTimeUTC do not implement python_type.
+    """
+    try:
+        return column_type.python_type
+    except NotImplementedError:
+        if isinstance(column_type, TypeDecorator):
+            return python_type(column_type.impl_instance)
+        return object
+
+
+def is_json(column_type: TypeEngine[Any]) -> bool:
+    """Return True for columns holding JSON documents, including CompressedJson."""
+    return isinstance(column_type, CompressedJson) or isinstance(stored_type(column_type), JSON)
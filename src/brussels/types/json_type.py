@@ -1,8 +1,156 @@
 from __future__ import annotations
 
-from typing import Final
+import json
+from dataclasses import dataclass
+from functools import cache
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Final
 
 from sqlalchemy import JSON
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.types import TypeDecorator
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from sqlalchemy.engine import Dialect
+    from sqlalchemy.types import TypeEngine
 
 Json: Final[JSON] = JSON().with_variant(JSONB(), "postgresql")
+
+JSON_CODEC_PREFERENCE: Final[tuple[str, ...]] = ("orjson", "msgspec", "json")
+
+
+@dataclass(frozen=True, slots=True)
+class JsonCodec:
+    """Pair of JSON serialize/deserialize functions; dumps must return str."""
+
+    name: str
+    dumps: Callable[[Any], str]
+    loads: Callable[[str | bytes], Any]
+
+
+def _stdlib_codec() -> JsonCodec:
+    return JsonCodec("json", json.dumps, json.loads)
+
+
+def _orjson_codec() -> JsonCodec:
+    orjson = import_module("orjson")
+
+    def dumps(value: Any) -> str:  # noqa: ANN401
+        return orjson.dumps(value).decode("utf-8")
+
+    return JsonCodec("orjson", dumps, orjson.loads)
+
+
+def _msgspec_codec() -> JsonCodec:
+    msgspec_json = import_module("msgspec.json")
+    encoder = msgspec_json.Encoder()
+    decoder = msgspec_json.Decoder()
+
+    def dumps(value: Any) -> str:  # noqa: ANN401
+        return encoder.encode(value).decode("utf-8")
+
+    return JsonCodec("msgspec", dumps, decoder.decode)
+
+
+_CODEC_FACTORIES: Final[dict[str, Callable[[], JsonCodec]]] = {
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+    "json": _stdlib_codec,
+}
+
+
+@cache
+def json_codec(name: str | None = None) -> JsonCodec:
+    """Return the named codec, or the fastest installed one when name is None.
+
+    Without a name, orjson is preferred, then msgspec, then the stdlib json
+    module. Asking for a codec whose package is not installed raises
+    ModuleNotFoundError.
+    """
+    if name is None:
+        for candidate in JSON_CODEC_PREFERENCE:
+            try:
+                return json_codec(candidate)
+            except ModuleNotFoundError:
+                continue
+    if name not in _CODEC_FACTORIES:
+        msg = f"Unknown JSON codec {name!r}; expected one of {', '.join(_CODEC_FACTORIES)}."
+        raise ValueError(msg)
+    return _CODEC_FACTORIES[name]()
+
+
+def _resolve_codec(codec: JsonCodec | str | None) -> JsonCodec:
+    if isinstance(codec, JsonCodec):
+        return codec
+    return json_codec(codec)
+
+
+def json_engine_options(codec: JsonCodec | str | None = None) -> dict[str, Any]:
+    """Return create_engine() keyword arguments that install codec engine-wide.
+
+    PostgreSQL drivers (psycopg, asyncpg, pg8000) decode JSON on the connection
+    rather than in the column type, so pass these to create_engine() for the
+    codec to apply to reads there as well:
+
+        engine = create_engine(url, **json_engine_options())
+    """
+    resolved = _resolve_codec(codec)
+    return {"json_serializer": resolved.dumps, "json_deserializer": resolved.loads}
+
+
+class _CodecDialect:
+    """Dialect view that substitutes a codec for the engine's JSON serializer."""
+
+    def __init__(self, dialect: Dialect, codec: JsonCodec) -> None:
+        self._dialect = dialect
+        self._json_serializer = codec.dumps
+        self._json_deserializer = codec.loads
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        return getattr(self._dialect, name)
+
+
+class CodecJson(TypeDecorator[Any]):
+    """JSON column (JSONB on PostgreSQL) serialized with a pluggable codec.
+
+    The codec replaces the stdlib json module in the bind and result processors
+    of every dialect that serializes JSON in the column type, including SQLite
+    and MySQL where the document is stored as text. Dialect specific behaviour
+    (JSON.NULL, none_as_null, SQLite numeric results, bind casts) is kept
+    because the dialect's own processors are reused with the codec swapped in.
+    See json_engine_options() for PostgreSQL reads.
+    """
+
+    impl = JSON
+    cache_ok = True
+
+    def __init__(self, codec: JsonCodec | str | None = None, *, none_as_null: bool = False) -> None:
+        super().__init__(none_as_null=none_as_null)
+        self.codec = _resolve_codec(codec)
+        self.none_as_null = none_as_null
+
+    def load_dialect_impl(self, dialect: Dialect) -> TypeEngine[Any]:
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(JSONB(none_as_null=self.none_as_null))
+        return dialect.type_descriptor(self.impl_instance)
+
+    def bind_processor(self, dialect: Dialect) -> Callable[[Any], Any] | None:
+        codec_dialect: Any = _CodecDialect(dialect, self.codec)
+        return self.impl_instance.bind_processor(codec_dialect)
+
+    def result_processor(self, dialect: Dialect, coltype: object) -> Callable[[Any], Any] | None:
+        codec_dialect: Any = _CodecDialect(dialect, self.codec)
+        return self.impl_instance.result_processor(codec_dialect, coltype)
+
+
+def json_type(codec: JsonCodec | str | None = None, *, none_as_null: bool = False) -> CodecJson:
+    """Build a Json column type that serializes with codec.
+
+    codec may be a JsonCodec, a codec name ("orjson", "msgspec", "json") or None
+    for the fastest installed codec:
+
+        payload: Mapped[dict[str, Any]] = mapped_column(json_type())
+    """
+    return CodecJson(codec, none_as_null=none_as_null)
@@ -0,0 +1,370 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Final, Self, SupportsIndex
+from weakref import WeakKeyDictionary, WeakSet
+
+from sqlalchemy import JSON, ColumnElement, Text, event, func, literal, true
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.ext.mutable import Mutable
+from sqlalchemy.orm import Mapper, attributes
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from sqlalchemy import Connection
+    from sqlalchemy.orm import InstanceState, QueryableAttribute
+
+PathElement = str | int
+JsonPath = tuple[PathElement, ...]
+
+MAX_PATH_UPDATES: Final[int] = 32
+_MISSING: Final[object] = object()
+
+# Mappers whose flushes compile path updates, and the documents swapped out for
+# an UPDATE expression until the row is written.
+_flush_mappers: WeakSet[Mapper[Any]] = WeakSet()
+_pending_restores: WeakKeyDictionary[InstanceState[Any], dict[str, TrackedJson]] = WeakKeyDictionary()
+
+
+class TrackedJson(Mutable):
+    """Base for JSON containers that record which nested paths changed.
+
+    Nested dicts and lists are wrapped in TrackedDict and TrackedList when
+    they are loaded or assigned (assigned values are copied), so a change at
+    any depth flags the owning attribute as modified and records the path of
+    the change on the root document. On flush, PostgreSQL and SQLite apply
+    only the recorded paths; see MutableJson.
+    """
+
+    _tracked_parent: TrackedJson | None = None
+    _tracked_key: PathElement | None = None
+    _changed_paths: list[JsonPath] | None = None
+
+    @classmethod
+    def coerce(cls, key: str, value: Any) -> Any:  # noqa: ANN401
+        if value is None or isinstance(value, TrackedJson):
+            return value
+        if isinstance(value, dict):
+            return TrackedDict(value)
+        if isinstance(value, list):
+            return TrackedList(value)
+        return super().coerce(key, value)
+
+    @classmethod
+    def _listen_on_attribute(cls, attribute: QueryableAttribute[Any], coerce: bool, parent_cls: Any) -> None:  # noqa: ANN401, FBT001
+        super()._listen_on_attribute(attribute, coerce, parent_cls)
+        if parent_cls is not attribute.class_:
+            return
+
+        # Assigning a whole document rewrites it; only in-place changes use paths.
+        def mark_replaced(_target: object, value: object, _oldvalue: object, _initiator: object) -> None:
+            if isinstance(value, TrackedJson):
+                value._add_path(())  # noqa: SLF001
+
+        event.listen(attribute, "set", mark_replaced, propagate=True)
+        _listen_on_flush(attribute.parent)  # type: ignore[arg-type]
+
+    @property
+    def changed_paths(self) -> tuple[JsonPath, ...]:
+        """Paths changed since the last flush; () as a path means the whole document."""
+        return tuple(self._changed_paths or ())
+
+    def _locate(self) -> tuple[TrackedJson, JsonPath] | None:
+        parts: list[PathElement] = []
+        node = self
+        while (parent := node._tracked_parent) is not None:  # noqa: SLF001
+            if isinstance(parent, dict):
+                key = node._tracked_key  # noqa: SLF001
+                if dict.get(parent, key) is not node:
+                    return None
+            else:
+                key = next((index for index, item in enumerate(parent) if item is node), None)
+                if key is None:
+                    return None
+            parts.append(key)  # type: ignore[arg-type]
+            node = parent
+        return node, tuple(reversed(parts))
+
+    def _record(self, *suffix: PathElement) -> None:
+        located = self._locate()
+        if located is None:
+            return
+        root, path = located
+        root._add_path(path + suffix)  # noqa: SLF001
+        root.changed()
+
+    def _add_path(self, path: JsonPath) -> None:
+        paths = self._changed_paths
+        if paths is None:
+            paths = self._changed_paths = []
+        if any(path[: len(recorded)] == recorded for recorded in paths):
+            return
+        paths[:] = [recorded for recorded in paths if recorded[: len(path)] != path]
+        paths.append(path)
+        if len(paths) > MAX_PATH_UPDATES:
+            paths[:] = [()]
+
+    def _take_paths(self) -> list[JsonPath]:
+        paths = self._changed_paths or []
+        self._changed_paths = None
+        return paths
+
+
+def _wrap(value: Any, parent: TrackedJson, key: PathElement | None) -> Any:  # noqa: ANN401
+    if isinstance(value, dict):
+        return TrackedDict(value, parent=parent, key=key)
+    if isinstance(value, list):
+        return TrackedList(value, parent=parent, key=key)
+    return value
+
+
+class TrackedDict(TrackedJson, dict[str, Any]):
+    def __init__(
+        self,
+        value: Any = (),  # noqa: ANN401
+        *,
+        parent: TrackedJson | None = None,
+        key: PathElement | None = None,
+    ) -> None:
+        dict.__init__(self, value)
+        for item_key, item in dict.items(self):
+            dict.__setitem__(self, item_key, _wrap(item, self, item_key))
+        self._tracked_parent = parent
+        self._tracked_key = key
+
+    def __reduce_ex__(self, _protocol: SupportsIndex) -> tuple[Any, ...]:
+        return (TrackedDict, (_plain(self),))
+
+    def __setitem__(self, key: str, value: Any) -> None:  # noqa: ANN401
+        dict.__setitem__(self, key, _wrap(value, self, key))
+        self._record(key)
+
+    def __delitem__(self, key: str) -> None:
+        dict.__delitem__(self, key)
+        self._record(key)
+
+    def __ior__(self, other: Any) -> Self:  # type: ignore[override]  # noqa: ANN401
+        self.update(other)
+        return self
+
+    def setdefault(self, key: str, default: Any = None) -> Any:  # noqa: ANN401
+        if key not in self:
+            self[key] = default
+        return dict.__getitem__(self, key)
+
+    def pop(self, key: str, *default: Any) -> Any:  # noqa: ANN401
+        present = key in self
+        value = dict.pop(self, key, *default)
+        if present:
+            self._record(key)
+        return value
+
+    def popitem(self) -> tuple[str, Any]:
+        key, value = dict.popitem(self)
+        self._record(key)
+        return key, value
+
+    def clear(self) -> None:
+        dict.clear(self)
+        self._record()
+
+    def update(self, *args: Any, **kwargs: Any) -> None:  # type: ignore[override]  # noqa: ANN401
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+
+class TrackedList(TrackedJson, list[Any]):
+    def __init__(
+        self,
+        value: Iterable[Any] = (),
+        *,
+        parent: TrackedJson | None = None,
+        key: PathElement | None = None,
+    ) -> None:
+        list.__init__(self, (_wrap(item, self, None) for item in value))
+        self._tracked_parent = parent
+        self._tracked_key = key
+
+    def __reduce_ex__(self, _protocol: SupportsIndex) -> tuple[Any, ...]:
+        return (TrackedList, (_plain(self),))
+
+    def __setitem__(self, index: SupportsIndex | slice, value: Any) -> None:  # noqa: ANN401
+        if isinstance(index, slice):
+            list.__setitem__(self, index, [_wrap(item, self, None) for item in value])
+            self._record()
+            return
+        list.__setitem__(self, index, _wrap(value, self, None))
+        position = index.__index__()
+        self._record(position if position >= 0 else len(self) + position)
+
+    def __delitem__(self, index: SupportsIndex | slice) -> None:
+        list.__delitem__(self, index)
+        self._record()
+
+    def __iadd__(self, other: Iterable[Any]) -> Self:  # type: ignore[override]
+        self.extend(other)
+        return self
+
+    def __imul__(self, count: SupportsIndex) -> Self:
+        items = list(self) * count.__index__()
+        list.clear(self)
+        list.extend(self, (_wrap(item, self, None) for item in items))
+        self._record()
+        return self
+
+    def append(self, value: Any) -> None:  # noqa: ANN401
+        list.append(self, _wrap(value, self, None))
+        # Writing one past the end appends on both PostgreSQL and SQLite.
+        self._record(len(self) - 1)
+
+    def extend(self, values: Iterable[Any]) -> None:
+        list.extend(self, [_wrap(item, self, None) for item in values])
+        self._record()
+
+    def insert(self, index: SupportsIndex, value: Any) -> None:  # noqa: ANN401
+        list.insert(self, index, _wrap(value, self, None))
+        self._record()
+
+    def pop(self, index: SupportsIndex = -1) -> Any:  # noqa: ANN401
+        value = list.pop(self, index)
+        self._record()
+        return value
+
+    def remove(self, value: Any) -> None:  # noqa: ANN401
+        list.remove(self, value)
+        self._record()
+
+    def clear(self) -> None:
+        list.clear(self)
+        self._record()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        list.sort(self, *args, **kwargs)
+        self._record()
+
+    def reverse(self) -> None:
+        list.reverse(self)
+        self._record()
+
+
+def _plain(value: Any) -> Any:  # noqa: ANN401
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    return value
+
+
+def _lookup(document: Any, path: JsonPath) -> Any:  # noqa: ANN401
+    node = document
+    for element in path:
+        if isinstance(node, dict) and isinstance(element, str):
+            node = dict.get(node, element, _MISSING)
+        elif isinstance(node, list) and isinstance(element, int) and element < len(node):
+            node = list.__getitem__(node, element)
+        else:
+            return _MISSING
+        if node is _MISSING:
+            return _MISSING
+    return node
+
+
+def _sqlite_path(path: JsonPath) -> str | None:
+    parts = ["$"]
+    for element in path:
+        if isinstance(element, int):
+            parts.append(f"[{element}]")
+        elif '"' in element:
+            # SQLite JSON paths cannot escape a double quote inside a quoted label.
+            return None
+        else:
+            parts.append(f'."{element}"')
+    return "".join(parts)
+
+
+def path_update_expression(
+    column: ColumnElement[Any],
+    document: Any,  # noqa: ANN401
+    paths: Iterable[JsonPath],
+    dialect_name: str,
+) -> ColumnElement[Any] | None:
+    """Build an expression that applies the current value at each path to column.
+
+    Returns None when the dialect has no path update functions (the caller
+    writes the whole document instead) or when a path covers the whole
+    document.
+    """
+    paths = list(paths)
+    if dialect_name not in ("postgresql", "sqlite") or not paths or () in paths:
+        return None
+
+    expression = column
+    for path in paths:
+        value = _lookup(document, path)
+        sqlite_path = _sqlite_path(path) if dialect_name == "sqlite" else None
+        if dialect_name == "postgresql":
+            pg_path = literal([str(element) for element in path], ARRAY(Text))
+            if value is _MISSING:
+                expression = expression.op("#-", return_type=column.type)(pg_path)
+            else:
+                new_value = literal(value, column.type)
+                expression = func.jsonb_set(expression, pg_path, new_value, true(), type_=column.type)
+        elif sqlite_path is None:
+            return None
+        elif value is _MISSING:
+            expression = func.json_remove(expression, sqlite_path, type_=column.type)
+        else:
+            json_value = func.json(literal(value, column.type))
+            expression = func.json_set(expression, sqlite_path, json_value, type_=column.type)
+    return expression
+
+
+def _listen_on_flush(mapper: Mapper[Any]) -> None:
+    # Only mappers with a tracked column pay for the flush hooks; propagate covers subclasses.
+    if any(ancestor in _flush_mappers for ancestor in mapper.iterate_to_root()):
+        return
+    event.listen(mapper, "before_insert", _discard_paths, propagate=True)
+    event.listen(mapper, "before_update", _compile_path_updates, propagate=True)
+    event.listen(mapper, "after_update", _restore_documents, propagate=True)
+    _flush_mappers.add(mapper)
+
+
+def _discard_paths(_mapper: Mapper[Any], _connection: Connection, target: object) -> None:
+    # Inserts write whole documents.
+    for document in attributes.instance_state(target).dict.values():
+        if isinstance(document, TrackedJson):
+            document._take_paths()  # noqa: SLF001
+
+
+def _compile_path_updates(mapper: Mapper[Any], connection: Connection, target: object) -> None:
+    state: InstanceState[Any] = attributes.instance_state(target)
+    restores: dict[str, TrackedJson] = {}
+    for key in list(state.committed_state):
+        document = state.dict.get(key)
+        if not isinstance(document, TrackedJson) or document._tracked_parent is not None:  # noqa: SLF001
+            continue
+        paths = document._take_paths()  # noqa: SLF001
+        column = mapper.attrs[key].columns[0]  # type: ignore[attr-defined]
+        expression = path_update_expression(column, document, paths, connection.dialect.name)
+        if expression is not None:
+            state.dict[key] = expression
+            restores[key] = document
+    if restores:
+        _pending_restores[state] = restores
+
+
+def _restore_documents(_mapper: Mapper[Any], _connection: Connection, target: object) -> None:
+    # The UPDATE expired the expression-valued attribute; the in-memory document
+    # already matches the row, so put it back instead of reloading it.
+    state: InstanceState[Any] = attributes.instance_state(target)
+    for key, document in _pending_restores.pop(state, {}).items():
+        if key not in state.dict:
+            attributes.set_committed_value(target, key, document)
+
+
+# Json with in-place change tracking. Flushing an in-place change sends
+# jsonb_set()/#- on PostgreSQL and json_set()/json_remove() on SQLite, with only
+# the changed values as parameters; other dialects, reassigned documents and
+# changes to more than MAX_PATH_UPDATES paths write the whole document. Use
+# TrackedJson.as_mutable(json_type(...)) to track a codec-backed column.
+MutableJson: Final = TrackedJson.as_mutable(JSON().with_variant(JSONB(), "postgresql"))
@@ -0,0 +1,246 @@
+"""Warm mapper configuration and the statement caches before serving traffic.
+
+SQLAlchemy configures mappers on first use and compiles each statement the
+first time it runs, so the first requests after a deploy pay for both.
+warm_up() does that work at startup:
+
+    engine = engine_from_preset(settings.database_url)
+    report = warm_up(Base, engine)
+    logger.info("warm-up took %.3fs", report.total_seconds)
+
+It runs configure_mappers(), checks out a connection (which also initializes
+the dialect), and then for every class mapped on base's registry runs the
+standard CRUD operations through a real Session: a get() by primary key, and
+flushes that INSERT an instance with every attribute without a default set,
+UPDATE all of those attributes and DELETE by primary key. Columns added by
+mixins are included, and flush events such as the mixins' own listeners run
+as usual. The get() is executed; the INSERT, UPDATE and DELETE are compiled
+into the ORM's caches but never sent to the database, and the transaction is
+rolled back. Warm-up is best effort: an operation that fails for a model,
+for instance because a validator rejects the placeholder values, is skipped,
+and the step's statement count shows what was warmed.
+
+Statements compiled by get() land in the engine's compiled cache, and flush
+statements in the per-mapper cache the unit of work uses, so the engine
+must not set compiled_cache=None. Use async_warm_up() for an AsyncEngine.
+"""
+
+import dataclasses
+import enum
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, suppress
+from datetime import date, datetime, time as time_of_day, timedelta
+from decimal import Decimal
+from typing import Any, Final
+from uuid import UUID
+
+from sqlalchemy import Column, Connection, Engine, Enum, Table, event
+from sqlalchemy.engine.interfaces import ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import (
+    ColumnProperty,
+    DeclarativeBase,
+    Mapper,
+    RelationshipProperty,
+    Session,
+    configure_mappers,
+    make_transient_to_detached,
+)
+
+from brussels.types.datetime_utc import EPOCH
+from brussels.types.introspection import is_json, python_type
+
+WARM_UP_OPTION: Final[str] = "brussels_warm_up"
+
+_SAMPLE_VALUES: Final[tuple[tuple[type, object], ...]] = (
+    (bool, False),
+    (int, 0),
+    (float, 0.0),
+    (Decimal, Decimal(0)),
+    (str, ""),
+    (bytes, b""),
+    (datetime, EPOCH),
+    (date, EPOCH.date()),
+    (time_of_day, time_of_day()),
+    (timedelta, timedelta()),
+    (UUID, UUID(int=0)),
+    (dict, {}),
+    (list, []),
+)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class WarmUpStep:
+    name: str
+    seconds: float
+    statements: int
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class WarmUpReport:
+    steps: tuple[WarmUpStep, ...]
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(step.seconds for step in self.steps)
+
+
+def _sample_value(column: Column[Any]) -> Any:  # noqa: ANN401
+    column_type = column.type
+    if isinstance(column_type, Enum) and column_type.enums:
+        return next(iter(column_type.enum_class)) if column_type.enum_class else column_type.enums[0]
+    if is_json(column_type):
+        return {}
+    value_type = python_type(column_type)
+    if issubclass(value_type, enum.Enum):
+        return next(iter(value_type))
+    return next((value for kind, value in _SAMPLE_VALUES if issubclass(value_type, kind)), None)
+
+
+def _column_samples(mapper: Mapper[Any]) -> dict[str, Any]:
+    table = mapper.local_table
+    samples: dict[str, Any] = {}
+    for prop in mapper.column_attrs:
+        column = prop.columns[0]
+        if not isinstance(column, Column) or column.table is not table:
+            continue
+        if column.default is None and column.server_default is None and column is not table.autoincrement_column:
+            samples[prop.key] = _sample_value(column)
+    return samples
+
+
+def _new_instance(mapper: Mapper[Any]) -> Any:  # noqa: ANN401
+    """Build an instance the way application code typically does."""
+    cls = mapper.class_
+    if not dataclasses.is_dataclass(cls):
+        instance = mapper.class_manager.new_instance()
+        for key, value in _column_samples(mapper).items():
+            setattr(instance, key, value)
+        return instance
+
+    arguments: dict[str, Any] = {}
+    for field in dataclasses.fields(cls):
+        if not field.init or field.default is not dataclasses.MISSING:
+            continue
+        if field.default_factory is not dataclasses.MISSING:
+            continue
+        prop = mapper.attrs.get(field.name)
+        if isinstance(prop, ColumnProperty):
+            arguments[field.name] = _sample_value(prop.columns[0])
+        elif isinstance(prop, RelationshipProperty) and prop.uselist:
+            arguments[field.name] = []
+        else:
+            arguments[field.name] = None
+    return cls(**arguments)
+
+
+def _crud_operations(mapper: Mapper[Any]) -> list[Callable[[Session], object]]:
+    template: dict[str, Any] = {}
+    with suppress(Exception):
+        template = vars(_new_instance(mapper))
+    identity = {}
+    for column in mapper.primary_key:
+        key = mapper.get_property_by_column(column).key
+        identity[key] = template[key] if template.get(key) is not None else _sample_value(column)
+    # Updates rewrite the attributes application code sets, not the defaulted ones.
+    changes = {key: value for key, value in _column_samples(mapper).items() if key not in identity}
+
+    def persistent(session: Session) -> Any:  # noqa: ANN401
+        instance = mapper.class_manager.new_instance()
+        for key, value in identity.items():
+            setattr(instance, key, value)
+        make_transient_to_detached(instance)
+        session.add(instance)
+        return instance
+
+    def get(session: Session) -> object:
+        return session.get(mapper, tuple(identity.values()))
+
+    def insert(session: Session) -> object:
+        session.add(_new_instance(mapper))
+        return session.flush()
+
+    def update(session: Session) -> object:
+        instance = persistent(session)
+        for key, value in changes.items():
+            setattr(instance, key, value)
+        return session.flush()
+
+    def delete(session: Session) -> object:
+        session.delete(persistent(session))
+        return session.flush()
+
+    return [get, insert, update, delete] if changes else [get, insert, delete]
+
+
+@contextmanager
+def _skip_dml(engine: Engine, counter: list[int]) -> Iterator[None]:
+    def execute(_cursor: object, _statement: str, _parameters: object, context: ExecutionContext) -> bool | None:
+        if not context.execution_options.get(WARM_UP_OPTION):
+            return None
+        counter[0] += 1
+        # Returning True tells the dialect the statement was executed.
+        return bool(context.isinsert or context.isupdate or context.isdelete) or None
+
+    def execute_no_params(cursor: object, statement: str, context: ExecutionContext) -> bool | None:
+        return execute(cursor, statement, None, context)
+
+    listeners: list[tuple[str, Callable[..., bool | None]]] = [
+        ("do_execute", execute),
+        ("do_executemany", execute),
+        ("do_execute_no_params", execute_no_params),
+    ]
+    for name, listener in listeners:
+        event.listen(engine, name, listener)
+    try:
+        yield
+    finally:
+        for name, listener in listeners:
+            event.remove(engine, name, listener)
+
+
+def _warm_models(base: type[DeclarativeBase], connection: Connection) -> list[WarmUpStep]:
+    connection.execution_options(**{WARM_UP_OPTION: True})
+    steps: list[WarmUpStep] = []
+    counter = [0]
+    mappers = sorted(base.registry.mappers, key=lambda mapper: mapper.class_.__qualname__)
+    with _skip_dml(connection.engine, counter):
+        for mapper in mappers:
+            if not isinstance(mapper.local_table, Table):
+                continue
+            started = time.perf_counter()
+            counter[0] = 0
+            for operation in _crud_operations(mapper):
+                with Session(bind=connection, autoflush=False) as session, suppress(Exception):
+                    operation(session)
+                if connection.in_transaction():
+                    connection.rollback()
+            steps.append(WarmUpStep(mapper.class_.__qualname__, time.perf_counter() - started, counter[0]))
+    return steps
+
+
+def _timed(name: str, step: Callable[[], object]) -> WarmUpStep:
+    started = time.perf_counter()
+    step()
+    return WarmUpStep(name, time.perf_counter() - started, 0)
+
+
+def warm_up(base: type[DeclarativeBase], engine: Engine) -> WarmUpReport:
+    """Configure mappers and compile the CRUD statements of base's models; see the module docstring."""
+    steps = [_timed("configure_mappers", configure_mappers)]
+    started = time.perf_counter()
+    with engine.connect() as connection:
+        steps.append(WarmUpStep("connect", time.perf_counter() - started, 0))
+        steps.extend(_warm_models(base, connection))
+    return WarmUpReport(tuple(steps))
+
+
+async def async_warm_up(base: type[DeclarativeBase], engine: AsyncEngine) -> WarmUpReport:
+    """Run warm_up() for an AsyncEngine."""
+    steps = [_timed("configure_mappers", configure_mappers)]
+    started = time.perf_counter()
+    async with engine.connect() as connection:
+        steps.append(WarmUpStep("connect", time.perf_counter() - started, 0))
+        steps.extend(await connection.run_sync(lambda sync_connection: _warm_models(base, sync_connection)))
+    return WarmUpReport(tuple(steps))